@@ -0,0 +1,85 @@
+"""Benchmark batched feature encoding of positions.
+
+Run from the repository root:
+
+    python -m benchmarks.board_batch [positions]
+
+Positions are sampled from seeded GreedyBot self-play and saved as Board
+states. The script encodes them into checker counts, one-hot units, pip
+counts and blot masks with a Python loop per position, then with one
+BoardBatch, and reports the positions encoded per second both ways.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.search_stats import sample_searches
+from core.board import Board
+from core.board_batch import BoardBatch
+
+
+def encode_one(board, player):
+    """Encode one Board position with plain Python loops.
+
+    Args:
+        board (Board): Position to encode
+        player (int): Side to move
+
+    Returns:
+        tuple: (counts, one-hot units, pip counts, blots) for player and
+            the opponent
+    """
+    points = board.__points__ if player == 1 else board.__points__[::-1]
+    counts = [[0] * 26, [0] * 26]
+    for index, pieces in enumerate(points):
+        if pieces:
+            counts[0 if pieces[0] == player else 1][index] = len(pieces)
+    for side, owner in enumerate((player, 3 - player)):
+        counts[side][24] = len(board.__checker_bar__[1 if owner == 1 else 0])
+        counts[side][25] = 15 - sum(counts[side][:25])
+    units = [
+        [min(count, 4) == unit for count in side[:25] for unit in range(1, 5)]
+        for side in counts
+    ]
+    pips = [board.get_pip_count(player), board.get_pip_count(3 - player)]
+    blots = [[count == 1 for count in side[:24]] for side in counts]
+    return counts, units, pips, blots
+
+
+def main():
+    """Run the benchmark and print the encoding rates.
+
+    Returns:
+        None
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    samples = sample_searches(count)
+    boards = []
+    for compact, _, _ in samples:
+        board = Board()
+        board.set_board_state(compact.get_board_state())
+        boards.append(board)
+    players = [player for _, player, _ in samples]
+    print(f"{count} positions")
+
+    start = time.perf_counter()
+    features = [encode_one(board, player) for board, player in zip(boards, players)]
+    np.array([counts for counts, _, _, _ in features], dtype=np.int8)
+    looped = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = BoardBatch.from_boards(boards, players)
+    batch.raw_counts()
+    batch.one_hot()
+    batch.pip_counts()
+    batch.blot_masks()
+    batched = time.perf_counter() - start
+
+    for name, elapsed in (("per position", looped), ("BoardBatch", batched)):
+        print(f"  {name:<13} {count / elapsed:10.0f} positions/s")
+
+
+if __name__ == "__main__":
+    main()
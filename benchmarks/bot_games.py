@@ -0,0 +1,38 @@
+"""Benchmark headless GreedyBot self-play.
+
+Run from the repository root:
+
+    python -m benchmarks.bot_games [games]
+
+Plays seeded GreedyBot-versus-GreedyBot games on a CompactBoard and reports
+games per minute on one core, with the distribution of results.
+"""
+
+import random
+import sys
+import time
+from collections import Counter
+
+from core.bot import GreedyBot, play_game
+from core.dice import Dice
+
+
+def main():
+    """Run the benchmark and print the throughput.
+
+    Returns:
+        None
+    """
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    bot = GreedyBot()
+    dice = Dice(random.Random(2024))
+    start = time.perf_counter()
+    results = Counter(play_game((bot, bot), dice=dice) for _ in range(games))
+    elapsed = time.perf_counter() - start
+    print(f"{games} games in {elapsed:.1f} s: {games * 60 / elapsed:.0f} games/minute")
+    for (winner, points), count in sorted(results.items()):
+        print(f"  player {winner} wins {points} point(s): {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark the has_valid_moves legality probe.
+
+Run from the repository root:
+
+    python -m benchmarks.has_valid_moves [positions]
+
+Positions are sampled from seeded random games. For each one the script
+times the previous per-point scan (get_possible_destinations on all 24
+points), building the full move list, and the early-exit has_any_move probe.
+"""
+
+import random
+import sys
+import timeit
+
+from core.backgammon import BackgammonGame
+from core.board import Board
+from core.move_generator import dice_for_roll
+
+
+def sample_positions(count, seed=1):
+    """Collect (board, player, dice) samples from random play.
+
+    Args:
+        count (int): Number of samples
+        seed (int, optional): Random seed. Defaults to 1.
+
+    Returns:
+        list: Tuples of (Board, player, dice values)
+    """
+    rng = random.Random(seed)
+    samples = []
+    board = Board()
+    board.setup_initial_position()
+    player = 1
+    while len(samples) < count:
+        dice = dice_for_roll((rng.randint(1, 6), rng.randint(1, 6)))
+        samples.append((board.copy(), player, dice))
+        moves = board.get_possible_moves(player, dice)
+        if moves:
+            board.apply(rng.choice(moves), player)
+        if board.is_game_over():
+            board = Board()
+            board.setup_initial_position()
+        player = 3 - player
+    return samples
+
+
+def point_scan(game, board, player, dice):
+    """Answer the probe as the previous implementation did.
+
+    Args:
+        game (BackgammonGame): Game whose state is overwritten
+        board (Board): Position to probe
+        player (int): Player number (1 or 2)
+        dice (list): Dice values
+
+    Returns:
+        bool: True if a regular or bar move exists
+    """
+    game.__board__ = board
+    game.__current_player__ = game.__player1__ if player == 1 else game.__player2__
+    game.__available_moves__ = dice
+    if game.must_enter_from_bar():
+        return game.can_enter_from_bar(player)
+    return any(game.get_possible_destinations(point) for point in range(24))
+
+
+def main():
+    """Run the benchmark and print timings per probe.
+
+    Returns:
+        None
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    samples = sample_positions(count)
+    game = BackgammonGame()
+    variants = {
+        "per-point scan": lambda: [point_scan(game, *sample) for sample in samples],
+        "full move list": lambda: [
+            bool(board.get_possible_moves(player, dice))
+            for board, player, dice in samples
+        ],
+        "has_any_move": lambda: [
+            board.has_any_move(player, dice) for board, player, dice in samples
+        ],
+    }
+    for name, run in variants.items():
+        seconds = min(timeit.repeat(run, number=1, repeat=5))
+        print(f"{name:>15}: {seconds / count * 1e6:6.2f} us per probe")
+
+
+if __name__ == "__main__":
+    main()
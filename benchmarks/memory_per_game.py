@@ -0,0 +1,50 @@
+"""Measure the resident memory of live BackgammonGame sessions.
+
+Run from the repository root:
+
+    python -m benchmarks.memory_per_game [games]
+
+The script keeps the requested number of games alive, each set up in the
+initial position, and reports the traced allocation per game.
+"""
+
+import sys
+import tracemalloc
+
+from core.backgammon import BackgammonGame
+
+
+def measure(games):
+    """Measure the average traced memory of live games.
+
+    Args:
+        games (int): Number of games to keep alive
+
+    Returns:
+        float: Average bytes allocated per game
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    live = []
+    for _ in range(games):
+        game = BackgammonGame()
+        game.setup_initial_position()
+        live.append(game)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return total / games
+
+
+def main():
+    """Run the benchmark and print the result.
+
+    Returns:
+        None
+    """
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    print(f"{games} live games: {measure(games):.0f} bytes per game")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmark batched neural network evaluation of candidate plays.
+
+Run from the repository root:
+
+    python -m benchmarks.neural_batch [positions]
+
+Positions and rolls are sampled from seeded GreedyBot self-play. The legal
+plays of each roll are scored by a NeuralEvaluator in one batch, then one
+position at a time through the Evaluator base class, and the script reports
+the plays evaluated per second both ways.
+"""
+
+import sys
+import time
+
+from benchmarks.search_stats import sample_searches
+from core.evaluator import Evaluator
+from core.move_generator import generate_plays
+from core.neural_evaluator import NeuralEvaluator
+
+
+def main():
+    """Run the benchmark and print the evaluation rates.
+
+    Returns:
+        None
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    evaluator = NeuralEvaluator(seed=1)
+    samples = [
+        (board, player, generate_plays(board, player, roll))
+        for board, player, roll in sample_searches(count)
+    ]
+    plays = sum(len(candidates) for _, _, candidates in samples)
+    print(f"{count} rolls, {plays} candidate plays")
+    for name, evaluate in (
+        ("batched", evaluator.evaluate_plays),
+        ("one at a time", lambda *args: Evaluator.evaluate_plays(evaluator, *args)),
+    ):
+        start = time.perf_counter()
+        for board, player, candidates in samples:
+            evaluate(board, player, candidates)
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<14} {plays / elapsed:8.0f} plays/s")
+
+
+if __name__ == "__main__":
+    main()
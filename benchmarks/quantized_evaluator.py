@@ -0,0 +1,160 @@
+"""Report the accuracy and speed of quantized against float evaluation.
+
+Run from the repository root:
+
+    python -m benchmarks.quantized_evaluator [weights.npz] [positions]
+
+The weights default to the training checkpoint in data/ if there is one,
+and to seeded random weights otherwise. The position suite is the rolls
+sampled from seeded GreedyBot self-play, with every legal play of each.
+The report gives the equity error of the quantized network over all plays,
+how often it picks the same play and the equity its different picks lose
+by the float network's measure, then the positions per second of the
+networks alone on the whole suite in one batch and the plays per second of
+evaluate_plays one roll at a time, and the size of each weights file.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.search_stats import sample_searches
+from core.move_generator import generate_plays
+from core.neural_evaluator import NeuralEvaluator
+from core.quantized_evaluator import QuantizedEvaluator, write_quantized
+from core.training import DEFAULT_CHECKPOINT
+
+
+def rate(evaluate, items, count, repeats=3):
+    """Measure the best rate of a function over several runs.
+
+    Args:
+        evaluate: Function called with each item
+        items (list): Arguments of each call, as tuples
+        count (int): Units processed by one run over the items
+        repeats (int, optional): Runs to take the best of. Defaults to 3.
+
+    Returns:
+        float: Units per second of the fastest run
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for item in items:
+            evaluate(*item)
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def accuracy(network, quantized, samples):
+    """Compare the equities and picks of the two evaluators.
+
+    Args:
+        network (NeuralEvaluator): Float evaluator
+        quantized (QuantizedEvaluator): Quantized evaluator
+        samples (list): (board, player, plays) of each roll
+
+    Returns:
+        tuple: (mean error, max error, same pick rate, mean equity lost)
+    """
+    errors = []
+    same = 0
+    lost = 0.0
+    for board, player, plays in samples:
+        exact = np.array(network.evaluate_plays(board, player, plays))
+        approximate = np.array(quantized.evaluate_plays(board, player, plays))
+        errors.extend(np.abs(exact - approximate).tolist())
+        pick = int(np.argmax(approximate))
+        same += pick == int(np.argmax(exact))
+        lost += float(exact.max() - exact[pick])
+    return np.mean(errors), np.max(errors), same / len(samples), lost / len(samples)
+
+
+def network_batches(samples):
+    """Collect the positions after every play of the suite, per player.
+
+    Args:
+        samples (list): (board, player, plays) of each roll
+
+    Returns:
+        list: (cells, player) batches taken by evaluate_cells
+    """
+    cells = {player: [] for player in (1, 2)}
+    for board, player, candidates in samples:
+        for play in candidates:
+            tokens = [board.apply(move, player) for move in play]
+            cells[player].append(bytes(board.__cells__))
+            for token in reversed(tokens):
+                board.revert(token)
+    return [
+        (np.frombuffer(b"".join(rows), dtype=np.int8), player)
+        for player, rows in cells.items()
+    ]
+
+
+def speed(network, quantized, samples, sizes):
+    """Print the rates and file sizes of the two evaluators.
+
+    Args:
+        network (NeuralEvaluator): Float evaluator
+        quantized (QuantizedEvaluator): Quantized evaluator
+        samples (list): (board, player, plays) of each roll
+        sizes (tuple): Bytes of the float and quantized weights files
+
+    Returns:
+        None
+    """
+    plays = sum(len(candidates) for _, _, candidates in samples)
+    batches = network_batches(samples)
+    print(f"  {'':<10} {'network pos/s':>14} {'plays/s':>10} {'file bytes':>11}")
+    for name, evaluator, size in zip(("float64", "int8"), (network, quantized), sizes):
+        network_rate = rate(evaluator.evaluate_cells, batches, plays)
+        play_rate = rate(evaluator.evaluate_plays, samples, plays)
+        print(f"  {name:<10} {network_rate:14.0f} {play_rate:10.0f} {size:11d}")
+
+
+def main():
+    """Run the comparison and print the report.
+
+    Returns:
+        None
+    """
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CHECKPOINT
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    if os.path.exists(path):
+        network = NeuralEvaluator.load(path)
+    else:
+        path = "random weights"
+        network = NeuralEvaluator(seed=1)
+    samples = [
+        (board, player, generate_plays(board, player, roll))
+        for board, player, roll in sample_searches(count)
+    ]
+    samples = [sample for sample in samples if len(sample[2]) > 1]
+    directory = tempfile.mkdtemp()
+    try:
+        weights_path = os.path.join(directory, "weights.npz")
+        network.save(weights_path)
+        quantized_path = os.path.join(directory, "weights.bin")
+        sizes = (
+            os.path.getsize(weights_path),
+            write_quantized(network, quantized_path),
+        )
+        quantized = QuantizedEvaluator(quantized_path)
+        plays = sum(len(candidates) for _, _, candidates in samples)
+        print(f"{path}: {len(samples)} rolls with a choice, {plays} plays")
+
+        mean_error, max_error, same, lost = accuracy(network, quantized, samples)
+        print(f"  equity error      mean {mean_error:.5f}  max {max_error:.5f}")
+        print(f"  same play         {same:.1%} of rolls, {lost:.5f} equity lost/roll")
+        speed(network, quantized, samples, sizes)
+        quantized.close()
+    finally:
+        shutil.rmtree(directory)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark rollout throughput against the number of worker processes.
+
+Run from the repository root:
+
+    python -m benchmarks.rollout_scaling [trials]
+
+Rolls out the initial position with GreedyBot on 1, 2, 4, ... workers up to
+the number of CPUs and reports games per second with the speedup over one
+worker. The seeded results must be identical for every worker count.
+"""
+
+import os
+import sys
+
+from core.compact_board import CompactBoard
+from core.rollout import RolloutEngine
+
+
+def main():
+    """Run the benchmark and print the throughput per worker count.
+
+    Returns:
+        None
+    """
+    trials = int(sys.argv[1]) if len(sys.argv) > 1 else 720
+    board = CompactBoard()
+    board.setup_initial_position()
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+
+    baseline = None
+    for workers in counts:
+        stats = RolloutEngine(workers=workers).rollout(board, trials=trials, seed=1)
+        baseline = baseline or stats["games_per_second"]
+        print(
+            f"{workers:>3} worker(s): {stats['games_per_second']:7.1f} games/s, "
+            f"speedup {stats['games_per_second'] / baseline:4.2f}, "
+            f"equity {stats['equity']:+.3f} +/- {stats['std_error']:.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark the variance reductions of rollouts.
+
+Run from the repository root:
+
+    python -m benchmarks.rollout_variance [repeats] [trials] [target] [position]
+
+Rolls out a position repeatedly with different seeds, plainly and with each
+combination of rotated dice and luck adjustment. The spread of the repeated
+equities gives the standard error each mode actually reaches, from which the
+script reports the trials and the seconds needed to bring the standard error
+down to the target (0.01 by default). The position is an even 60-pip race by
+default, or "opening" for the initial position; luck-adjusted games from the
+opening take about a second each.
+"""
+
+import statistics
+import sys
+
+from core.compact_board import CompactBoard
+from core.rollout import RolloutEngine
+
+# Even race without contact, player 1 on roll
+RACE = {18: 3, 19: 3, 20: 3, 21: 3, 22: 3, 5: -3, 4: -3, 3: -3, 2: -3, 1: -3}
+
+MODES = ((), ("rotated",), ("luck",), ("rotated", "luck"))
+
+
+def benchmark_board(position):
+    """Build the benchmark position.
+
+    Args:
+        position (str): "race" or "opening"
+
+    Returns:
+        CompactBoard: The RACE position or the initial position
+    """
+    board = CompactBoard()
+    if position == "opening":
+        board.setup_initial_position()
+        return board
+    for point, count in RACE.items():
+        board.__cells__[point] = count
+    board.refresh_incremental_state()
+    return board
+
+
+def main():
+    """Run the benchmark and print the trials to target per mode.
+
+    Returns:
+        None
+    """
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    trials = int(sys.argv[2]) if len(sys.argv) > 2 else 72
+    target = float(sys.argv[3]) if len(sys.argv) > 3 else 0.01
+    position = sys.argv[4] if len(sys.argv) > 4 else "race"
+    board = benchmark_board(position)
+    print(
+        f"{position}: {repeats} rollouts of {trials} trials per mode, "
+        f"target {target}"
+    )
+    baseline = None
+    for mode in MODES:
+        engine = RolloutEngine(workers=1, variance_reduction=mode)
+        runs = [engine.rollout(board, trials=trials, seed=s) for s in range(repeats)]
+        spread = statistics.stdev(run["equity"] for run in runs)
+        rate = sum(run["trials"] for run in runs) / sum(run["elapsed"] for run in runs)
+        needed = trials * (spread / target) ** 2
+        baseline = needed if baseline is None else baseline
+        print(
+            f"  {' + '.join(mode) or 'plain':<15} equity "
+            f"{statistics.fmean(run['equity'] for run in runs):+.3f}, "
+            f"std error {spread:.4f}: {needed:.0f} trials "
+            f"({needed / baseline:.0%} of plain), {needed / rate:.0f} s to target"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark expectiminimax search latency and pruning.
+
+Run from the repository root:
+
+    python -m benchmarks.search_stats [positions] [plies]
+
+Positions are sampled from seeded GreedyBot self-play. Each one is searched
+at the given depth (2 plies by default); the script reports the latency per
+search with the node rate, the pruning counters and the transposition table
+hit rate.
+"""
+
+import random
+import sys
+import time
+
+from core.bot import GreedyBot
+from core.compact_board import CompactBoard
+from core.evaluator import game_result
+from core.search import ExpectiminimaxSearch
+
+
+def sample_searches(count, seed=3):
+    """Collect (board, player, roll) samples from greedy self-play.
+
+    Args:
+        count (int): Number of samples
+        seed (int, optional): Random seed. Defaults to 3.
+
+    Returns:
+        list: Tuples of (CompactBoard, player, roll)
+    """
+    rng = random.Random(seed)
+    bot = GreedyBot()
+    samples = []
+    board = CompactBoard()
+    board.setup_initial_position()
+    player = 1
+    while len(samples) < count:
+        roll = (rng.randint(1, 6), rng.randint(1, 6))
+        if rng.random() < 0.25:
+            samples.append((board.copy(), player, roll))
+        for move in bot.choose_play(board, player, roll):
+            board.apply(move, player)
+        if game_result(board) is not None:
+            board = CompactBoard()
+            board.setup_initial_position()
+        player = 3 - player
+    return samples
+
+
+def main():
+    """Run the benchmark and print the search statistics.
+
+    Returns:
+        None
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    plies = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    search = ExpectiminimaxSearch(plies=plies)
+    latencies = []
+    for board, player, roll in sample_searches(count):
+        start = time.perf_counter()
+        search.search(board, player, roll)
+        latencies.append(time.perf_counter() - start)
+
+    stats = search.get_stats()
+    latencies.sort()
+    print(f"{count} searches at {plies} plies")
+    print(
+        f"  latency: mean {sum(latencies) / count * 1e3:.0f} ms, "
+        f"median {latencies[count // 2] * 1e3:.0f} ms, "
+        f"max {latencies[-1] * 1e3:.0f} ms"
+    )
+    print(f"  nodes: {stats['nodes']} at {stats['nodes_per_second']:.0f} nodes/s")
+    print(
+        f"  chance nodes: {stats['chance_nodes']}, "
+        f"Star1 cutoffs {stats['star1_cutoffs']}, "
+        f"Star2 cutoffs {stats['star2_cutoffs']}, "
+        f"max cutoffs {stats['max_cutoffs']}"
+    )
+    print(f"  rolls pruned: {stats['prune_rate']:.1%}")
+    table = search.get_transposition_table().get_stats()
+    print(
+        f"  transposition table: {table['hit_rate']:.1%} hits, "
+        f"{table['entries']} of {table['capacity']} entries "
+        f"({table['size_mb']:.0f} MB)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -72,6 +72,7 @@ class BackgammonCLI:
             "bearoff": self._cmd_bearoff,
             "e": self._cmd_end_turn,
             "end": self._cmd_end_turn,
+            "bot": self._cmd_bot,
         }
 
         for cmd, handler in commands.items():
@@ -168,6 +169,9 @@ class BackgammonCLI:
         self.__user_interface__.display_message(
             "  end (e)       - End current player's turn"
         )
+        self.__user_interface__.display_message(
+            "  bot           - Let the computer play this turn"
+        )
         self.__user_interface__.display_message("  quit (q)      - Exit the game")
         self.__user_interface__.display_separator()
 
@@ -467,6 +471,58 @@ class BackgammonCLI:
         new_player = self.__game_controller__.get_current_player()
         self.__user_interface__.display_new_turn(new_player)
 
+    def _cmd_bot(self) -> None:
+        """Handle bot command.
+
+        Returns:
+            None
+        """
+        if self.__game_controller__.is_game_over():
+            self._check_game_over()
+            return
+
+        game_state = self.__game_controller__.get_game_state()
+        if game_state["last_roll"] is None:
+            roll = self.__game_controller__.roll_dice()
+            self.__user_interface__.display_message(
+                f"\n[DICE] Rolled: {roll[0]} and {roll[1]}"
+            )
+
+        play = self.__game_controller__.play_bot_turn()
+        if play is None:
+            self.__user_interface__.display_error(
+                "The bot can only play a turn whose dice are all unused."
+            )
+            return
+
+        if play:
+            self.__user_interface__.display_info(
+                f"Bot played: {self._format_play(play)}"
+            )
+        else:
+            self.__user_interface__.display_info("Bot has no legal moves.")
+        self.render_board()
+        self._check_game_over()
+
+        if not self.__game_controller__.is_game_over():
+            new_player = self.__game_controller__.get_current_player()
+            self.__user_interface__.display_new_turn(new_player)
+
+    @staticmethod
+    def _format_play(play) -> str:
+        """Format a play with 1-based point numbers.
+
+        Args:
+            play: Sequence of (from, to, die) moves
+
+        Returns:
+            str: Moves such as "13/7, bar/22, 3/off"
+        """
+        return ", ".join(
+            "/".join(str(p + 1) if isinstance(p, int) else p for p in move[:2])
+            for move in play
+        )
+
 
 def run_cli() -> None:
     """Convenience function to run the CLI.
@@ -6,6 +6,11 @@ the Single Responsibility Principle.
 
 from typing import TYPE_CHECKING
 
+from core.bearoff import default_databases
+from core.bot import GreedyBot
+from core.evaluator import HeuristicEvaluator
+from core.opening_book import default_books
+
 if TYPE_CHECKING:
     from core import BackgammonGame
 
@@ -24,6 +29,9 @@ class GameController:
             game: The BackgammonGame instance to control
         """
         self.__game__ = game
+        self.__bot__ = GreedyBot(
+            HeuristicEvaluator(bearoff=default_databases()), book=default_books()
+        )
 
     def roll_dice(self) -> tuple[int, int]:
         """Roll dice for the current player.
@@ -67,6 +75,15 @@ class GameController:
         """
         return self.__game__.bear_off_checker(point)
 
+    def play_bot_turn(self) -> tuple | None:
+        """Let the computer play the current player's turn.
+
+        Returns:
+            The play made (empty if no move was possible), or None if the
+            turn could not be played
+        """
+        return self.__bot__.play_turn(self.__game__)
+
     def end_turn(self) -> None:
         """End the current player's turn."""
         self.__game__.__last_roll__ = None
@@ -3,10 +3,20 @@ This module contains the main BackgammonGame class that orchestrates
 the entire Backgammon game, managing players, board, dice, and game logic.
 """
 
+# pylint: disable=too-many-lines  # single facade over the whole game engine
 from .player import Player
 from .board import Board
 from .dice import Dice
 from .checker import Checker
+from .checker_registry import CheckerRegistry
+from .compact_board import CompactBoard
+from .move_cache import MoveCache
+from .move_generator import generate_plays
+from .move_tables import (
+    BEAR_OFF_DISTANCE,
+    destination,
+    entry_point as table_entry_point,
+)
 
 
 class BackgammonGame:
@@ -14,15 +24,23 @@ class BackgammonGame:
     Note: This class holds core game state and therefore carries several
     instance attributes by design. The attribute count is justified by the
     domain model (players, board, dice, history, etc.).
+
+    The Checker objects are indexed by location. The *_checker_object
+    methods keep that index current; after moving Checker objects directly,
+    call refresh_checker_index, or the get_checkers_* queries answer from the
+    old locations. CheckerRegistry.DEBUG_SELF_CHECK turns such stale queries
+    into errors.
     """
 
     # pylint: disable=too-many-instance-attributes
-    def __init__(self, player1=None, player2=None):
+    def __init__(self, player1=None, player2=None, move_cache=None):
         """Initialize a new backgammon game.
 
         Args:
             player1 (Player, optional): First player. Defaults to None.
             player2 (Player, optional): Second player. Defaults to None.
+            move_cache (MoveCache, optional): Move generation cache, which may
+                be shared between games. Defaults to a new MoveCache.
 
         Returns:
             None
@@ -43,10 +61,17 @@ class BackgammonGame:
         self.__last_roll__ = None
         self.__available_moves__ = []
         self.__move_history__ = []
+        self.__move_cache__ = MoveCache() if move_cache is None else move_cache
 
         # Initialize checker objects for each player
         self.__player1_checkers__ = [Checker("white") for _ in range(15)]
         self.__player2_checkers__ = [Checker("black") for _ in range(15)]
+        # Location index per player, kept in sync by the *_checker_object methods
+        self.__checker_registries__ = (
+            None,
+            CheckerRegistry(self.__player1_checkers__),
+            CheckerRegistry(self.__player2_checkers__),
+        )
 
     def setup_initial_position(self):
         """Set up the initial board position using Checker objects.
@@ -99,6 +124,21 @@ class BackgammonGame:
         for _i in range(5):
             self.__player2_checkers__[checker_index].place_on_point(6)
             checker_index += 1
+        self.refresh_checker_index()
+
+    def refresh_checker_index(self):
+        """Index the checker objects again from their current locations.
+
+        The *_checker_object methods keep the index up to date. Moving a
+        Checker object through its own methods (place_on_point, send_to_bar,
+        bear_off, ...) does not; call this afterwards, before any
+        get_checkers_* query or *_checker_object move.
+
+        Returns:
+            None
+        """
+        self.__checker_registries__[1].rebuild()
+        self.__checker_registries__[2].rebuild()
 
     def get_checkers_at_point(self, point, player_num):
         """Get all checker objects at a specific point for a player.
@@ -110,16 +150,8 @@ class BackgammonGame:
         Returns:
             list: List of Checker objects at the specified point
         """
-        checkers = []
-        if player_num == 1:
-            for checker in self.__player1_checkers__:
-                if checker.__position__ == point + 1:  # Convert 0-based to 1-based
-                    checkers.append(checker)
-        else:
-            for checker in self.__player2_checkers__:
-                if checker.__position__ == point + 1:  # Convert 0-based to 1-based
-                    checkers.append(checker)
-        return checkers
+        # Checkers use 1-based point numbers
+        return self.__checker_registries__[player_num].get_checkers(point + 1)
 
     def get_checkers_on_bar(self, player_num):
         """Get all checker objects on the bar for a player.
@@ -130,16 +162,7 @@ class BackgammonGame:
         Returns:
             list: List of Checker objects on the bar
         """
-        checkers = []
-        if player_num == 1:
-            for checker in self.__player1_checkers__:
-                if checker.__is_on_bar__:
-                    checkers.append(checker)
-        else:
-            for checker in self.__player2_checkers__:
-                if checker.__is_on_bar__:
-                    checkers.append(checker)
-        return checkers
+        return self.__checker_registries__[player_num].get_checkers("bar")
 
     def get_borne_off_checkers(self, player_num):
         """Get all checker objects that have been borne off for a player.
@@ -150,16 +173,23 @@ class BackgammonGame:
         Returns:
             list: List of Checker objects that have been borne off
         """
-        checkers = []
-        if player_num == 1:
-            for checker in self.__player1_checkers__:
-                if checker.__is_borne_off__:
-                    checkers.append(checker)
-        else:
-            for checker in self.__player2_checkers__:
-                if checker.__is_borne_off__:
-                    checkers.append(checker)
-        return checkers
+        return self.__checker_registries__[player_num].get_checkers("off")
+
+    def _capture_checker_object(self, to_point, player_num):
+        """Send a lone opponent checker object on a point to the bar.
+
+        Args:
+            to_point (int): Point index (0-23) being moved to
+            player_num (int): Number of the moving player (1 or 2)
+
+        Returns:
+            None
+        """
+        opponent_registry = self.__checker_registries__[3 - player_num]
+        if opponent_registry.count(to_point + 1) == 1:
+            captured = opponent_registry.first_checker(to_point + 1)
+            captured.send_to_bar()
+            opponent_registry.relocate(captured, to_point + 1)
 
     def move_checker_object(self, from_point, to_point, player_num):
         """Move a checker object from one point to another.
@@ -172,23 +202,14 @@ class BackgammonGame:
         Returns:
             bool: True if the move was successful, False otherwise
         """
-        checkers_at_point = self.get_checkers_at_point(from_point, player_num)
-        if not checkers_at_point:
+        registry = self.__checker_registries__[player_num]
+        checker = registry.first_checker(from_point + 1)
+        if checker is None:
             return False
 
-        checker = checkers_at_point[0]  # Move the first checker
-
-        # Check if there's an opponent checker to capture
-        opponent_num = 2 if player_num == 1 else 1
-        opponent_checkers = self.get_checkers_at_point(to_point, opponent_num)
-
-        if len(opponent_checkers) == 1:
-            # Capture the opponent checker
-            opponent_checker = opponent_checkers[0]
-            opponent_checker.send_to_bar()
-
-        # Move our checker
+        self._capture_checker_object(to_point, player_num)
         checker.move_to_point(to_point + 1)  # Convert 0-based to 1-based
+        registry.relocate(checker, from_point + 1)
         return True
 
     def move_checker_from_bar_object(self, to_point, player_num):
@@ -201,23 +222,14 @@ class BackgammonGame:
         Returns:
             bool: True if the move was successful, False otherwise
         """
-        checkers_on_bar = self.get_checkers_on_bar(player_num)
-        if not checkers_on_bar:
+        registry = self.__checker_registries__[player_num]
+        checker = registry.first_checker("bar")
+        if checker is None:
             return False
 
-        checker = checkers_on_bar[0]  # Move the first checker from bar
-
-        # Check if there's an opponent checker to capture
-        opponent_num = 2 if player_num == 1 else 1
-        opponent_checkers = self.get_checkers_at_point(to_point, opponent_num)
-
-        if len(opponent_checkers) == 1:
-            # Capture the opponent checker
-            opponent_checker = opponent_checkers[0]
-            opponent_checker.send_to_bar()
-
-        # Return checker from bar
+        self._capture_checker_object(to_point, player_num)
         checker.return_from_bar(to_point + 1)  # Convert 0-based to 1-based
+        registry.relocate(checker, "bar")
         return True
 
     def bear_off_checker_object(self, point, player_num):
@@ -230,12 +242,13 @@ class BackgammonGame:
         Returns:
             bool: True if the bear off was successful, False otherwise
         """
-        checkers_at_point = self.get_checkers_at_point(point, player_num)
-        if not checkers_at_point:
+        registry = self.__checker_registries__[player_num]
+        checker = registry.first_checker(point + 1)
+        if checker is None:
             return False
 
-        checker = checkers_at_point[0]  # Bear off the first checker
         checker.bear_off()
+        registry.relocate(checker, point + 1)
         return True
 
     def roll_dice(self):
@@ -310,6 +323,14 @@ class BackgammonGame:
         """
         return 1 if self.__current_player__ == self.__player1__ else 2
 
+    def get_position_key(self):
+        """Get the 64-bit Zobrist key of the current position and side to move.
+
+        Returns:
+            int: Position key shared by caches, transposition tables and dedup
+        """
+        return self.__board__.get_zobrist_hash(self._get_current_player_num())
+
     def _has_player_piece_at(self, from_point, player_num):
         """Check bounds and that the top checker at from_point belongs to player_num.
         Args:
@@ -366,32 +387,36 @@ class BackgammonGame:
         else:
             player_num = 2
         distance = abs(to_point - from_point)
-        # Save previous state for history
-        old_board = self.__board__.copy()
-        move_info = {
-            "from": from_point,
-            "to": to_point,
-            "player": player_num,
-            "captured": None,
-            "board_state": old_board,
-        }
+        # Execute movement, keeping the undo token for history
+        token = self.__board__.apply((from_point, to_point), player_num)
+        if token is None:
+            return False
+        # Remove used dice value - find and remove the first matching distance
+        self.__available_moves__.remove(distance)
+        self._record_move(token)
+        return True
 
-        # Check if there's a capture
-        if len(self.__board__.__points__[to_point]) > 0:
-            if len(self.__board__.__points__[to_point]) == 1:
-                if self.__board__.__points__[to_point][0] != player_num:
-                    move_info["captured"] = self.__board__.__points__[to_point][0]
-        # Execute movement
-        success = self.__board__.move_piece(from_point, to_point, player_num)
-        if success:
-            # Remove used dice value - find and remove the first matching distance
-            for i, move in enumerate(self.__available_moves__):
-                if move == distance:
-                    self.__available_moves__.pop(i)
-                    break
-            self.__move_history__.append(move_info)
+    def _record_move(self, token):
+        """Append an applied move to the move history.
+
+        History entries keep the board's undo token rather than a copy of the
+        board; undo_last_move reverts it.
+
+        Args:
+            token (tuple): Undo token returned by Board.apply
 
-        return success
+        Returns:
+            None
+        """
+        self.__move_history__.append(
+            {
+                "from": token[0],
+                "to": token[1],
+                "player": token[2],
+                "captured": token[3],
+                "undo": token,
+            }
+        )
 
     def move_from_bar(self, dice_value):
         """Move a checker from the bar to the board.
@@ -426,38 +451,19 @@ class BackgammonGame:
         ]
         if len(player_pieces_on_bar) == 0:
             return False
-        # Calculate entry point
-        if player_num == 1:
-            entry_point = dice_value - 1
-        else:
-            entry_point = 24 - dice_value
-
-        # Validate entry point
-        if entry_point < 0 or entry_point >= 24:
+        # Look up and validate the entry point
+        entry_point = table_entry_point(player_num, dice_value)
+        if entry_point is None:
             return False
 
-        # Save move for history
-        old_board = self.__board__.copy()
-        move_info = {
-            "from": "bar",
-            "to": entry_point,
-            "player": player_num,
-            "captured": None,
-            "board_state": old_board,
-        }
-
-        # Execute movement
-        success = self.__board__.enter_from_bar(entry_point, player_num)
-
-        if success:
-            # Remove used dice value - find and remove the first matching dice value
-            for i, move in enumerate(self.__available_moves__):
-                if move == dice_value:
-                    self.__available_moves__.pop(i)
-                    break
-            self.__move_history__.append(move_info)
-
-        return success
+        # Execute movement, keeping the undo token for history
+        token = self.__board__.apply(("bar", entry_point), player_num)
+        if token is None:
+            return False
+        # Remove used dice value - find and remove the first matching dice value
+        self.__available_moves__.remove(dice_value)
+        self._record_move(token)
+        return True
 
     def can_bear_off(self, player_num):
         """Check if a player can bear off checkers.
@@ -498,21 +504,11 @@ class BackgammonGame:
         # Try each available dice value
         for i, dice_value in enumerate(self.__available_moves__):
             if self.__board__.can_bear_off(point, player_num, dice_value):
-                # Save move for history
-                old_board = self.__board__.copy()
-                move_info = {
-                    "from": point,
-                    "to": "off",
-                    "player": player_num,
-                    "captured": None,
-                    "board_state": old_board,
-                }
-
-                success = self.__board__.bear_off_piece(point, player_num)
-                if success:
+                token = self.__board__.apply((point, "off"), player_num)
+                if token is not None:
                     # Remove the used dice value
                     self.__available_moves__.pop(i)
-                    self.__move_history__.append(move_info)
+                    self._record_move(token)
                     return True
 
         return False
@@ -654,6 +650,7 @@ class BackgammonGame:
             checker.reset()
         for checker in self.__player2_checkers__:
             checker.reset()
+        self.refresh_checker_index()
 
     def copy_game_state(self):
         """Create a copy of the current game state.
@@ -690,7 +687,7 @@ class BackgammonGame:
             return False
 
         last_move = self.__move_history__.pop()
-        self.__board__ = last_move["board_state"]
+        self.__board__.revert(last_move["undo"])
 
         # Restore available moves
         if self.__last_roll__ is not None:
@@ -729,12 +726,8 @@ class BackgammonGame:
 
         destinations = []
         for move_dist in self.__available_moves__:
-            if player_num == 1:
-                to_point = from_point + move_dist
-            else:
-                to_point = from_point - move_dist
-
-            if 0 <= to_point < 24:
+            to_point = destination(player_num, from_point, move_dist)
+            if to_point is not None:
                 if self.__board__.can_move(from_point, to_point, player_num):
                     destinations.append(to_point)
 
@@ -743,33 +736,20 @@ class BackgammonGame:
     def has_valid_moves(self):
         """Check if current player has valid moves.
 
+        Does not modify the game: when no moves are available yet, the dice
+        of the last roll are probed without being stored.
+
         Returns:
             bool: True if player has valid moves, False otherwise
         """
-        # Update available moves if they are empty
-        if len(self.__available_moves__) == 0 and self.__last_roll__ is not None:
-            self.__available_moves__ = self.__dice__.__get_moves__(self.__last_roll__)
+        dice_values = self.__available_moves__
+        if len(dice_values) == 0 and self.__last_roll__ is not None:
+            dice_values = self.__dice__.__get_moves__(self.__last_roll__)
 
-        if len(self.__available_moves__) == 0:
+        if len(dice_values) == 0:
             return False
 
-        if self.__current_player__ == self.__player1__:
-            player_num = 1
-        else:
-            player_num = 2
-
-        # Check if player must enter from bar first
-        if self.must_enter_from_bar():
-            return self.can_enter_from_bar(player_num)
-
-        # Check regular moves
-        for point in range(24):
-            destinations = self.get_possible_destinations(point)
-            if len(destinations) > 0:
-                return True
-
-        # Finally, check bearing off possibilities
-        return self._can_bear_off_any(player_num)
+        return self.__board__.has_any_move(self._get_current_player_num(), dice_values)
 
     def can_enter_from_bar(self, player_num):
         """Return True if the player can legally enter from the bar with any die.
@@ -781,11 +761,9 @@ class BackgammonGame:
             bool: True if player can enter from bar, False otherwise
         """
         for dice_value in self.__available_moves__:
-            if player_num == 1:
-                entry_point = dice_value - 1  # Blancas entran en 0-5
-            else:
-                entry_point = 24 - dice_value  # Negras entran en 19-24
-            if 0 <= entry_point < 24:
+            # Blancas entran en 0-5, negras entran en 19-24
+            entry_point = table_entry_point(player_num, dice_value)
+            if entry_point is not None:
                 point = self.__board__.__points__[entry_point]
                 if len(point) == 0:
                     return True
@@ -795,33 +773,6 @@ class BackgammonGame:
                     return True
         return False
 
-    def _can_bear_off_any(self, player_num):
-        """Return True if any bearing off move is possible with current dice.
-
-        Args:
-            player_num (int): Player number (1 or 2)
-
-        Returns:
-            bool: True if bearing off is possible, False otherwise
-        """
-        if not self.can_bear_off(player_num):
-            return False
-
-        home_points = (
-            [18, 19, 20, 21, 22, 23] if player_num == 1 else [0, 1, 2, 3, 4, 5]
-        )
-
-        for point in home_points:
-            if (
-                not self.__board__.__points__[point]
-                or self.__board__.__points__[point][0] != player_num
-            ):
-                continue
-            for dice_value in self.__available_moves__:
-                if self.__board__.can_bear_off(point, player_num, dice_value):
-                    return True
-        return False
-
     def must_enter_from_bar(self):
         """Check if current player must enter checkers from bar.
 
@@ -843,49 +794,23 @@ class BackgammonGame:
         Returns:
             int: The pip count for the player
         """
-        if player == self.__player1__:
-            player_num = 1
-        else:
-            player_num = 2
+        player_num = 1 if player == self.__player1__ else 2
+        return self.__board__.get_pip_count(player_num)
 
-        pip_count = 0
-
-        # Count pips for pieces on board
-        for point_idx in range(24):
-            point = self.__board__.__points__[point_idx]
-            for piece in point:
-                if piece == player_num:
-                    if player_num == 1:
-                        pip_count = pip_count + (24 - point_idx)
-                    else:
-                        pip_count = pip_count + (point_idx + 1)
-
-        # Count pips for pieces on bar
-        if player_num == 1:
-            player_bar_index = 1
-            bar_pieces = sum(
-                1
-                for piece in self.__board__.__checker_bar__[player_bar_index]
-                if piece == 1
-            )
-            pip_count = pip_count + (bar_pieces * 25)
-        else:
-            player_bar_index = 0
-            bar_pieces = sum(
-                1
-                for piece in self.__board__.__checker_bar__[player_bar_index]
-                if piece == 2
-            )
-            pip_count = pip_count + (bar_pieces * 24)
+    def auto_play_turn(self, bot=None):
+        """Automatically play a turn.
 
-        return pip_count
+        Without a bot the turn is only passed when no move is possible.
 
-    def auto_play_turn(self):
-        """Automatically play a turn.
+        Args:
+            bot (GreedyBot, optional): Computer player that rolls if needed
+                and plays the whole turn. Defaults to None.
 
         Returns:
             bool: True if turn was played, False otherwise
         """
+        if bot is not None:
+            return bot.play_turn(self) is not None
         if not self.has_valid_moves():
             self.switch_current_player()
             return True
@@ -935,6 +860,34 @@ class BackgammonGame:
         """
         return True
 
+    def get_legal_plays(self):
+        """Get every distinct legal full play for the current roll.
+
+        Returns:
+            list: Plays as tuples of (from, to, die) moves, or an empty list
+                if the dice have not been rolled or no move is possible
+        """
+        if self.__last_roll__ is None:
+            return []
+        player_num = self._get_current_player_num()
+        roll = self.__last_roll__
+        key = ("plays", self.get_position_key(), tuple(sorted(roll)))
+        plays = self.__move_cache__.lookup(
+            key,
+            lambda: tuple(
+                generate_plays(CompactBoard.from_board(self.__board__), player_num, roll)
+            ),
+        )
+        return list(plays)
+
+    def get_move_cache(self):
+        """Get the move generation cache used by this game.
+
+        Returns:
+            MoveCache: The cache, whose get_stats() reports hits and misses
+        """
+        return self.__move_cache__
+
     def validate_complete_turn(self, moves):
         """Validate a complete turn with multiple moves.
 
@@ -944,54 +897,101 @@ class BackgammonGame:
         Returns:
             bool: True if all moves are valid, False otherwise
         """
-        # Create a temporary board to test moves
-        temp_board = self.__board__.copy()
-        temp_moves = []
-        for move in self.__available_moves__:
-            temp_moves.append(move)
-
-        if self.__current_player__ == self.__player1__:
-            player_num = 1
-        else:
-            player_num = 2
-
-        for move in moves:
-            from_point = move[0]
-            to_point = move[1]
-            distance = abs(to_point - from_point)
-
-            found_distance = False
-            for i, move in enumerate(temp_moves):
-                if move == distance:
-                    found_distance = True
-                    temp_moves.pop(i)
-                    break
-            if not found_distance:
-                return False
-
-            if not temp_board.can_move(from_point, to_point, player_num):
-                return False
-
-            temp_board.move_piece(from_point, to_point, player_num)
-
+        played = self._play_turn(moves)
+        if played is None:
+            return False
+        for token in reversed(played[0]):
+            self.__board__.revert(token)
         return True
 
     def execute_turn(self, moves):
         """Execute a complete turn with multiple moves.
 
+        The moves are validated and applied in a single pass. If any of them
+        is illegal, those already applied are reverted and the game is left
+        exactly as it was.
+
         Args:
             moves (list): List of moves to execute
 
         Returns:
             bool: True if all moves were executed successfully, False otherwise
         """
-        if not self.validate_complete_turn(moves):
+        played = self._play_turn(moves)
+        if played is None:
             return False
+        tokens, remaining = played
+        self.__available_moves__ = remaining
+        for token in tokens:
+            self._record_move(token)
+        return True
+
+    def _play_turn(self, moves):
+        """Validate and apply moves in order, rolling back on the first failure.
 
+        Moves are (from, to) or (from, to, die) sequences; from may be "bar"
+        and to "off", as in the plays of get_legal_plays. The available dice
+        are not modified.
+
+        Args:
+            moves (list): List of moves to play
+
+        Returns:
+            tuple: (undo tokens, remaining dice) if every move was applied,
+                otherwise None with the board unchanged
+        """
+        player_num = self._get_current_player_num()
+        remaining = list(self.__available_moves__)
+        tokens = []
         for move in moves:
-            from_point = move[0]
-            to_point = move[1]
-            if not self.make_move(from_point, to_point):
-                return False
+            die = self._turn_move_die(move, player_num, remaining)
+            token = None if die is None else self.__board__.apply(move, player_num)
+            if token is None:
+                for applied in reversed(tokens):
+                    self.__board__.revert(applied)
+                return None
+            remaining.remove(die)
+            tokens.append(token)
+        return tokens, remaining
+
+    def _turn_move_die(self, move, player_num, remaining):
+        """Find the die a turn move uses and check it is still available.
 
-        return True
+        Args:
+            move: (from, to) or (from, to, die) sequence
+            player_num (int): Player number (1 or 2)
+            remaining (list): Dice not yet used this turn
+
+        Returns:
+            int: The die to consume, or None if the move cannot be played
+        """
+        board = self.__board__
+        from_point, to_point = move[0], move[1]
+        if from_point != "bar" and board.has_pieces_on_bar(player_num):
+            return None
+
+        if to_point == "off":
+            if from_point not in range(24):
+                return None
+            if len(move) > 2:
+                dice = (move[2],)
+            else:
+                # Prefer the exact die, otherwise the smallest larger one
+                distance = BEAR_OFF_DISTANCE[player_num][from_point]
+                dice = sorted(d for d in remaining if d >= distance)
+            return next(
+                (
+                    d
+                    for d in dice
+                    if d in remaining and board.can_bear_off(from_point, player_num, d)
+                ),
+                None,
+            )
+
+        if from_point == "bar":
+            die = to_point + 1 if player_num == 1 else 24 - to_point
+        else:
+            die = to_point - from_point if player_num == 1 else from_point - to_point
+        if len(move) > 2 and move[2] != die:
+            return None
+        return die if die in remaining else None
@@ -0,0 +1,785 @@
+"""Bear-off database module for the Backgammon game.
+
+This module generates and reads the bear-off databases. The one-sided
+database holds, for every way of placing up to 15 checkers on the six home
+points, the distribution of the number of rolls needed to bear them all off
+with play that minimizes the expected number of rolls. The two-sided
+database holds, for every pair of positions with up to N checkers a side,
+the exact chance that the side on roll bears off first. Positions are
+numbered by a perfect hash, their rank in the combinatorial number system,
+so a record is found by offset. Files are memory-mapped: lookups read one
+record from the page cache and the tables never enter the Python heap.
+
+A position is a tuple of six counts, the checkers 1 to 6 pips away from
+bearing off. Build the files, at DEFAULT_PATH and DEFAULT_TWO_SIDED_PATH by
+default, with
+
+    python -m core.bearoff one-sided [path] [max_checkers]
+    python -m core.bearoff two-sided [path] [max_checkers]
+"""
+
+import mmap
+import os
+import struct
+import sys
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from math import comb
+
+import numpy as np
+
+from .compact_board import CHECKERS_PER_PLAYER, OFF_CELLS
+from .move_tables import BEAR_OFF_DISTANCE, HOME_POINTS
+
+BOARD_POINTS = 6
+MAX_CHECKERS = CHECKERS_PER_PLAYER
+# Rolls kept per distribution; the last entry also holds any longer tail
+MAX_ROLLS = 32
+PROBABILITY_SCALE = 65535
+
+# Two-sided tables grow with the square of the positions per side
+DEFAULT_TWO_SIDED_CHECKERS = 6
+MAX_TWO_SIDED_CHECKERS = 10
+
+MAGIC = b"BGOS"
+TWO_SIDED_MAGIC = b"BGTS"
+VERSION = 1
+# Magic, version, max checkers, max rolls (0 for two-sided files)
+HEADER = struct.Struct("<4sHBB")
+# Expected rolls, then the quantized probability of each number of rolls
+RECORD = struct.Struct(f"<f{MAX_ROLLS}H")
+# Quantized winning chance of the side on roll
+PROBABILITY = struct.Struct("<H")
+
+DATA_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data"
+)
+DEFAULT_PATH = os.path.join(DATA_DIRECTORY, "bearoff_one_sided.db")
+DEFAULT_TWO_SIDED_PATH = os.path.join(DATA_DIRECTORY, "bearoff_two_sided.db")
+
+# (die1, die2, probability) of the 21 distinct rolls
+_ROLLS = tuple(
+    (die1, die2, (1 if die1 == die2 else 2) / 36)
+    for die1 in range(1, 7)
+    for die2 in range(die1, 7)
+)
+
+
+def position_count(max_checkers=MAX_CHECKERS):
+    """Get the number of one-sided positions.
+
+    Args:
+        max_checkers (int, optional): Most checkers left on the board.
+            Defaults to MAX_CHECKERS.
+
+    Returns:
+        int: Number of positions, 54264 for 15 checkers
+    """
+    return comb(max_checkers + BOARD_POINTS, BOARD_POINTS)
+
+
+def position_index(counts):
+    """Get the perfect-hash index of a position.
+
+    The counts are laid out as checkers and bars in a row; the slots of the
+    six bars form a combination, whose rank is the index. Positions with n
+    checkers or fewer take exactly the indices below position_count(n).
+
+    Args:
+        counts (tuple): Checkers 1 to 6 pips away from bearing off
+
+    Returns:
+        int: Index of the position
+    """
+    index = 0
+    slot = -1
+    for point, count in enumerate(counts):
+        slot += count + 1
+        index += comb(slot, point + 1)
+    return index
+
+
+def index_position(index):
+    """Get the position of a perfect-hash index.
+
+    Args:
+        index (int): Index of a position, from 0
+
+    Returns:
+        tuple: Checkers 1 to 6 pips away from bearing off
+    """
+    slots = []
+    for point in range(BOARD_POINTS, 0, -1):
+        slot = point - 1
+        while comb(slot + 1, point) <= index:
+            slot += 1
+        index -= comb(slot, point)
+        slots.append(slot)
+    slots.reverse()
+    return tuple(
+        slot - previous - 1 for previous, slot in zip([-1] + slots, slots)
+    )
+
+
+def board_counts(board, player):
+    """Get the one-sided position of a player who is bearing off.
+
+    Args:
+        board: CompactBoard to read
+        player (int): Player number (1 or 2)
+
+    Returns:
+        tuple: Checkers 1 to 6 pips away from bearing off, or None if some
+            of the player's checkers are outside the home board
+    """
+    cells = board.__cells__
+    sign = 1 if player == 1 else -1
+    counts = [0] * BOARD_POINTS
+    for point in HOME_POINTS[player]:
+        value = cells[point] * sign
+        if value > 0:
+            counts[BEAR_OFF_DISTANCE[player][point] - 1] = value
+    if sum(counts) + cells[OFF_CELLS[player - 1]] != CHECKERS_PER_PLAYER:
+        return None
+    return tuple(counts)
+
+
+def _die_moves(counts, die):
+    """Get the positions reached by playing one die.
+
+    A die bears off a checker exactly that far away, or the farthest checker
+    if it is closer; otherwise it moves a checker down by its value.
+
+    Args:
+        counts (tuple): Position with at least one checker
+        die (int): Die value
+
+    Returns:
+        list: Indices of the positions after each legal move of the die,
+            without duplicates
+    """
+    highest = max(point for point in range(BOARD_POINTS) if counts[point])
+    reached = set()
+    for point in range(highest + 1):
+        if not counts[point] or (point + 1 < die and point != highest):
+            continue
+        after = list(counts)
+        after[point] -= 1
+        if point + 1 > die:
+            after[point - die] += 1
+        reached.add(position_index(after))
+    return sorted(reached)
+
+
+def _fill_best(index, moves, best, means):
+    """Record the best positions after one to three dice from a position.
+
+    Args:
+        index (int): Index of the position
+        moves (list): moves[die], the _die_moves of the position per die
+        best (list): best[dice - 1][index][die] tables to fill in
+        means (list): Expected rolls of the positions solved so far
+
+    Returns:
+        None
+    """
+    candidates = moves
+    for dice, table in enumerate(best):
+        if dice:
+            previous = best[dice - 1]
+            candidates = [
+                [previous[after][die] for after in moves[die]] for die in range(7)
+            ]
+        table[index] = tuple(
+            min(reached, key=means.__getitem__, default=0) for reached in candidates
+        )
+
+
+def _roll_choices(moves, best, means):
+    """Find the best play of each roll from a position.
+
+    Args:
+        moves (list): moves[die], the _die_moves of the position per die
+        best (list): best[dice - 1][index][die], the index of the best
+            position after dice more moves of a die from a position
+        means (list): Expected rolls of the positions solved so far
+
+    Returns:
+        dict: Probability of each position reached by a best play
+    """
+    choices = {}
+    for die1, die2, probability in _ROLLS:
+        if die1 == die2:
+            candidates = [best[2][after][die1] for after in moves[die1]]
+        else:
+            candidates = [best[0][after][die2] for after in moves[die1]]
+            candidates += [best[0][after][die1] for after in moves[die2]]
+        choice = min(candidates, key=means.__getitem__)
+        choices[choice] = choices.get(choice, 0.0) + probability
+    return choices
+
+
+def generate(max_checkers=MAX_CHECKERS):
+    """Compute the roll distributions of every one-sided position.
+
+    Positions are solved in order of pip count, since every move lowers it.
+    The best play of a roll is found through tables of the best position
+    after one, two and three more dice of a value, so plays are never
+    enumerated in full.
+
+    Args:
+        max_checkers (int, optional): Most checkers left on the board.
+            Defaults to MAX_CHECKERS.
+
+    Returns:
+        list: (expected rolls, distribution) per position index, where
+            distribution[n] is the probability of needing exactly n rolls
+    """
+    count = position_count(max_checkers)
+    positions = [index_position(index) for index in range(count)]
+    order = sorted(
+        range(1, count),
+        key=lambda index: sum(
+            checkers * (point + 1) for point, checkers in enumerate(positions[index])
+        ),
+    )
+    means = [0.0] * count
+    distributions = [[1.0]] + [None] * (count - 1)
+    # The empty position, index 0, stays empty whatever the dice
+    best = [[(0,) * 7] + [None] * (count - 1) for _ in range(3)]
+
+    for index in order:
+        moves = [()] + [_die_moves(positions[index], die) for die in range(1, 7)]
+        _fill_best(index, moves, best, means)
+        choices = _roll_choices(moves, best, means)
+        means[index] = 1.0 + sum(
+            probability * means[choice] for choice, probability in choices.items()
+        )
+        distribution = [0.0] * (1 + max(len(distributions[c]) for c in choices))
+        for choice, probability in choices.items():
+            for rolls, chance in enumerate(distributions[choice], 1):
+                distribution[rolls] += probability * chance
+        distributions[index] = distribution
+    return list(zip(means, distributions))
+
+
+def write_database(path=DEFAULT_PATH, max_checkers=MAX_CHECKERS):
+    """Generate the database and write it to a file.
+
+    Probabilities are stored as multiples of 1 / PROBABILITY_SCALE, and any
+    chance of needing more than MAX_ROLLS - 1 rolls is added to the last one.
+
+    Args:
+        path (str, optional): File to write; missing directories are
+            created. Defaults to DEFAULT_PATH.
+        max_checkers (int, optional): Most checkers left on the board, 1 to
+            MAX_CHECKERS. Defaults to MAX_CHECKERS.
+
+    Returns:
+        int: Number of positions written
+
+    Raises:
+        ValueError: If max_checkers is out of range
+    """
+    if not 1 <= max_checkers <= MAX_CHECKERS:
+        raise ValueError(f"Bear-off databases hold 1 to {MAX_CHECKERS} checkers")
+    records = generate(max_checkers)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "wb") as handle:
+        handle.write(HEADER.pack(MAGIC, VERSION, max_checkers, MAX_ROLLS))
+        for mean, distribution in records:
+            distribution = distribution[: MAX_ROLLS - 1] + [
+                sum(distribution[MAX_ROLLS - 1 :])
+            ]
+            distribution += [0.0] * (MAX_ROLLS - len(distribution))
+            handle.write(
+                RECORD.pack(
+                    mean,
+                    *(round(chance * PROBABILITY_SCALE) for chance in distribution),
+                )
+            )
+    return len(records)
+
+
+class _MappedDatabase(ABC):
+    """Read-only bear-off database file mapped into memory.
+
+    Subclasses set MAGIC and FORMAT, the last header field, and say how
+    many bytes of records follow the header. A database pickles as its
+    path, so bots using it can run on rollout worker processes, which map
+    the file again.
+    """
+
+    MAGIC = b""
+    FORMAT = 0
+
+    def __init__(self, path):
+        """Map a database file.
+
+        Args:
+            path (str): File written by the matching write function
+
+        Raises:
+            OSError: If the file cannot be opened
+            ValueError: If the file is not a complete database of this kind
+        """
+        self.__path__ = path
+        with open(path, "rb") as handle:
+            self.__map__ = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        size = len(self.__map__)
+        if size < HEADER.size:
+            raise ValueError(f"{path} is not a bear-off database")
+        magic, version, max_checkers, layout = HEADER.unpack_from(self.__map__)
+        if (
+            (magic, version, layout) != (self.MAGIC, VERSION, self.FORMAT)
+            or size != HEADER.size + self._records_size(max_checkers)
+        ):
+            raise ValueError(f"{path} is not a bear-off database")
+        self.__max_checkers__ = max_checkers
+
+    @staticmethod
+    @abstractmethod
+    def _records_size(max_checkers):
+        """Get the size of the records of a database.
+
+        Args:
+            max_checkers (int): Checker limit of the database
+
+        Returns:
+            int: Bytes after the header
+        """
+
+    def get_max_checkers(self):
+        """Get the most checkers a stored position holds.
+
+        Returns:
+            int: Checker limit of the database
+        """
+        return self.__max_checkers__
+
+    def covers(self, counts):
+        """Check whether a position is stored.
+
+        Args:
+            counts (tuple): Checkers 1 to 6 pips away from bearing off
+
+        Returns:
+            bool: True if the database holds the position
+        """
+        return sum(counts) <= self.__max_checkers__
+
+    @abstractmethod
+    def win_probability(self, on_roll, other):
+        """Get the chance that the side on roll bears off first.
+
+        Args:
+            on_roll (tuple): Position of the side about to roll
+            other (tuple): Position of the other side
+
+        Returns:
+            float: Probability that on_roll finishes first
+        """
+
+    def race_equity(self, board, player):
+        """Get the equity of a bear-off for a player, the opponent on roll.
+
+        Only positions without gammon chances, where both players have borne
+        off at least one checker, are looked up.
+
+        Args:
+            board: CompactBoard to evaluate
+            player (int): Player number (1 or 2)
+
+        Returns:
+            float: Cubeless equity for player, or None if the position is not
+                a stored bear-off without gammons
+        """
+        cells = board.__cells__
+        if not cells[OFF_CELLS[0]] or not cells[OFF_CELLS[1]]:
+            return None
+        own = board_counts(board, player)
+        other = board_counts(board, 3 - player)
+        if own is None or other is None:
+            return None
+        if not (self.covers(own) and self.covers(other)):
+            return None
+        return 1.0 - 2.0 * self.win_probability(other, own)
+
+    def close(self):
+        """Unmap the file.
+
+        Returns:
+            None
+        """
+        self.__map__.close()
+
+    def __getstate__(self):
+        """Pickle the database as its path.
+
+        Returns:
+            dict: The path of the file
+        """
+        return {"path": self.__path__}
+
+    def __setstate__(self, state):
+        """Map the file again after unpickling.
+
+        Args:
+            state (dict): The path of the file
+
+        Returns:
+            None
+        """
+        self.__init__(state["path"])
+
+
+class BearoffDatabase(_MappedDatabase):
+    """One-sided bear-off database of roll distributions.
+
+    Two-sided chances are combined from the distributions of both sides as
+    if they were independent, which is close to, but not quite, best play.
+    """
+
+    MAGIC = MAGIC
+    FORMAT = MAX_ROLLS
+
+    def __init__(self, path=DEFAULT_PATH):
+        """Map a database file.
+
+        Args:
+            path (str, optional): File written by write_database. Defaults
+                to DEFAULT_PATH.
+
+        Raises:
+            OSError: If the file cannot be opened
+            ValueError: If the file is not a complete one-sided database
+        """
+        super().__init__(path)
+
+    @staticmethod
+    def _records_size(max_checkers):
+        """Get the size of the records of a database.
+
+        Args:
+            max_checkers (int): Checker limit of the database
+
+        Returns:
+            int: Bytes after the header
+        """
+        return position_count(max_checkers) * RECORD.size
+
+    def expected_rolls(self, counts):
+        """Get the expected number of rolls to bear off a position.
+
+        Args:
+            counts (tuple): Checkers 1 to 6 pips away from bearing off
+
+        Returns:
+            float: Expected rolls with the best play
+        """
+        return self._record(counts)[0]
+
+    def roll_distribution(self, counts):
+        """Get the distribution of the number of rolls to bear off.
+
+        Args:
+            counts (tuple): Checkers 1 to 6 pips away from bearing off
+
+        Returns:
+            tuple: MAX_ROLLS probabilities, of needing exactly n rolls at
+                index n
+        """
+        return tuple(count / PROBABILITY_SCALE for count in self._record(counts)[1:])
+
+    def win_probability(self, on_roll, other):
+        """Get the chance that the side on roll bears off first.
+
+        Args:
+            on_roll (tuple): Position of the side about to roll
+            other (tuple): Position of the other side
+
+        Returns:
+            float: Probability that on_roll finishes first
+        """
+        first = self._record(on_roll)[1:]
+        second = self._record(other)[1:]
+        # The side on roll wins in n rolls unless the other needs fewer
+        not_done = sum(second)
+        wins = 0
+        for rolls in range(MAX_ROLLS):
+            wins += first[rolls] * not_done
+            not_done -= second[rolls]
+        return wins / (sum(first) * sum(second))
+
+    def _record(self, counts):
+        """Read the record of a position.
+
+        Args:
+            counts (tuple): Checkers 1 to 6 pips away from bearing off
+
+        Returns:
+            tuple: Expected rolls, then the MAX_ROLLS quantized probabilities
+        """
+        return RECORD.unpack_from(
+            self.__map__, HEADER.size + position_index(counts) * RECORD.size
+        )
+
+    def __len__(self):
+        """Return the number of stored positions.
+
+        Returns:
+            int: Number of records
+        """
+        return position_count(self.__max_checkers__)
+
+
+def _roll_results(positions, moves, index):
+    """Get the positions each roll can lead to.
+
+    Args:
+        positions (list): Position of each index
+        moves (dict): Memo of _die_moves per (index, die), filled in
+        index (int): Index of a position with at least one checker
+
+    Returns:
+        list: Per roll in _ROLLS order, the sorted indices of the positions
+            reached by its legal plays
+    """
+
+    def play(start, dice):
+        reached = {start}
+        for die in dice:
+            after = set()
+            for current in reached:
+                if current == 0:
+                    after.add(0)
+                    continue
+                if (current, die) not in moves:
+                    moves[current, die] = _die_moves(positions[current], die)
+                after.update(moves[current, die])
+            reached = after
+        return reached
+
+    results = []
+    for die1, die2, _ in _ROLLS:
+        if die1 == die2:
+            reached = play(index, (die1,) * 4)
+        else:
+            reached = play(index, (die1, die2)) | play(index, (die2, die1))
+        results.append(sorted(reached))
+    return results
+
+
+def solve_two_sided(max_checkers=DEFAULT_TWO_SIDED_CHECKERS):
+    """Compute the winning chances of every two-sided bear-off.
+
+    Positions are ranked by pip count, so plays always lead to lower ranks.
+    Rank i is solved against every lower rank j at once, as the side on roll
+    and as the other side, with each roll's best play the one leaving the
+    opponent the lowest chance; the work is vectorized over the 21 rolls and
+    the opponent positions.
+
+    Args:
+        max_checkers (int, optional): Most checkers left on each side.
+            Defaults to DEFAULT_TWO_SIDED_CHECKERS.
+
+    Returns:
+        numpy.ndarray: wins[a, b], the probability that the side on roll
+            with position index a bears off before the side with index b
+    """
+    count = position_count(max_checkers)
+    positions = [index_position(index) for index in range(count)]
+    order = sorted(range(count), key=lambda index: _pips(positions[index]))
+    rank = np.empty(count, dtype=np.intp)
+    rank[order] = np.arange(count)
+
+    successors = _successor_ranks(positions, order, rank)
+    probabilities = np.array([probability for _, _, probability in _ROLLS])
+
+    # An empty side has already won; rank 0 is the empty position
+    wins = np.zeros((count, count))
+    wins[0] = 1.0
+    for current in range(1, count):
+        reached = successors[current]
+        wins[current, :current] = (
+            1.0 - wins[:current][:, reached].min(axis=2)
+        ) @ probabilities
+        wins[1:current, current] = (
+            1.0 - wins[current][successors[1:current]].min(axis=2)
+        ) @ probabilities
+        wins[current, current] = (
+            1.0 - wins[current][reached].min(axis=1)
+        ) @ probabilities
+    return wins[np.ix_(rank, rank)]
+
+
+def _successor_ranks(positions, order, rank):
+    """Tabulate the positions each roll leads to, by rank.
+
+    Args:
+        positions (list): Position of each index
+        order (list): Indices by rank
+        rank (numpy.ndarray): Rank of each index
+
+    Returns:
+        numpy.ndarray: successors[i, roll, k], the ranks reachable from rank
+            i with a roll, padded by repeating them; zeros for rank 0
+    """
+    moves = {}
+    results = [_roll_results(positions, moves, index) for index in order[1:]]
+    width = max(len(reached) for rolls in results for reached in rolls)
+    successors = np.zeros((len(order), len(_ROLLS), width), dtype=np.intp)
+    for current, rolls in enumerate(results, 1):
+        for roll, reached in enumerate(rolls):
+            successors[current, roll] = np.resize(rank[reached], width)
+    return successors
+
+
+def _pips(counts):
+    """Get the pip count of a position.
+
+    Args:
+        counts (tuple): Checkers 1 to 6 pips away from bearing off
+
+    Returns:
+        int: Pips to bear every checker off
+    """
+    return sum(checkers * (point + 1) for point, checkers in enumerate(counts))
+
+
+def write_two_sided_database(
+    path=DEFAULT_TWO_SIDED_PATH, max_checkers=DEFAULT_TWO_SIDED_CHECKERS
+):
+    """Solve the two-sided database and write it to a file.
+
+    Winning chances are stored as multiples of 1 / PROBABILITY_SCALE in a
+    row-major matrix of position indices, two bytes each.
+
+    Args:
+        path (str, optional): File to write; missing directories are
+            created. Defaults to DEFAULT_TWO_SIDED_PATH.
+        max_checkers (int, optional): Most checkers left on each side, 1 to
+            MAX_TWO_SIDED_CHECKERS. Defaults to DEFAULT_TWO_SIDED_CHECKERS.
+
+    Returns:
+        int: Number of positions per side written
+
+    Raises:
+        ValueError: If max_checkers is out of range
+    """
+    if not 1 <= max_checkers <= MAX_TWO_SIDED_CHECKERS:
+        raise ValueError(
+            f"Two-sided databases hold 1 to {MAX_TWO_SIDED_CHECKERS} checkers"
+        )
+    wins = solve_two_sided(max_checkers)
+    quantized = np.rint(wins * PROBABILITY_SCALE).astype("<u2")
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "wb") as handle:
+        handle.write(HEADER.pack(TWO_SIDED_MAGIC, VERSION, max_checkers, 0))
+        handle.write(quantized.tobytes())
+    return len(wins)
+
+
+class TwoSidedBearoffDatabase(_MappedDatabase):
+    """Two-sided bear-off database of winning chances with best play."""
+
+    MAGIC = TWO_SIDED_MAGIC
+    FORMAT = 0
+
+    def __init__(self, path=DEFAULT_TWO_SIDED_PATH):
+        """Map a database file.
+
+        Args:
+            path (str, optional): File written by write_two_sided_database.
+                Defaults to DEFAULT_TWO_SIDED_PATH.
+
+        Raises:
+            OSError: If the file cannot be opened
+            ValueError: If the file is not a complete two-sided database
+        """
+        super().__init__(path)
+        self.__positions__ = position_count(self.__max_checkers__)
+
+    @staticmethod
+    def _records_size(max_checkers):
+        """Get the size of the records of a database.
+
+        Args:
+            max_checkers (int): Checker limit of the database
+
+        Returns:
+            int: Bytes after the header
+        """
+        return position_count(max_checkers) ** 2 * PROBABILITY.size
+
+    def win_probability(self, on_roll, other):
+        """Get the chance that the side on roll bears off first.
+
+        Args:
+            on_roll (tuple): Position of the side about to roll
+            other (tuple): Position of the other side
+
+        Returns:
+            float: Probability that on_roll finishes first
+        """
+        cell = position_index(on_roll) * self.__positions__ + position_index(other)
+        offset = HEADER.size + cell * PROBABILITY.size
+        return PROBABILITY.unpack_from(self.__map__, offset)[0] / PROBABILITY_SCALE
+
+    def __len__(self):
+        """Return the number of stored positions per side.
+
+        Returns:
+            int: Number of rows and of columns of the matrix
+        """
+        return self.__positions__
+
+
+@lru_cache(maxsize=None)
+def default_databases():
+    """Open the databases written at their default paths.
+
+    The two-sided database comes first, since its chances are exact. Files
+    are looked for once per process.
+
+    Returns:
+        tuple: The databases found, possibly none
+    """
+    databases = []
+    for kind, path in (
+        (TwoSidedBearoffDatabase, DEFAULT_TWO_SIDED_PATH),
+        (BearoffDatabase, DEFAULT_PATH),
+    ):
+        if os.path.exists(path):
+            databases.append(kind(path))
+    return tuple(databases)
+
+
+def main():
+    """Build a database file from the command line.
+
+    Returns:
+        None
+    """
+    kind = sys.argv[1] if len(sys.argv) > 1 else "one-sided"
+    if kind not in ("one-sided", "two-sided"):
+        raise SystemExit("Usage: python -m core.bearoff [one-sided|two-sided] ...")
+    two_sided = kind == "two-sided"
+    path = sys.argv[2] if len(sys.argv) > 2 else (
+        DEFAULT_TWO_SIDED_PATH if two_sided else DEFAULT_PATH
+    )
+    if two_sided:
+        checkers = int(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_TWO_SIDED_CHECKERS
+        count = write_two_sided_database(path, checkers)
+    else:
+        checkers = int(sys.argv[3]) if len(sys.argv) > 3 else MAX_CHECKERS
+        count = write_database(path, checkers)
+    print(f"Wrote {count} positions to {path} ({os.path.getsize(path)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
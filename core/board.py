@@ -6,9 +6,56 @@ with points, bar, and off-board areas for the Backgammon game.
 
 import copy
 
+from . import zobrist
+from .move_tables import (
+    BAR_PIPS,
+    BEAR_OFF_DISTANCE,
+    DESTINATIONS,
+    ENTRY_POINTS,
+    HOME_POINTS,
+    OUTER_POINTS,
+    PIPS,
+)
+
+
+def move_endpoints(move):
+    """Return the (from, to) pair of a move given as a tuple or a move dict.
+
+    Args:
+        move: (from, to) sequence or dict with "from" and "to" keys
+
+    Returns:
+        tuple: (from_point, to_point), where from may be "bar" and to "off"
+    """
+    if isinstance(move, dict):
+        return move["from"], move["to"]
+    return move[0], move[1]
+
 
 class Board:
-    """Represents a backgammon board with points, bar, and off-board areas."""
+    """Represents a backgammon board with points, bar, and off-board areas.
+
+    The position hash, pip totals, checkers outside home and rearmost checker
+    are maintained incrementally by the move methods. After editing
+    __points__, __checker_bar__ or __off_board__ directly, call
+    refresh_incremental_state; until then those answers are stale.
+    DEBUG_SELF_CHECK turns stale reads into errors.
+    """
+
+    # When True, get_pip_count, get_zobrist_hash and is_all_pieces_in_home,
+    # through which can_bear_off goes, verify the incremental state against a
+    # recount, so a stale direct edit raises instead of answering wrongly
+    DEBUG_SELF_CHECK = False
+
+    __slots__ = (
+        "__points__",
+        "__checker_bar__",
+        "__off_board__",
+        "__zobrist__",
+        "__pips__",
+        "__outside__",
+        "__back__",
+    )
 
     def __init__(self):
         """Initialize an empty backgammon board.
@@ -19,6 +66,10 @@ class Board:
         self.__points__ = [[] for _ in range(24)]
         self.__checker_bar__ = [[], []]
         self.__off_board__ = [[], []]  # Index 0 for player 1, index 1 for player 2
+        self.__zobrist__ = 0  # Position hash, updated incrementally
+        self.__pips__ = [0, 0]  # Running pip totals for players 1 and 2
+        self.__outside__ = [0, 0]  # Checkers outside home (bar included)
+        self.__back__ = [0, 0]  # Pip distance of each player's rearmost checker
 
     def setup_initial_position(self):
         """Set up the standard backgammon starting position.
@@ -43,6 +94,98 @@ class Board:
         self.__points__[7] = [2, 2, 2]
         self.__points__[5] = [2, 2, 2, 2, 2]
 
+        self.refresh_incremental_state()
+
+    def refresh_incremental_state(self):
+        """Recompute incrementally maintained state from the point lists.
+
+        Call this after editing __points__, __checker_bar__ or __off_board__
+        directly instead of through the move methods.
+
+        Returns:
+            None
+        """
+        self.__zobrist__ = zobrist.hash_board_state(
+            {
+                "points": self.__points__,
+                "bar": self.__checker_bar__,
+                "off_board": self.__off_board__,
+            }
+        )
+        self.__pips__ = [self._count_pips(1), self._count_pips(2)]
+        self.__outside__ = [
+            self._bar_count(player)
+            + sum(self._own_count(i, player) for i in OUTER_POINTS[player])
+            for player in (1, 2)
+        ]
+        self.__back__ = [self._scan_back(player, BAR_PIPS + 1) for player in (1, 2)]
+
+    def _count_pips(self, player):
+        """Count a player's pips with a full scan of the board.
+
+        Args:
+            player (int): Player number (1 or 2)
+
+        Returns:
+            int: Pips still to travel, including checkers on the bar
+        """
+        pips = self._bar_count(player) * BAR_PIPS
+        for point, pieces in enumerate(self.__points__):
+            pips += pieces.count(player) * PIPS[player][point]
+        return pips
+
+    def get_pip_count(self, player):
+        """Get a player's pip count from the running totals in O(1).
+
+        Args:
+            player (int): Player number (1 or 2)
+
+        Returns:
+            int: Pips still to travel, including checkers on the bar
+        """
+        if self.DEBUG_SELF_CHECK:
+            self.verify_incremental_state()
+        return self.__pips__[player - 1]
+
+    def verify_incremental_state(self):
+        """Check all incrementally maintained state against a full recount.
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: If the incremental state drifted from the lists
+        """
+        expected_pips = [self._count_pips(1), self._count_pips(2)]
+        if self.__pips__ != expected_pips:
+            raise RuntimeError(
+                f"Pip totals {self.__pips__} do not match recount {expected_pips}"
+            )
+        expected_hash = zobrist.hash_board_state(self.get_board_state())
+        if self.__zobrist__ != expected_hash:
+            raise RuntimeError("Position hash does not match recount")
+        expected = self.copy()
+        expected.refresh_incremental_state()
+        if (self.__outside__, self.__back__) != (
+            expected.__outside__,
+            expected.__back__,
+        ):
+            raise RuntimeError("Home-board tracking does not match recount")
+
+    def get_zobrist_hash(self, player_to_move=None):
+        """Get the 64-bit Zobrist hash of the current position.
+
+        Args:
+            player_to_move (int, optional): Side to move (1 or 2) to include
+                in the key. Defaults to None (side to move ignored).
+
+        Returns:
+            int: 64-bit position hash
+        """
+        if self.DEBUG_SELF_CHECK:
+            self.verify_incremental_state()
+        return self.__zobrist__ ^ zobrist.side_key(player_to_move)
+
     def get_point(self, index):
         """Get information about a specific point on the board.
 
@@ -116,59 +259,150 @@ class Board:
             return False
 
         # Remove piece from origin
+        origin_count = len(self.__points__[from_point])
         piece = self.__points__[from_point].pop()
+        self.__zobrist__ ^= zobrist.point_delta(
+            from_point, player, origin_count, origin_count - 1
+        )
 
         # Handle capture if there's exactly one opponent piece
-        destination_pieces = self.__points__[to_point]
-        if len(destination_pieces) == 1 and destination_pieces[0] != player:
-            captured_piece = self.__points__[to_point].pop()
-            captured_piece_bar_index = 1 if captured_piece == 1 else 0
-            self.__checker_bar__[captured_piece_bar_index].append(captured_piece)
+        self._capture_blot(to_point, player)
 
         # Place piece at destination
-        self.__points__[to_point].append(piece)
+        self._place_piece(to_point, piece)
+        self._leave(player, PIPS[player][from_point], origin_count == 1)
+        self._arrive(player, PIPS[player][to_point])
 
         return True
 
-    def is_all_pieces_in_home(self, player):
-        """Check if all player's pieces are in their home board.
+    def _capture_blot(self, to_point, player):
+        """Send a lone opponent piece on to_point to the bar, if there is one.
+
+        Args:
+            to_point (int): Destination point index (0-23)
+            player (int): Player number (1 or 2) making the move
+
+        Returns:
+            int: The captured piece, or None if nothing was captured
+        """
+        destination_pieces = self.__points__[to_point]
+        if len(destination_pieces) != 1 or destination_pieces[0] == player:
+            return None
+        captured_piece = destination_pieces.pop()
+        captured_piece_bar_index = 1 if captured_piece == 1 else 0
+        self.__checker_bar__[captured_piece_bar_index].append(captured_piece)
+        on_bar = self._bar_count(captured_piece)
+        self.__zobrist__ ^= zobrist.point_delta(to_point, captured_piece, 1, 0)
+        self.__zobrist__ ^= zobrist.bar_delta(captured_piece, on_bar - 1, on_bar)
+        self._arrive(captured_piece, BAR_PIPS)
+        self._leave(captured_piece, PIPS[captured_piece][to_point], True)
+        return captured_piece
+
+    def _bar_count(self, player):
+        """Count a player's pieces across both bar lists.
 
         Args:
             player (int): Player number (1 or 2)
 
         Returns:
-            bool: True if all pieces are in home, False otherwise
+            int: Number of the player's pieces on the bar
         """
-        # Check if any pieces on bar
-        player_bar_index = 1 if player == 1 else 0
-        if self.__checker_bar__[player_bar_index]:
-            return False
+        return sum(checker_bar.count(player) for checker_bar in self.__checker_bar__)
 
-        # Define home and outer board based on player
-        if player == 1:
-            home_range = range(18, 24)
-            outer_range = range(0, 18)
-        else:
-            home_range = range(0, 6)
-            outer_range = range(6, 24)
+    def _own_count(self, point, player):
+        """Count the player's checkers on a point.
 
-        # Check if any pieces outside home
-        for i in outer_range:
-            for piece in self.__points__[i]:
-                if piece == player:
-                    return False
+        Args:
+            point (int): Point index (0-23)
+            player (int): Player number (1 or 2)
 
-        # Make sure player has pieces in home
-        has_pieces = False
-        for i in home_range:
-            for piece in self.__points__[i]:
-                if piece == player:
-                    has_pieces = True
-                    break
-            if has_pieces:
-                break
+        Returns:
+            int: Checkers of player on the point
+        """
+        pieces = self.__points__[point]
+        return len(pieces) if pieces and pieces[0] == player else 0
+
+    def _arrive(self, player, pips):
+        """Update running totals for a checker arriving at a pip distance.
+
+        Args:
+            player (int): Player number (1 or 2)
+            pips (int): Pip distance of the new location (25 for the bar)
+
+        Returns:
+            None
+        """
+        index = player - 1
+        self.__pips__[index] += pips
+        if pips > 6:
+            self.__outside__[index] += 1
+        if pips > self.__back__[index]:
+            self.__back__[index] = pips
+
+    def _leave(self, player, pips, emptied):
+        """Update running totals for a checker leaving a pip distance.
+
+        Args:
+            player (int): Player number (1 or 2)
+            pips (int): Pip distance of the old location (25 for the bar)
+            emptied (bool): Whether the player has no checkers left there
+
+        Returns:
+            None
+        """
+        index = player - 1
+        self.__pips__[index] -= pips
+        if pips > 6:
+            self.__outside__[index] -= 1
+        if emptied and pips == self.__back__[index]:
+            self.__back__[index] = self._scan_back(player, pips)
 
-        return has_pieces
+    def _scan_back(self, player, below):
+        """Find the rearmost checker closer to home than a pip bound.
+
+        Args:
+            player (int): Player number (1 or 2)
+            below (int): Exclusive upper bound on the pip distance
+
+        Returns:
+            int: Pip distance of the rearmost checker (25 for the bar), or 0
+                if the player has no checkers left on the board
+        """
+        if below > BAR_PIPS and self._bar_count(player):
+            return BAR_PIPS
+        for pips in range(min(below, BAR_PIPS) - 1, 0, -1):
+            point = 24 - pips if player == 1 else pips - 1
+            if self._own_count(point, player):
+                return pips
+        return 0
+
+    def _place_piece(self, to_point, piece):
+        """Append a piece to a point and update the position hash.
+
+        Args:
+            to_point (int): Destination point index (0-23)
+            piece (int): Player number of the piece
+
+        Returns:
+            None
+        """
+        destination_pieces = self.__points__[to_point]
+        destination_pieces.append(piece)
+        count = len(destination_pieces)
+        self.__zobrist__ ^= zobrist.point_delta(to_point, piece, count - 1, count)
+
+    def is_all_pieces_in_home(self, player):
+        """Check if all player's pieces are in their home board.
+
+        Args:
+            player (int): Player number (1 or 2)
+
+        Returns:
+            bool: True if all pieces are in home, False otherwise
+        """
+        if self.DEBUG_SELF_CHECK:
+            self.verify_incremental_state()
+        return self.__outside__[player - 1] == 0 and self.__back__[player - 1] > 0
 
     def can_bear_off(self, point, player, dice_value=None):
         """Check if a player can bear off a piece from a specific point.
@@ -191,30 +425,11 @@ class Board:
         if dice_value is None:
             return True
 
-        # Calculate distance to off-board and the range to check for higher points
-        if player == 1:
-            distance = 23 - point + 1
-            higher_points_range = range(point + 1, 24)
-        else:
-            distance = point + 1
-            higher_points_range = range(0, point)
-
-        # Decide allowance with a single final return
-        allowed = False
-        if distance == dice_value:
-            allowed = True
-        elif distance < dice_value:
-            has_higher_piece = False
-            for i in higher_points_range:
-                for p in self.__points__[i]:
-                    if p == player:
-                        has_higher_piece = True
-                        break
-                if has_higher_piece:
-                    break
-            allowed = not has_higher_piece
-
-        return allowed
+        # A larger die only bears off the rearmost checker
+        distance = BEAR_OFF_DISTANCE[player][point]
+        return distance == dice_value or (
+            self.__back__[player - 1] == distance < dice_value
+        )
 
     def bear_off_piece(self, point, player):
         """Bear off a piece from the board.
@@ -234,6 +449,13 @@ class Board:
             piece = self.__points__[point].pop()
             player_off_index = 0 if player == 1 else 1
             self.__off_board__[player_off_index].append(piece)
+            remaining = len(self.__points__[point])
+            borne_off = len(self.__off_board__[player_off_index])
+            self.__zobrist__ ^= zobrist.point_delta(
+                point, player, remaining + 1, remaining
+            )
+            self.__zobrist__ ^= zobrist.off_delta(player, borne_off - 1, borne_off)
+            self._leave(player, PIPS[player][point], remaining == 0)
             return True
 
         return False
@@ -288,18 +510,88 @@ class Board:
             if piece == player:
                 piece_to_move = self.__checker_bar__[player_bar_index].pop(i)
                 break
+        on_bar = self._bar_count(player)
+        self.__zobrist__ ^= zobrist.bar_delta(player, on_bar + 1, on_bar)
 
         # Handle capture (after removing our piece from bar)
-        if len(destination_pieces) == 1 and destination_pieces[0] != player:
-            captured_piece = self.__points__[to_point].pop()
-            captured_piece_bar_index = 1 if captured_piece == 1 else 0
-            self.__checker_bar__[captured_piece_bar_index].append(captured_piece)
+        self._capture_blot(to_point, player)
 
         # Move our piece to the destination
-        self.__points__[to_point].append(piece_to_move)
+        self._place_piece(to_point, piece_to_move)
+        self._leave(player, BAR_PIPS, on_bar == 0)
+        self._arrive(player, PIPS[player][to_point])
 
         return True
 
+    def apply(self, move, player):
+        """Apply a move in place and return a token that undoes it exactly.
+
+        Args:
+            move: (from, to) pair or move dict; from may be "bar", to "off"
+            player (int): Player number (1 or 2)
+
+        Returns:
+            tuple: Undo token for revert, or None if the move is not legal
+        """
+        from_point, to_point = move_endpoints(move)
+        snapshot = (
+            self.__zobrist__,
+            tuple(self.__pips__),
+            tuple(self.__outside__),
+            tuple(self.__back__),
+        )
+        captured = None
+        if to_point != "off" and 0 <= to_point < 24:
+            pieces = self.__points__[to_point]
+            if len(pieces) == 1 and pieces[0] != player:
+                captured = pieces[0]
+
+        bar_position = None
+        if from_point == "bar":
+            checker_bar = self.__checker_bar__[1 if player == 1 else 0]
+            if player not in checker_bar:
+                return None
+            bar_position = checker_bar.index(player)
+            success = self.enter_from_bar(to_point, player)
+        elif to_point == "off":
+            success = self.bear_off_piece(from_point, player)
+        else:
+            success = self.move_piece(from_point, to_point, player)
+
+        if not success:
+            return None
+        return (from_point, to_point, player, captured, bar_position, snapshot)
+
+    def revert(self, token):
+        """Undo a move applied with apply, including any captured blot.
+
+        Tokens must be reverted in the reverse order they were produced.
+
+        Args:
+            token (tuple): Undo token returned by apply
+
+        Returns:
+            None
+        """
+        from_point, to_point, player, captured, bar_position, snapshot = token
+        if to_point == "off":
+            piece = self.__off_board__[0 if player == 1 else 1].pop()
+        else:
+            piece = self.__points__[to_point].pop()
+            if captured is not None:
+                self.__checker_bar__[1 if captured == 1 else 0].pop()
+                self.__points__[to_point].append(captured)
+
+        if from_point == "bar":
+            checker_bar = self.__checker_bar__[1 if player == 1 else 0]
+            checker_bar.insert(bar_position, piece)
+        else:
+            self.__points__[from_point].append(piece)
+        self.__zobrist__ = snapshot[0]
+        self.__pips__ = list(snapshot[1])
+        self.__outside__ = list(snapshot[2])
+        self.__back__ = list(snapshot[3])
+
     def get_possible_moves(self, player, dice_values):
         """Get all possible moves for a player given dice values.
 
@@ -310,81 +602,153 @@ class Board:
         Returns:
             list: List of possible moves
         """
+        return [
+            {"from": from_point, "to": to_point, "dice": dice}
+            for from_point, to_point, dice in self.iter_possible_moves(
+                player, dice_values
+            )
+        ]
+
+    def iter_possible_moves(self, player, dice_values):
+        """Lazily yield the moves of get_possible_moves, in the same order.
+
+        The board must not change while the iterator is in use, except for
+        changes undone (e.g. apply then revert) before the next step.
+
+        Args:
+            player (int): Player number (1 or 2)
+            dice_values (list): List of dice values to use
+
+        Yields:
+            tuple: (from, to, dice), where from may be "bar" and to "off"
+        """
         player_bar_index = 1 if player == 1 else 0
         if self.__checker_bar__[player_bar_index]:
             # Must enter from bar first
-            return self._get_bar_entry_moves(player, dice_values)
+            yield from self._iter_bar_entry_moves(player, dice_values)
+            return
 
-        moves = []
-        moves.extend(self._get_bear_off_moves(player, dice_values))
-        moves.extend(self._get_regular_moves(player, dice_values))
-        return moves
+        yield from self._iter_bear_off_moves(player, dice_values)
+        yield from self._iter_regular_moves(player, dice_values)
 
-    def _get_bar_entry_moves(self, player, dice_values):
-        """Generate legal bar entry moves for a player and dice values.
+    def count_possible_moves(self, player, dice_values):
+        """Count the moves of get_possible_moves without building them.
 
         Args:
             player (int): Player number (1 or 2)
             dice_values (list): List of dice values to use
 
         Returns:
-            list: List of legal bar entry moves
+            int: Number of possible moves
+        """
+        return sum(1 for _ in self.iter_possible_moves(player, dice_values))
+
+    def _iter_bar_entry_moves(self, player, dice_values):
+        """Yield legal bar entry moves for a player and dice values.
+
+        Args:
+            player (int): Player number (1 or 2)
+            dice_values (list): List of dice values to use
+
+        Yields:
+            tuple: ("bar", entry point, dice)
         """
         # REGLA BACKGAMMON: Las fichas RE-ENTRAN por la HOME del OPONENTE
-        moves = []
+        entry_points = ENTRY_POINTS[player]
         for dice in dice_values:
-            entry_point = dice - 1 if player == 1 else 24 - dice
-            if 0 <= entry_point < 24:
-                destination_pieces = self.__points__[entry_point]
-                if (
-                    not destination_pieces
-                    or len(destination_pieces) < 2
-                    or destination_pieces[0] == player
-                ):
-                    moves.append({"from": "bar", "to": entry_point, "dice": dice})
-        return moves
-
-    def _get_bear_off_moves(self, player, dice_values):
-        """Generate legal bearing-off moves for a player and dice values.
+            entry_point = entry_points[dice]
+            destination_pieces = self.__points__[entry_point]
+            if len(destination_pieces) < 2 or destination_pieces[0] == player:
+                yield ("bar", entry_point, dice)
+
+    def _iter_bear_off_moves(self, player, dice_values):
+        """Yield legal bearing-off moves for a player and dice values.
 
         Args:
             player (int): Player number (1 or 2)
             dice_values (list): List of dice values to use
 
-        Returns:
-            list: List of legal bearing-off moves
+        Yields:
+            tuple: (point, "off", dice)
         """
-        moves = []
         if not self.is_all_pieces_in_home(player):
-            return moves
-        home_range = range(18, 24) if player == 1 else range(0, 6)
-        for point in home_range:
-            if self.__points__[point] and self.__points__[point][0] == player:
+            return
+        back = self.__back__[player - 1]
+        distances = BEAR_OFF_DISTANCE[player]
+        for point in HOME_POINTS[player]:
+            if self._own_count(point, player):
+                distance = distances[point]
                 for dice in dice_values:
-                    if self.can_bear_off(point, player, dice):
-                        moves.append({"from": point, "to": "off", "dice": dice})
-        return moves
+                    if distance == dice or back == distance < dice:
+                        yield (point, "off", dice)
 
-    def _get_regular_moves(self, player, dice_values):
-        """Generate legal on-board moves (non-bar, non-bear-off).
+    def _iter_regular_moves(self, player, dice_values):
+        """Yield legal on-board moves (non-bar, non-bear-off).
 
         Args:
             player (int): Player number (1 or 2)
             dice_values (list): List of dice values to use
 
-        Returns:
-            list: List of legal regular moves
+        Yields:
+            tuple: (from point, to point, dice)
         """
-        moves = []
+        points = self.__points__
+        destinations = DESTINATIONS[player]
         for from_point in range(24):
-            if self.__points__[from_point] and self.__points__[from_point][0] == player:
+            if points[from_point] and points[from_point][0] == player:
+                row = destinations[from_point]
                 for dice in dice_values:
-                    to_point = from_point + dice if player == 1 else from_point - dice
-                    if 0 <= to_point < 24 and self.can_move(
-                        from_point, to_point, player
-                    ):
-                        moves.append({"from": from_point, "to": to_point, "dice": dice})
-        return moves
+                    to_point = row[dice]
+                    if to_point is None:
+                        continue
+                    destination_pieces = points[to_point]
+                    if len(destination_pieces) < 2 or destination_pieces[0] == player:
+                        yield (from_point, to_point, dice)
+
+    def has_any_move(self, player, dice_values):
+        """Check if get_possible_moves would return at least one move.
+
+        Read-only and stops at the first legal move, without building any
+        move dictionaries. Empty and opponent points are skipped on sight.
+
+        Args:
+            player (int): Player number (1 or 2)
+            dice_values (list): List of dice values to use
+
+        Returns:
+            bool: True if at least one single-die move is legal
+        """
+        dice = set(dice_values)
+        points = self.__points__
+        player_bar_index = 1 if player == 1 else 0
+        if self.__checker_bar__[player_bar_index]:
+            entry_points = ENTRY_POINTS[player]
+            for dice_value in dice:
+                pieces = points[entry_points[dice_value]]
+                if len(pieces) < 2 or pieces[0] == player:
+                    return True
+            return False
+
+        destinations = DESTINATIONS[player]
+        for from_point, pieces in enumerate(points):
+            if pieces and pieces[0] == player:
+                row = destinations[from_point]
+                for dice_value in dice:
+                    to_point = row[dice_value]
+                    if to_point is None:
+                        continue
+                    pieces = points[to_point]
+                    if len(pieces) < 2 or pieces[0] == player:
+                        return True
+
+        if not self.is_all_pieces_in_home(player):
+            return False
+        return any(
+            self.can_bear_off(point, player, dice_value)
+            for point in HOME_POINTS[player]
+            if points[point] and points[point][0] == player
+            for dice_value in dice
+        )
 
     def is_game_over(self):
         """Check if the game is over (all pieces of a player are off the board).
@@ -459,6 +823,7 @@ class Board:
         self.__points__ = [point.copy() for point in state["points"]]
         self.__checker_bar__ = [checker_bar.copy() for checker_bar in state["bar"]]
         self.__off_board__ = [off.copy() for off in state["off_board"]]
+        self.refresh_incremental_state()
 
     def copy(self):
         """Create a deep copy of the board.
@@ -470,4 +835,8 @@ class Board:
         new_board.__points__ = copy.deepcopy(self.__points__)
         new_board.__checker_bar__ = copy.deepcopy(self.__checker_bar__)
         new_board.__off_board__ = copy.deepcopy(self.__off_board__)
+        new_board.__zobrist__ = self.__zobrist__
+        new_board.__pips__ = self.__pips__.copy()
+        new_board.__outside__ = self.__outside__.copy()
+        new_board.__back__ = self.__back__.copy()
         return new_board
@@ -0,0 +1,265 @@
+"""Board batch module for the Backgammon game.
+
+This module contains the BoardBatch class, which stores many positions as
+one (N, 26) int8 NumPy array plus the side to move of each, and encodes the
+whole batch into numeric features at once: checker counts, one-hot
+truncated counts, pip counts and blot masks. Batches are built from Board
+or CompactBoard instances, from saved board or game states, or from
+CompactBoard cell arrays, so learned evaluators and analytics jobs need no
+Python loop per position after loading.
+"""
+
+import numpy as np
+
+from .board import Board
+from .compact_board import (
+    BAR_CELLS,
+    CELL_COUNT,
+    CHECKERS_PER_PLAYER,
+    OFF_CELLS,
+    POINT_COUNT,
+)
+from .move_tables import BAR_PIPS
+
+# Points 0 to 23 (positive for player 1, negative for player 2), then the
+# player 1 and player 2 bars, as in the first cells of a CompactBoard
+BATCH_CELLS = POINT_COUNT + 2
+# Slots per side in raw_counts: the points, the bar, then the checkers off
+SIDE_SLOTS = POINT_COUNT + 2
+BAR_SLOT = POINT_COUNT
+OFF_SLOT = POINT_COUNT + 1
+
+
+def _board_cells(board):
+    """Get the batch cells of one board.
+
+    Args:
+        board: Board or CompactBoard instance
+
+    Returns:
+        bytes: BATCH_CELLS int8 cells
+    """
+    if not isinstance(board, Board):
+        return bytes(board.__cells__[:BATCH_CELLS])
+    cells = [
+        (len(point) if point[0] == 1 else -len(point)) if point else 0
+        for point in board.__points__
+    ]
+    bars = [0, 0]
+    for checker_bar in board.__checker_bar__:
+        for piece in checker_bar:
+            bars[piece - 1] += 1
+    return bytes(np.array(cells + bars, dtype=np.int8))
+
+
+def _state_player(state, player):
+    """Get the board state and side to move of a saved state.
+
+    Args:
+        state (dict): Board state, or game state as saved by
+            BackgammonGame.get_serializable_state
+        player (int, optional): Side to move of a board state
+
+    Returns:
+        tuple: (board state, player number)
+
+    Raises:
+        ValueError: If a board state comes without a side to move
+    """
+    if "board" in state:
+        current = state["current_player"]["name"]
+        return state["board"], 1 if current == state["player1"]["name"] else 2
+    if player is None:
+        raise ValueError("Board states need the side to move")
+    return state, player
+
+
+class BoardBatch:
+    """Many backgammon positions held in NumPy arrays.
+
+    Cells follow the CompactBoard layout without the off-trays, which are
+    derived from the 15 checkers of each side. Encoders describe every
+    position from the point of view of its side to move: the first side is
+    the player on roll, and points are ordered along that player's direction
+    of travel, so index 0 is the point farthest from its home board.
+    """
+
+    def __init__(self, cells, players):
+        """Initialize the batch.
+
+        Args:
+            cells (numpy.ndarray): (N, BATCH_CELLS) cells
+            players: Side to move of each position (1 or 2), or one player
+                number for all of them
+
+        Raises:
+            ValueError: If the cells or players have the wrong shape or values
+        """
+        cells = np.asarray(cells, dtype=np.int8)
+        if cells.ndim != 2 or cells.shape[1] != BATCH_CELLS:
+            raise ValueError(f"Batch cells must have shape (N, {BATCH_CELLS})")
+        players = np.broadcast_to(np.asarray(players, dtype=np.int8), len(cells))
+        if not np.isin(players, (1, 2)).all():
+            raise ValueError("Players must be 1 or 2")
+        self.__cells__ = cells
+        self.__players__ = players.copy()
+
+    @classmethod
+    def from_boards(cls, boards, players):
+        """Build a batch from boards.
+
+        Args:
+            boards (list): Board or CompactBoard instances
+            players: Side to move of each board, or one for all of them
+
+        Returns:
+            BoardBatch: The positions of the boards
+        """
+        data = b"".join(_board_cells(board) for board in boards)
+        cells = np.frombuffer(data, dtype=np.int8).reshape(-1, BATCH_CELLS)
+        return cls(cells, players)
+
+    @classmethod
+    def from_states(cls, states, players=None):
+        """Build a batch from saved states.
+
+        Args:
+            states (list): Game states, which carry the side to move, or
+                board states as returned by get_board_state
+            players (optional): Side to move of each board state, or one
+                for all of them. Defaults to None, for game states.
+
+        Returns:
+            BoardBatch: The positions of the states
+
+        Raises:
+            ValueError: If a board state comes without a side to move
+        """
+        if players is None or np.ndim(players) == 0:
+            players = [players] * len(states)
+        pairs = [_state_player(state, player) for state, player in zip(states, players)]
+        cells = np.zeros((len(pairs), BATCH_CELLS), dtype=np.int8)
+        for row, (state, _) in zip(cells, pairs):
+            for index, pieces in enumerate(state["points"]):
+                if pieces:
+                    row[index] = len(pieces) if pieces[0] == 1 else -len(pieces)
+            for checker_bar in state["bar"]:
+                for piece in checker_bar:
+                    row[BAR_CELLS[piece - 1]] += 1
+        return cls(cells, [player for _, player in pairs])
+
+    @classmethod
+    def from_cells(cls, cells, players):
+        """Build a batch from CompactBoard cell arrays.
+
+        Args:
+            cells (numpy.ndarray): (N, CELL_COUNT) CompactBoard cells
+            players: Side to move of each position, or one for all of them
+
+        Returns:
+            BoardBatch: The positions of the cells
+        """
+        cells = np.asarray(cells, dtype=np.int8).reshape(-1, CELL_COUNT)
+        return cls(cells[:, :BATCH_CELLS], players)
+
+    def __len__(self):
+        """Get the number of positions.
+
+        Returns:
+            int: Positions in the batch
+        """
+        return len(self.__cells__)
+
+    def get_cells(self):
+        """Get the batch cells.
+
+        Returns:
+            numpy.ndarray: (N, BATCH_CELLS) int8 cells
+        """
+        return self.__cells__
+
+    def get_players(self):
+        """Get the side to move of each position.
+
+        Returns:
+            numpy.ndarray: (N,) int8 player numbers
+        """
+        return self.__players__
+
+    def to_cells(self):
+        """Get the positions as CompactBoard cell arrays.
+
+        Returns:
+            numpy.ndarray: (N, CELL_COUNT) int8 cells, with the off-trays
+        """
+        cells = np.zeros((len(self), CELL_COUNT), dtype=np.int8)
+        cells[:, :BATCH_CELLS] = self.__cells__
+        points = self.__cells__[:, :POINT_COUNT]
+        for side, on_points in enumerate((points.clip(0), (-points).clip(0))):
+            on_board = on_points.sum(axis=1) + self.__cells__[:, BAR_CELLS[side]]
+            cells[:, OFF_CELLS[side]] = CHECKERS_PER_PLAYER - on_board
+        return cells
+
+    def raw_counts(self):
+        """Count the checkers of each side in every slot.
+
+        Returns:
+            numpy.ndarray: (N, 2, SIDE_SLOTS) int8 counts for the side to
+                move and its opponent, on each point in the mover's
+                direction of travel, then on the bar, then borne off
+        """
+        second = self.__players__[:, None] == 2
+        points = self.__cells__[:, :POINT_COUNT]
+        points = np.where(second, -points[:, ::-1], points)
+        bars = self.__cells__[:, BAR_CELLS]
+        counts = np.empty((len(self), 2, SIDE_SLOTS), dtype=np.int8)
+        counts[:, 0, :POINT_COUNT] = points.clip(0)
+        counts[:, 1, :POINT_COUNT] = (-points).clip(0)
+        counts[:, :, BAR_SLOT] = np.where(second, bars[:, ::-1], bars)
+        on_board = counts[:, :, : BAR_SLOT + 1].sum(axis=2)
+        counts[:, :, OFF_SLOT] = CHECKERS_PER_PLAYER - on_board
+        return counts
+
+    def one_hot(self, limit=4):
+        """Encode the checkers on each point and the bar as one-hot units.
+
+        Args:
+            limit (int, optional): Units per slot. Unit k is set for exactly
+                k + 1 checkers, except the last, which is set for limit or
+                more. Defaults to 4.
+
+        Returns:
+            numpy.ndarray: (N, 2, POINT_COUNT + 1, limit) uint8 units, in
+                the order of raw_counts
+
+        Raises:
+            ValueError: If limit is below 1
+        """
+        if limit < 1:
+            raise ValueError("One-hot encodings need at least one unit")
+        counts = np.minimum(self.raw_counts()[:, :, : BAR_SLOT + 1], limit)
+        return (counts[..., None] == np.arange(1, limit + 1)).astype(np.uint8)
+
+    def pip_counts(self):
+        """Count the pips each side needs to bear off.
+
+        Returns:
+            numpy.ndarray: (N, 2) int32 pip counts of the side to move and
+                its opponent
+        """
+        counts = self.raw_counts().astype(np.int32)
+        travel = np.arange(POINT_COUNT)
+        pips = np.empty((len(self), 2), dtype=np.int32)
+        pips[:, 0] = counts[:, 0, :POINT_COUNT] @ (POINT_COUNT - travel)
+        pips[:, 1] = counts[:, 1, :POINT_COUNT] @ (travel + 1)
+        pips += BAR_PIPS * counts[:, :, BAR_SLOT]
+        return pips
+
+    def blot_masks(self):
+        """Find the points holding a single checker.
+
+        Returns:
+            numpy.ndarray: (N, 2, POINT_COUNT) bool masks of the blots of the
+                side to move and its opponent, in the order of raw_counts
+        """
+        return self.raw_counts()[:, :, :POINT_COUNT] == 1
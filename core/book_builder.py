@@ -0,0 +1,182 @@
+"""Opening book builder module for the Backgammon game.
+
+This module contains BookBuilder, which finds the best plays of the first
+two plies of a game by rollouts and writes them as an opening book. The
+first ply is each of the 15 non-double opening rolls from the initial
+position; the second is each of the 21 replies to the best play of every
+opening roll. Positions are solved with player 1 opening, and the entries
+of player 2 opening are their mirror images.
+
+Candidate plays are the best few at 0 ply by the rollout bot's evaluator.
+Each is rolled out from the position after it with the same seed, so the
+candidates of a roll are compared on the same dice. Build the book at
+opening_book.DEFAULT_PATH with
+
+    python -m core.book_builder [path] [trials] [candidates]
+"""
+
+import logging
+import sys
+
+from .bot import GreedyBot
+from .compact_board import CompactBoard
+from .move_generator import generate_plays
+from .opening_book import (
+    DEFAULT_PATH,
+    book_key,
+    mirror_board,
+    mirror_play,
+    write_book,
+)
+from .rollout import RolloutEngine
+from .search import ROLLS
+
+LOGGER = logging.getLogger(__name__)
+
+# The opening rolls; a game never starts with a double
+OPENING_ROLLS = tuple(roll for roll, _ in ROLLS if roll[0] != roll[1])
+DEFAULT_TRIALS = 1296
+DEFAULT_CANDIDATES = 4
+
+
+class BookBuilder:
+    """Rollout search of the best plays of the first two plies of a game."""
+
+    def __init__(
+        self, engine=None, trials=DEFAULT_TRIALS, candidates=DEFAULT_CANDIDATES, seed=0
+    ):
+        """Initialize the builder.
+
+        Args:
+            engine (RolloutEngine, optional): Engine rolling the candidates
+                out; its bot needs a get_evaluator method. Defaults to one
+                with rotated dice and a GreedyBot without opening books.
+            trials (int, optional): Games per candidate. Defaults to
+                DEFAULT_TRIALS.
+            candidates (int, optional): Plays rolled out per roll. Defaults
+                to DEFAULT_CANDIDATES.
+            seed (int, optional): Rollout seed. Defaults to 0.
+
+        Raises:
+            ValueError: If trials or candidates is lower than 1
+        """
+        if trials < 1 or candidates < 1:
+            raise ValueError("Trials and candidates must be at least 1")
+        if engine is None:
+            engine = RolloutEngine(GreedyBot(), variance_reduction=("rotated",))
+        self.__engine__ = engine
+        self.__trials__ = trials
+        self.__candidates__ = candidates
+        self.__seed__ = seed
+
+    def best_play(self, board, player, roll):
+        """Find the play of a roll with the best rollout equity.
+
+        Args:
+            board (CompactBoard): Position; it is left unchanged
+            player (int): Player number (1 or 2) on roll
+            roll (tuple): The two dice values (die1, die2)
+
+        Returns:
+            tuple: (play, equity, std_error) of the best candidate, with the
+                equity for player, or None if the player cannot move
+        """
+        plays = generate_plays(board, player, roll)
+        if not plays:
+            return None
+        evaluator = self.__engine__.get_bot().get_evaluator()
+        scores = evaluator.evaluate_plays(board, player, plays)
+        ranked = sorted(range(len(plays)), key=scores.__getitem__, reverse=True)
+        results = []
+        for index in ranked[: self.__candidates__]:
+            after = board.copy()
+            for move in plays[index]:
+                after.apply(move, player)
+            stats = self.__engine__.rollout(
+                after, 3 - player, self.__trials__, self.__seed__
+            )
+            equity = -stats["equity"]
+            results.append((tuple(plays[index]), equity, stats["std_error"]))
+        return max(results, key=lambda result: result[1])
+
+    def build(self, opening_rolls=OPENING_ROLLS):
+        """Solve the opening rolls and the replies to them.
+
+        Args:
+            opening_rolls (tuple, optional): Rolls of the first ply. Defaults
+                to OPENING_ROLLS.
+
+        Returns:
+            list: (key, play, equity, std_error) entries, as taken by
+                write_book, for either player opening
+        """
+        board = CompactBoard()
+        board.setup_initial_position()
+        solved = []
+        for roll in opening_rolls:
+            opening = self._solve(board, 1, roll, solved)
+            after = board.copy()
+            for move in opening:
+                after.apply(move, 1)
+            for reply, _ in ROLLS:
+                self._solve(after, 2, reply, solved)
+
+        entries = []
+        for position, player, roll, (play, equity, std_error) in solved:
+            entries.append((book_key(position, player, roll), play, equity, std_error))
+            entries.append(
+                (
+                    book_key(mirror_board(position), 3 - player, roll),
+                    mirror_play(play),
+                    equity,
+                    std_error,
+                )
+            )
+        return entries
+
+    def _solve(self, board, ply, roll, solved):
+        """Find the best play of a roll and record it.
+
+        Args:
+            board (CompactBoard): Position; it is left unchanged
+            ply (int): Ply of the game, 1 or 2; player 1 opens, so plays the
+                odd plies
+            roll (tuple): The two dice values (die1, die2)
+            solved (list): (board, player, roll, best) records to append to
+
+        Returns:
+            tuple: The best play, empty if the player cannot move
+        """
+        player = 2 - ply % 2
+        best = self.best_play(board, player, roll)
+        if best is None:
+            return ()
+        solved.append((board, player, roll, best))
+        LOGGER.info(
+            "Ply %d, %d-%d: %s %+.3f (std error %.3f)",
+            ply,
+            roll[0],
+            roll[1],
+            best[0],
+            best[1],
+            best[2],
+        )
+        return best[0]
+
+
+def main():
+    """Build the opening book from the command line.
+
+    Returns:
+        None
+    """
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    trials = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_TRIALS
+    candidates = int(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_CANDIDATES
+    count = write_book(BookBuilder(trials=trials, candidates=candidates).build(), path)
+    print(f"Wrote {count} entries to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Bot module for the Backgammon game.
+
+This module contains the GreedyBot class, a computer player that scores every
+legal full play for a roll with an Evaluator and picks the best one unless
+an opening book holds the position and roll, and
+play_game, a headless game loop for bot-versus-bot simulation.
+"""
+
+from .compact_board import CompactBoard
+from .dice import Dice
+from .evaluator import HeuristicEvaluator, game_result
+from .move_generator import generate_plays
+from .opening_book import as_books, consult
+
+
+class GreedyBot:
+    """Computer player choosing the play with the best 0-ply evaluation."""
+
+    def __init__(self, evaluator=None, book=None):
+        """Initialize the bot.
+
+        Args:
+            evaluator (Evaluator, optional): Position evaluator. Defaults to a
+                new HeuristicEvaluator.
+            book (optional): Opening book, or sequence of books tried in
+                order, whose plays are taken without evaluating, such as
+                opening_book.default_books(). Defaults to None, without
+                books.
+        """
+        self.__evaluator__ = HeuristicEvaluator() if evaluator is None else evaluator
+        self.__book__ = as_books(book)
+
+    def get_evaluator(self):
+        """Get the evaluator scoring the plays.
+
+        Returns:
+            Evaluator: The bot's evaluator
+        """
+        return self.__evaluator__
+
+    def choose_play(self, board, player, roll, plays=None):
+        """Choose the best legal play for a roll.
+
+        Args:
+            board: Board or CompactBoard to play on; it is left unchanged
+            player (int): Player number (1 or 2)
+            roll (tuple): The two dice values (die1, die2)
+            plays (list, optional): Legal plays, if already generated
+
+        Returns:
+            tuple: The chosen play as (from, to, die) moves; empty if the
+                player cannot move
+        """
+        if not isinstance(board, CompactBoard):
+            board = CompactBoard.from_board(board)
+        play = consult(self.__book__, board, player, roll)
+        if play is not None:
+            return play
+        if plays is None:
+            plays = generate_plays(board, player, roll)
+        if len(plays) <= 1:
+            return tuple(plays[0]) if plays else ()
+        scores = self.__evaluator__.evaluate_plays(board, player, plays)
+        best = max(range(len(plays)), key=scores.__getitem__)
+        return tuple(plays[best])
+
+    def play_turn(self, game):
+        """Play the current player's whole turn in a BackgammonGame.
+
+        Rolls if needed, executes the chosen play and ends the turn unless the
+        game is over. The dice of the turn must not be partly used.
+
+        Args:
+            game (BackgammonGame): Game to play in
+
+        Returns:
+            tuple: The play executed (empty if no move was possible), or None
+                if the turn could not be played
+        """
+        if game.is_game_over():
+            return None
+        if game.__last_roll__ is None:
+            game.roll_dice()
+
+        player_num = 1 if game.__current_player__ == game.__player1__ else 2
+        play = self.choose_play(
+            game.__board__, player_num, game.__last_roll__, game.get_legal_plays()
+        )
+        if not game.execute_turn(list(play)):
+            return None
+
+        game.__last_roll__ = None
+        game.__available_moves__ = []
+        if not game.is_game_over():
+            game.switch_current_player()
+        return play
+
+
+def play_game(bots, board=None, player=1, dice=None, max_turns=10000):
+    """Play a game between two bots without a BackgammonGame.
+
+    Args:
+        bots (tuple): Bots for player 1 and player 2 (may be the same bot)
+        board (CompactBoard, optional): Starting position, modified in place.
+            Defaults to the initial position.
+        player (int, optional): Player on roll. Defaults to 1.
+        dice (Dice, optional): Dice to roll. Defaults to a new Dice.
+        max_turns (int, optional): Turn limit guarding against endless games
+
+    Returns:
+        tuple: (winner, points) as returned by evaluator.game_result, or None
+            if max_turns was reached first
+    """
+    if board is None:
+        board = CompactBoard()
+        board.setup_initial_position()
+    dice = Dice() if dice is None else dice
+    for _ in range(max_turns):
+        result = game_result(board)
+        if result is not None:
+            return result
+        roll = dice.roll()
+        for move in bots[player - 1].choose_play(board, player, roll):
+            board.apply(move, player)
+        player = 3 - player
+    return game_result(board)
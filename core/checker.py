@@ -14,6 +14,8 @@ class Checker:
 
     TOTAL_POINTS = 24
 
+    __slots__ = ("__color__", "__position__", "__is_on_bar__", "__is_borne_off__")
+
     def __init__(self, color: str) -> None:
         """Initialize a checker with a specified color.
 
@@ -30,6 +32,19 @@ class Checker:
         self.__is_on_bar__: bool = False
         self.__is_borne_off__: bool = False
 
+    def get_location(self) -> int | str | None:
+        """Get where the checker currently is.
+
+        Returns:
+            int | str | None: The point number (1-24), 'bar', 'off', or None
+                if the checker has not been placed.
+        """
+        if self.__is_on_bar__:
+            return "bar"
+        if self.__is_borne_off__:
+            return "off"
+        return self.__position__
+
     def place_on_point(self, position: int) -> None:
         """Place the checker on a specific point on the board.
 
@@ -0,0 +1,148 @@
+"""Checker registry module for the Backgammon game.
+
+This module contains the CheckerRegistry class, an index from location (point
+number, bar or off) to the Checker objects of one player. The owner reports
+every relocation it makes, so lookups cost only the number of checkers
+actually at the requested location instead of a scan over all fifteen.
+A checker moved through its own methods without a matching relocate
+call leaves the index stale until rebuild is called.
+"""
+
+
+class CheckerRegistry:
+    """Location index over a fixed set of Checker objects.
+
+    Locations use the Checker.get_location values: a point number (1-24),
+    'bar', 'off', or None for checkers that have not been placed. After
+    moving a tracked checker without reporting it to relocate, call rebuild;
+    until then lookups answer from the old locations. DEBUG_SELF_CHECK turns
+    such stale lookups into errors.
+    """
+
+    # When True, every lookup first verifies the index against the checkers'
+    # own locations, so a missed relocate raises instead of answering wrongly
+    DEBUG_SELF_CHECK = False
+
+    def __init__(self, checkers):
+        """Index checkers by their current locations.
+
+        Args:
+            checkers (list): Checker objects to track
+
+        Returns:
+            None
+        """
+        self.__checkers__ = checkers
+        self.__locations__ = {}  # location -> list of checkers there
+        self.rebuild()
+
+    def rebuild(self):
+        """Index every tracked checker again from its current state.
+
+        Needed after checkers were moved without reporting it to relocate.
+
+        Returns:
+            None
+        """
+        self.__locations__.clear()
+        for checker in self.__checkers__:
+            self._add(checker, checker.get_location())
+
+    def verify(self):
+        """Check the index against the current location of every checker.
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: If a checker is indexed under another location
+        """
+        indexed = {
+            id(checker): location
+            for location, bucket in self.__locations__.items()
+            for checker in bucket
+        }
+        for checker in self.__checkers__:
+            location = checker.get_location()
+            if id(checker) not in indexed or indexed[id(checker)] != location:
+                raise RuntimeError(
+                    f"Checker at {location!r} is indexed at "
+                    f"{indexed.get(id(checker))!r}"
+                )
+
+    def _add(self, checker, location):
+        """Add a checker to the bucket of a location.
+
+        Args:
+            checker (Checker): Checker to add
+            location: Location key
+
+        Returns:
+            None
+        """
+        self.__locations__.setdefault(location, []).append(checker)
+
+    def relocate(self, checker, old_location):
+        """Move a checker between buckets after its state changed.
+
+        Args:
+            checker (Checker): The relocated checker
+            old_location: Location key before the change
+
+        Returns:
+            None
+        """
+        new_location = checker.get_location()
+        if new_location == old_location:
+            return
+        bucket = self.__locations__[old_location]
+        # Remove by identity: Checker equality compares state, so two
+        # checkers on the same point are equal
+        for index, other in enumerate(bucket):
+            if other is checker:
+                del bucket[index]
+                break
+        if not bucket:
+            del self.__locations__[old_location]
+        self._add(checker, new_location)
+
+    def get_checkers(self, location):
+        """Get the checkers at a location, in arrival order.
+
+        Args:
+            location: A point number (1-24), 'bar', 'off' or None
+
+        Returns:
+            list: Checker objects at the location
+        """
+        if self.DEBUG_SELF_CHECK:
+            self.verify()
+        bucket = self.__locations__.get(location)
+        return list(bucket) if bucket else []
+
+    def first_checker(self, location):
+        """Get the checker that arrived first at a location.
+
+        Args:
+            location: A point number (1-24), 'bar', 'off' or None
+
+        Returns:
+            Checker: The checker, or None if the location is empty
+        """
+        if self.DEBUG_SELF_CHECK:
+            self.verify()
+        bucket = self.__locations__.get(location)
+        return bucket[0] if bucket else None
+
+    def count(self, location):
+        """Count the checkers at a location.
+
+        Args:
+            location: A point number (1-24), 'bar', 'off' or None
+
+        Returns:
+            int: Number of checkers at the location
+        """
+        if self.DEBUG_SELF_CHECK:
+            self.verify()
+        return len(self.__locations__.get(location, ()))
@@ -0,0 +1,790 @@
+"""Compact board module for the Backgammon game.
+
+This module contains the CompactBoard class, an alternate board engine that
+stores signed checker counts instead of one Python int per checker. It keeps
+the public API of Board so it can be used wherever a Board is expected.
+"""
+
+# pylint: disable=duplicate-code  # mirrors Board's public API by design
+from array import array
+
+from . import zobrist
+from .board import move_endpoints
+from .move_tables import (
+    BAR_PIPS,
+    BEAR_OFF_DISTANCE,
+    DESTINATIONS,
+    ENTRY_POINTS,
+    HOME_POINTS,
+    OUTER_POINTS,
+    PIPS,
+)
+
+# Layout of the cell array: 24 points, then the bars, then the off-trays.
+# Points hold positive counts for player 1 and negative counts for player 2.
+POINT_COUNT = 24
+BAR_CELLS = (24, 25)  # Player 1 bar, player 2 bar
+OFF_CELLS = (26, 27)  # Player 1 off-tray, player 2 off-tray
+CELL_COUNT = 28
+CHECKERS_PER_PLAYER = 15
+
+INITIAL_POSITION = (
+    (0, 2),
+    (11, 5),
+    (16, 3),
+    (18, 5),
+    (23, -2),
+    (12, -5),
+    (7, -3),
+    (5, -5),
+)
+
+
+class CompactBoard:
+    """Backgammon board backed by a signed-count ``array('b')``.
+
+    Each point stores how many checkers sit on it, positive for player 1 and
+    negative for player 2. Bars and off-trays store plain counts per player.
+    As on Board, call refresh_incremental_state after editing __cells__
+    directly.
+    """
+
+    # When True, get_pip_count, get_zobrist_hash and is_all_pieces_in_home,
+    # through which can_bear_off goes, verify the incremental state against a
+    # recount, so a stale direct edit raises instead of answering wrongly
+    DEBUG_SELF_CHECK = False
+
+    __slots__ = ("__cells__", "__zobrist__", "__pips__", "__outside__", "__back__")
+
+    def __init__(self):
+        """Initialize an empty compact board.
+
+        Returns:
+            None
+        """
+        self.__cells__ = array("b", bytes(CELL_COUNT))
+        self.__zobrist__ = 0  # Position hash, updated incrementally
+        self.__pips__ = [0, 0]  # Running pip totals for players 1 and 2
+        self.__outside__ = [0, 0]  # Checkers outside home (bar included)
+        self.__back__ = [0, 0]  # Pip distance of each player's rearmost checker
+
+    def setup_initial_position(self):
+        """Set up the standard backgammon starting position.
+
+        Returns:
+            None
+        """
+        self.__cells__ = array("b", bytes(CELL_COUNT))
+        for point, count in INITIAL_POSITION:
+            self.__cells__[point] = count
+        self.refresh_incremental_state()
+
+    def refresh_incremental_state(self):
+        """Recompute incrementally maintained state from the cell array.
+
+        Call this after editing __cells__ directly instead of through the
+        move methods.
+
+        Returns:
+            None
+        """
+        cells = self.__cells__
+        value = 0
+        for point in range(POINT_COUNT):
+            count = cells[point]
+            if count > 0:
+                value ^= zobrist.POINT_KEYS[point][0][count]
+            elif count < 0:
+                value ^= zobrist.POINT_KEYS[point][1][-count]
+        for player in (1, 2):
+            value ^= zobrist.BAR_KEYS[player - 1][cells[BAR_CELLS[player - 1]]]
+            value ^= zobrist.OFF_KEYS[player - 1][cells[OFF_CELLS[player - 1]]]
+        self.__zobrist__ = value
+        self.__pips__ = [self._count_pips(1), self._count_pips(2)]
+        self.__outside__ = [
+            cells[BAR_CELLS[player - 1]]
+            + sum(self._own_count(i, player) for i in OUTER_POINTS[player])
+            for player in (1, 2)
+        ]
+        self.__back__ = [self._scan_back(player, BAR_PIPS + 1) for player in (1, 2)]
+
+    def _count_pips(self, player):
+        """Count a player's pips with a full scan of the cells.
+
+        Args:
+            player (int): Player number (1 or 2)
+
+        Returns:
+            int: Pips still to travel, including checkers on the bar
+        """
+        pips = self.__cells__[BAR_CELLS[player - 1]] * BAR_PIPS
+        for point in range(POINT_COUNT):
+            pips += self._own_count(point, player) * PIPS[player][point]
+        return pips
+
+    def get_pip_count(self, player):
+        """Get a player's pip count from the running totals in O(1).
+
+        Args:
+            player (int): Player number (1 or 2)
+
+        Returns:
+            int: Pips still to travel, including checkers on the bar
+        """
+        if self.DEBUG_SELF_CHECK:
+            self.verify_incremental_state()
+        return self.__pips__[player - 1]
+
+    def verify_incremental_state(self):
+        """Check all incrementally maintained state against a full recount.
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: If the incremental state drifted from the cells
+        """
+        expected = self.copy()
+        expected.refresh_incremental_state()
+        if self.__pips__ != expected.__pips__:
+            raise RuntimeError(
+                f"Pip totals {self.__pips__} do not match recount {expected.__pips__}"
+            )
+        if self.__zobrist__ != expected.__zobrist__:
+            raise RuntimeError("Position hash does not match recount")
+        if (self.__outside__, self.__back__) != (
+            expected.__outside__,
+            expected.__back__,
+        ):
+            raise RuntimeError("Home-board tracking does not match recount")
+
+    def get_zobrist_hash(self, player_to_move=None):
+        """Get the 64-bit Zobrist hash of the current position.
+
+        Args:
+            player_to_move (int, optional): Side to move (1 or 2) to include
+                in the key. Defaults to None (side to move ignored).
+
+        Returns:
+            int: 64-bit position hash
+        """
+        if self.DEBUG_SELF_CHECK:
+            self.verify_incremental_state()
+        return self.__zobrist__ ^ zobrist.side_key(player_to_move)
+
+    @staticmethod
+    def _sign(player):
+        """Return the count sign used for a player's checkers.
+
+        Args:
+            player (int): Player number (1 or 2)
+
+        Returns:
+            int: 1 for player 1, -1 for player 2
+        """
+        return 1 if player == 1 else -1
+
+    def _own_count(self, point, player):
+        """Return how many of the player's checkers are on a point.
+
+        Args:
+            point (int): Point index (0-23)
+            player (int): Player number (1 or 2)
+
+        Returns:
+            int: Number of the player's checkers on the point
+        """
+        value = self.__cells__[point]
+        if player == 1:
+            return value if value > 0 else 0
+        return -value if value < 0 else 0
+
+    def get_point(self, index):
+        """Get information about a specific point on the board.
+
+        Args:
+            index (int): Point index (0-23)
+
+        Returns:
+            dict: Dictionary with pieces, count, and player information
+
+        Raises:
+            IndexError: If index is out of range
+        """
+        if index < 0 or index >= POINT_COUNT:
+            raise IndexError("Point index must be between 0 and 23")
+
+        value = self.__cells__[index]
+        count = abs(value)
+        if value > 0:
+            player = 1
+        elif value < 0:
+            player = 2
+        else:
+            player = None
+
+        return {"pieces": [player] * count, "count": count, "player": player}
+
+    def can_move(self, from_point, to_point, player):
+        """Check if a move from one point to another is valid.
+
+        Args:
+            from_point (int): Source point index (0-23)
+            to_point (int): Destination point index (0-23)
+            player (int): Player number (1 or 2)
+
+        Returns:
+            bool: True if the move is valid, False otherwise
+        """
+        if from_point == to_point:
+            return False
+        if from_point < 0 or from_point >= POINT_COUNT:
+            return False
+        if to_point < 0 or to_point >= POINT_COUNT:
+            return False
+        if self._own_count(from_point, player) == 0:
+            return False
+
+        # Blocked by two or more opponent checkers
+        return self.__cells__[to_point] * self._sign(player) > -2
+
+    def _land(self, to_point, player):
+        """Place one of the player's checkers on a point, hitting a blot.
+
+        Args:
+            to_point (int): Destination point index (0-23)
+            player (int): Player number (1 or 2)
+
+        Returns:
+            None
+        """
+        sign = self._sign(player)
+        cells = self.__cells__
+        if cells[to_point] == -sign:
+            # Exactly one opponent checker: send it to the bar
+            opponent = 2 if player == 1 else 1
+            bar_cell = BAR_CELLS[opponent - 1]
+            cells[to_point] = 0
+            cells[bar_cell] += 1
+            self.__zobrist__ ^= zobrist.point_delta(to_point, opponent, 1, 0)
+            self.__zobrist__ ^= zobrist.bar_delta(
+                opponent, cells[bar_cell] - 1, cells[bar_cell]
+            )
+            self._arrive(opponent, BAR_PIPS)
+            self._leave(opponent, PIPS[opponent][to_point], True)
+        count = cells[to_point] * sign
+        cells[to_point] += sign
+        self.__zobrist__ ^= zobrist.point_delta(to_point, player, count, count + 1)
+
+    def _lift(self, from_point, player):
+        """Remove one of the player's checkers from a point.
+
+        Args:
+            from_point (int): Source point index (0-23)
+            player (int): Player number (1 or 2)
+
+        Returns:
+            None
+        """
+        sign = self._sign(player)
+        count = self.__cells__[from_point] * sign
+        self.__cells__[from_point] -= sign
+        self.__zobrist__ ^= zobrist.point_delta(from_point, player, count, count - 1)
+
+    def _arrive(self, player, pips):
+        """Update running totals for a checker arriving at a pip distance.
+
+        Args:
+            player (int): Player number (1 or 2)
+            pips (int): Pip distance of the new location (25 for the bar)
+
+        Returns:
+            None
+        """
+        index = player - 1
+        self.__pips__[index] += pips
+        if pips > 6:
+            self.__outside__[index] += 1
+        if pips > self.__back__[index]:
+            self.__back__[index] = pips
+
+    def _leave(self, player, pips, emptied):
+        """Update running totals for a checker leaving a pip distance.
+
+        Args:
+            player (int): Player number (1 or 2)
+            pips (int): Pip distance of the old location (25 for the bar)
+            emptied (bool): Whether the player has no checkers left there
+
+        Returns:
+            None
+        """
+        index = player - 1
+        self.__pips__[index] -= pips
+        if pips > 6:
+            self.__outside__[index] -= 1
+        if emptied and pips == self.__back__[index]:
+            self.__back__[index] = self._scan_back(player, pips)
+
+    def _scan_back(self, player, below):
+        """Find the rearmost checker closer to home than a pip bound.
+
+        Args:
+            player (int): Player number (1 or 2)
+            below (int): Exclusive upper bound on the pip distance
+
+        Returns:
+            int: Pip distance of the rearmost checker (25 for the bar), or 0
+                if the player has no checkers left on the board
+        """
+        if below > BAR_PIPS and self.__cells__[BAR_CELLS[player - 1]]:
+            return BAR_PIPS
+        for pips in range(min(below, BAR_PIPS) - 1, 0, -1):
+            point = 24 - pips if player == 1 else pips - 1
+            if self._own_count(point, player):
+                return pips
+        return 0
+
+    def move_piece(self, from_point, to_point, player):
+        """Move a piece from one point to another.
+
+        Args:
+            from_point (int): Source point index (0-23)
+            to_point (int): Destination point index (0-23)
+            player (int): Player number (1 or 2)
+
+        Returns:
+            bool: True if the move was successful, False otherwise
+        """
+        if not self.can_move(from_point, to_point, player):
+            return False
+
+        self._lift(from_point, player)
+        self._land(to_point, player)
+        self._leave(
+            player, PIPS[player][from_point], self._own_count(from_point, player) == 0
+        )
+        self._arrive(player, PIPS[player][to_point])
+        return True
+
+    def is_all_pieces_in_home(self, player):
+        """Check if all player's pieces are in their home board.
+
+        Args:
+            player (int): Player number (1 or 2)
+
+        Returns:
+            bool: True if all pieces are in home, False otherwise
+        """
+        if self.DEBUG_SELF_CHECK:
+            self.verify_incremental_state()
+        return self.__outside__[player - 1] == 0 and self.__back__[player - 1] > 0
+
+    def can_bear_off(self, point, player, dice_value=None):
+        """Check if a player can bear off a piece from a specific point.
+
+        Args:
+            point (int): Point index (0-23)
+            player (int): Player number (1 or 2)
+            dice_value (int, optional): Dice value to use for bearing off
+
+        Returns:
+            bool: True if bearing off is allowed, False otherwise
+        """
+        if not self.is_all_pieces_in_home(player):
+            return False
+        if self._own_count(point, player) == 0:
+            return False
+
+        if dice_value is None:
+            return True
+
+        # A larger die only bears off the rearmost checker
+        distance = BEAR_OFF_DISTANCE[player][point]
+        return distance == dice_value or (
+            self.__back__[player - 1] == distance < dice_value
+        )
+
+    def bear_off_piece(self, point, player):
+        """Bear off a piece from the board.
+
+        Args:
+            point (int): Point index (0-23)
+            player (int): Player number (1 or 2)
+
+        Returns:
+            bool: True if the bear off was successful, False otherwise
+        """
+        if not self.can_bear_off(point, player):
+            return False
+
+        self._lift(point, player)
+        self._leave(player, PIPS[player][point], self._own_count(point, player) == 0)
+        off_cell = OFF_CELLS[player - 1]
+        self.__cells__[off_cell] += 1
+        self.__zobrist__ ^= zobrist.off_delta(
+            player, self.__cells__[off_cell] - 1, self.__cells__[off_cell]
+        )
+        return True
+
+    def has_pieces_on_bar(self, player):
+        """Check if a player has pieces on the bar.
+
+        Args:
+            player (int): Player number (1 or 2)
+
+        Returns:
+            bool: True if player has pieces on bar, False otherwise
+        """
+        return self.__cells__[BAR_CELLS[player - 1]] > 0
+
+    def enter_from_bar(self, to_point, player):
+        """Move a piece from the bar to a point on the board.
+
+        Args:
+            to_point (int): Destination point index (0-23)
+            player (int): Player number (1 or 2)
+
+        Returns:
+            bool: True if the entry was successful, False otherwise
+        """
+        bar_cell = BAR_CELLS[player - 1]
+        if not self.__cells__[bar_cell]:
+            return False
+        if to_point < 0 or to_point >= POINT_COUNT:
+            return False
+        if self.__cells__[to_point] * self._sign(player) <= -2:
+            return False
+
+        self.__cells__[bar_cell] -= 1
+        self.__zobrist__ ^= zobrist.bar_delta(
+            player, self.__cells__[bar_cell] + 1, self.__cells__[bar_cell]
+        )
+        self._land(to_point, player)
+        self._leave(player, BAR_PIPS, self.__cells__[bar_cell] == 0)
+        self._arrive(player, PIPS[player][to_point])
+        return True
+
+    def apply(self, move, player):
+        """Apply a move in place and return a token that undoes it exactly.
+
+        Args:
+            move: (from, to) pair or move dict; from may be "bar", to "off"
+            player (int): Player number (1 or 2)
+
+        Returns:
+            tuple: Undo token for revert, or None if the move is not legal
+        """
+        from_point, to_point = move_endpoints(move)
+        snapshot = (
+            self.__zobrist__,
+            tuple(self.__pips__),
+            tuple(self.__outside__),
+            tuple(self.__back__),
+        )
+        captured = (
+            to_point != "off"
+            and 0 <= to_point < POINT_COUNT
+            and self.__cells__[to_point] == -self._sign(player)
+        )
+
+        if from_point == "bar":
+            success = self.enter_from_bar(to_point, player)
+        elif to_point == "off":
+            success = self.bear_off_piece(from_point, player)
+        else:
+            success = self.move_piece(from_point, to_point, player)
+
+        if not success:
+            return None
+        return (from_point, to_point, player, captured, snapshot)
+
+    def revert(self, token):
+        """Undo a move applied with apply, including any captured blot.
+
+        Tokens must be reverted in the reverse order they were produced.
+
+        Args:
+            token (tuple): Undo token returned by apply
+
+        Returns:
+            None
+        """
+        from_point, to_point, player, captured, snapshot = token
+        sign = self._sign(player)
+        cells = self.__cells__
+        if to_point == "off":
+            cells[OFF_CELLS[player - 1]] -= 1
+        else:
+            cells[to_point] -= sign
+            if captured:
+                cells[BAR_CELLS[2 - player]] -= 1
+                cells[to_point] = -sign
+
+        if from_point == "bar":
+            cells[BAR_CELLS[player - 1]] += 1
+        else:
+            cells[from_point] += sign
+        self.__zobrist__ = snapshot[0]
+        self.__pips__ = list(snapshot[1])
+        self.__outside__ = list(snapshot[2])
+        self.__back__ = list(snapshot[3])
+
+    def get_possible_moves(self, player, dice_values):
+        """Get all possible moves for a player given dice values.
+
+        Args:
+            player (int): Player number (1 or 2)
+            dice_values (list): List of dice values to use
+
+        Returns:
+            list: List of possible moves
+        """
+        return [
+            {"from": from_point, "to": to_point, "dice": dice}
+            for from_point, to_point, dice in self.iter_possible_moves(
+                player, dice_values
+            )
+        ]
+
+    def iter_possible_moves(self, player, dice_values):
+        """Lazily yield the moves of get_possible_moves, in the same order.
+
+        The board must not change while the iterator is in use, except for
+        changes undone (e.g. apply then revert) before the next step.
+
+        Args:
+            player (int): Player number (1 or 2)
+            dice_values (list): List of dice values to use
+
+        Yields:
+            tuple: (from, to, dice), where from may be "bar" and to "off"
+        """
+        if self.__cells__[BAR_CELLS[player - 1]]:
+            yield from self._iter_bar_entry_moves(player, dice_values)
+            return
+
+        yield from self._iter_bear_off_moves(player, dice_values)
+        yield from self._iter_regular_moves(player, dice_values)
+
+    def count_possible_moves(self, player, dice_values):
+        """Count the moves of get_possible_moves without building them.
+
+        Args:
+            player (int): Player number (1 or 2)
+            dice_values (list): List of dice values to use
+
+        Returns:
+            int: Number of possible moves
+        """
+        return sum(1 for _ in self.iter_possible_moves(player, dice_values))
+
+    def _iter_bar_entry_moves(self, player, dice_values):
+        """Yield legal bar entry moves for a player and dice values.
+
+        Args:
+            player (int): Player number (1 or 2)
+            dice_values (list): List of dice values to use
+
+        Yields:
+            tuple: ("bar", entry point, dice)
+        """
+        sign = self._sign(player)
+        entry_points = ENTRY_POINTS[player]
+        for dice in dice_values:
+            entry_point = entry_points[dice]
+            if self.__cells__[entry_point] * sign > -2:
+                yield ("bar", entry_point, dice)
+
+    def _iter_bear_off_moves(self, player, dice_values):
+        """Yield legal bearing-off moves for a player and dice values.
+
+        Args:
+            player (int): Player number (1 or 2)
+            dice_values (list): List of dice values to use
+
+        Yields:
+            tuple: (point, "off", dice)
+        """
+        if not self.is_all_pieces_in_home(player):
+            return
+        back = self.__back__[player - 1]
+        distances = BEAR_OFF_DISTANCE[player]
+        for point in HOME_POINTS[player]:
+            if self._own_count(point, player):
+                distance = distances[point]
+                for dice in dice_values:
+                    if distance == dice or back == distance < dice:
+                        yield (point, "off", dice)
+
+    def _iter_regular_moves(self, player, dice_values):
+        """Yield legal on-board moves (non-bar, non-bear-off).
+
+        Args:
+            player (int): Player number (1 or 2)
+            dice_values (list): List of dice values to use
+
+        Yields:
+            tuple: (from point, to point, dice)
+        """
+        sign = self._sign(player)
+        cells = self.__cells__
+        destinations = DESTINATIONS[player]
+        for from_point in range(POINT_COUNT):
+            if cells[from_point] * sign > 0:
+                row = destinations[from_point]
+                for dice in dice_values:
+                    to_point = row[dice]
+                    if to_point is not None and cells[to_point] * sign > -2:
+                        yield (from_point, to_point, dice)
+
+    def has_any_move(self, player, dice_values):
+        """Check if get_possible_moves would return at least one move.
+
+        Read-only and stops at the first legal move, without building any
+        move dictionaries. Empty and opponent points are skipped on sight.
+
+        Args:
+            player (int): Player number (1 or 2)
+            dice_values (list): List of dice values to use
+
+        Returns:
+            bool: True if at least one single-die move is legal
+        """
+        dice = set(dice_values)
+        sign = self._sign(player)
+        cells = self.__cells__
+        if cells[BAR_CELLS[player - 1]]:
+            entry_points = ENTRY_POINTS[player]
+            return any(cells[entry_points[dice_value]] * sign > -2 for dice_value in dice)
+
+        destinations = DESTINATIONS[player]
+        for from_point in range(POINT_COUNT):
+            if cells[from_point] * sign > 0:
+                row = destinations[from_point]
+                for dice_value in dice:
+                    to_point = row[dice_value]
+                    if to_point is not None and cells[to_point] * sign > -2:
+                        return True
+
+        if not self.is_all_pieces_in_home(player):
+            return False
+        back = self.__back__[player - 1]
+        distances = BEAR_OFF_DISTANCE[player]
+        return any(
+            distances[point] == dice_value or back == distances[point] < dice_value
+            for point in HOME_POINTS[player]
+            if self._own_count(point, player)
+            for dice_value in dice
+        )
+
+    def is_game_over(self):
+        """Check if the game is over (all pieces of a player are off the board).
+
+        Returns:
+            bool: True if the game is over, False otherwise
+        """
+        return self.get_winner() is not None
+
+    def get_winner(self):
+        """Get the winner of the game.
+
+        Returns:
+            int: Winner player number (1 or 2), or None if no winner yet
+        """
+        if self.__cells__[OFF_CELLS[0]] == CHECKERS_PER_PLAYER:
+            return 1
+        if self.__cells__[OFF_CELLS[1]] == CHECKERS_PER_PLAYER:
+            return 2
+        return None
+
+    def count_pieces_for_player(self, player):
+        """Count pieces for a player across the board.
+
+        Args:
+            player (int): Player number (1 or 2)
+
+        Returns:
+            int: Total number of pieces for the player
+        """
+        on_points = sum(self._own_count(i, player) for i in range(POINT_COUNT))
+        return (
+            on_points
+            + self.__cells__[BAR_CELLS[player - 1]]
+            + self.__cells__[OFF_CELLS[player - 1]]
+        )
+
+    def get_board_state(self):
+        """Get the complete state of the board in Board's list format.
+
+        Returns:
+            dict: Dictionary containing the complete board state
+        """
+        points = []
+        for value in self.__cells__[:POINT_COUNT]:
+            if value > 0:
+                points.append([1] * value)
+            else:
+                points.append([2] * -value)
+        # Board keeps player 2's bar at index 0 and player 1's at index 1
+        return {
+            "points": points,
+            "bar": [
+                [2] * self.__cells__[BAR_CELLS[1]],
+                [1] * self.__cells__[BAR_CELLS[0]],
+            ],
+            "off_board": [
+                [1] * self.__cells__[OFF_CELLS[0]],
+                [2] * self.__cells__[OFF_CELLS[1]],
+            ],
+        }
+
+    def set_board_state(self, state):
+        """Set the board state from a dictionary in Board's list format.
+
+        Args:
+            state: Dictionary containing board state
+
+        Returns:
+            None
+        """
+        cells = array("b", bytes(CELL_COUNT))
+        for index, pieces in enumerate(state["points"]):
+            if pieces:
+                cells[index] = len(pieces) if pieces[0] == 1 else -len(pieces)
+        for checker_bar in state["bar"]:
+            for piece in checker_bar:
+                cells[BAR_CELLS[piece - 1]] += 1
+        for off in state["off_board"]:
+            for piece in off:
+                cells[OFF_CELLS[piece - 1]] += 1
+        self.__cells__ = cells
+        self.refresh_incremental_state()
+
+    def copy(self):
+        """Create a copy of the board.
+
+        Returns:
+            CompactBoard: A new CompactBoard instance with the same state
+        """
+        new_board = CompactBoard()
+        new_board.__cells__ = array("b", self.__cells__)
+        new_board.__zobrist__ = self.__zobrist__
+        new_board.__pips__ = self.__pips__.copy()
+        new_board.__outside__ = self.__outside__.copy()
+        new_board.__back__ = self.__back__.copy()
+        return new_board
+
+    @classmethod
+    def from_board(cls, board):
+        """Build a compact board from any board exposing get_board_state.
+
+        Args:
+            board: A Board or CompactBoard instance
+
+        Returns:
+            CompactBoard: A new compact board with the same position
+        """
+        compact = cls()
+        compact.set_board_state(board.get_board_state())
+        return compact
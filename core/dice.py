@@ -1,7 +1,8 @@
 """Dice module for the Backgammon game.
 
 This module contains the Dice class that handles dice rolling
-and move calculation for the Backgammon game.
+and move calculation for the Backgammon game, and RotatedDice, which
+stratifies the opening rolls of a series of simulated games.
 """
 
 import random
@@ -13,12 +14,17 @@ class Dice:
     Handles rolling dice and determining available moves based on the roll.
     """
 
-    def __init__(self):
+    def __init__(self, rng=None):
         """Initialize the dice.
 
+        Args:
+            rng (random.Random, optional): Random stream to roll from.
+                Defaults to the random module's shared stream.
+
         Returns:
             None
         """
+        self.__rng__ = rng
 
     def roll(self):
         """Roll two dice and return the result.
@@ -26,8 +32,9 @@ class Dice:
         Returns:
             tuple: A tuple containing the values of both dice (die1, die2).
         """
-        die1 = random.randint(1, 6)
-        die2 = random.randint(1, 6)
+        source = random if self.__rng__ is None else self.__rng__
+        die1 = source.randint(1, 6)
+        die2 = source.randint(1, 6)
         return (die1, die2)
 
     def get_available_moves(self, roll_result):
@@ -66,3 +73,47 @@ class Dice:
         if self.__is_double__(roll_result):
             return [roll_result[0]] * 4
         return [roll_result[0], roll_result[1]]
+
+
+class RotatedDice(Dice):
+    """Dice whose first two rolls are stratified over a series of games.
+
+    The 36 ordered rolls are shuffled once per series seed. Game i of the
+    series opens with roll i mod 36 and answers with roll (i mod 36 + i // 36)
+    mod 36, so every 36 games see each opening roll once and every 1296 games
+    see each pair of first two rolls once. Later rolls are random.
+    """
+
+    COMBINATIONS = tuple((die1, die2) for die1 in range(1, 7) for die2 in range(1, 7))
+
+    def __init__(self, game, seed=0, rng=None):
+        """Initialize the dice for one game of a series.
+
+        Args:
+            game (int): Index of the game in the series, from 0
+            seed (int, optional): Seed of the series' roll order. Defaults to 0.
+            rng (random.Random, optional): Random stream for the later rolls.
+                Defaults to the random module's shared stream.
+
+        Returns:
+            None
+        """
+        super().__init__(rng)
+        order = random.Random(seed)
+        first = order.sample(self.COMBINATIONS, len(self.COMBINATIONS))
+        second = order.sample(self.COMBINATIONS, len(self.COMBINATIONS))
+        offset = game % len(first)
+        self.__queued__ = [
+            second[(offset + game // len(first)) % len(second)],
+            first[offset],
+        ]
+
+    def roll(self):
+        """Roll the next stratified roll of the game, then random ones.
+
+        Returns:
+            tuple: A tuple containing the values of both dice (die1, die2).
+        """
+        if self.__queued__:
+            return self.__queued__.pop()
+        return super().roll()
@@ -0,0 +1,237 @@
+"""Evaluator module for the Backgammon game.
+
+This module defines the Evaluator interface used by bots and search, and the
+HeuristicEvaluator, a fast hand-tuned scorer. Evaluators work on CompactBoard
+positions and return the cubeless equity of a position for one player, with
+the opponent on roll: +1 for a certain win, +2 and +3 for a certain gammon and
+backgammon, and the negatives for losses.
+"""
+
+import math
+from abc import ABC, abstractmethod
+
+from .compact_board import BAR_CELLS, CHECKERS_PER_PLAYER, OFF_CELLS, POINT_COUNT
+from .move_tables import HOME_POINTS
+
+# Opponent checkers this many pips or fewer behind a blot can hit it directly
+DIRECT_SHOT_RANGE = 12
+# Distance standing for "no opponent checker behind"
+UNREACHABLE = 99
+
+
+def game_result(board):
+    """Get the winner of a finished game and the points won.
+
+    Args:
+        board: CompactBoard to inspect
+
+    Returns:
+        tuple: (winner, points), where points is 1 for a single game, 2 for a
+            gammon and 3 for a backgammon; None if the game is not over
+    """
+    cells = board.__cells__
+    for winner in (1, 2):
+        if cells[OFF_CELLS[winner - 1]] != CHECKERS_PER_PLAYER:
+            continue
+        loser = 3 - winner
+        if cells[OFF_CELLS[loser - 1]]:
+            return winner, 1
+        loser_sign = 1 if loser == 1 else -1
+        if cells[BAR_CELLS[loser - 1]] or any(
+            cells[point] * loser_sign > 0 for point in HOME_POINTS[winner]
+        ):
+            return winner, 3
+        return winner, 2
+    return None
+
+
+def terminal_equity(board, player):
+    """Get the exact equity of a finished game for a player.
+
+    Args:
+        board: CompactBoard to inspect
+        player (int): Player number (1 or 2)
+
+    Returns:
+        float: Points won (positive) or lost (negative), or None if the game
+            is not over
+    """
+    result = game_result(board)
+    if result is None:
+        return None
+    winner, points = result
+    return float(points if winner == player else -points)
+
+
+class Evaluator(ABC):
+    """Interface of position evaluators.
+
+    MIN_EQUITY and MAX_EQUITY bound every value evaluate can return, and
+    MIN_ESTIMATE and MAX_ESTIMATE the values of games that are not over. Search
+    uses them for pruning, so subclasses with a narrower range should say so.
+    """
+
+    MIN_EQUITY = -3.0
+    MAX_EQUITY = 3.0
+    MIN_ESTIMATE = MIN_EQUITY
+    MAX_ESTIMATE = MAX_EQUITY
+
+    @abstractmethod
+    def evaluate(self, board, player):
+        """Estimate the equity of a position for a player.
+
+        Args:
+            board: CompactBoard to evaluate; it must be left unchanged
+            player (int): Player number (1 or 2); the opponent is on roll
+
+        Returns:
+            float: Equity between MIN_EQUITY and MAX_EQUITY
+        """
+
+    def evaluate_plays(self, board, player, plays):
+        """Evaluate the position reached by each play.
+
+        Evaluators able to score several positions at once override this.
+
+        Args:
+            board: CompactBoard before the plays; it is left unchanged
+            player (int): Player number (1 or 2) making the plays
+            plays (list): Plays as sequences of (from, to, die) moves
+
+        Returns:
+            list: Equity for player after each play, in the order of plays
+        """
+        scores = []
+        for play in plays:
+            tokens = [board.apply(move, player) for move in play]
+            scores.append(self.evaluate(board, player))
+            for token in reversed(tokens):
+                board.revert(token)
+        return scores
+
+
+class HeuristicEvaluator(Evaluator):
+    """Weighted sum of classic positional features, squashed to (-1, 1).
+
+    Features are taken for both sides and compared: pip count, blots within
+    direct range of an opponent checker, made points, the longest prime and
+    checkers on the bar. Finished games score their exact result, and
+    bear-offs stored in a bear-off database their race equity.
+    """
+
+    MIN_ESTIMATE = -1.0
+    MAX_ESTIMATE = 1.0
+
+    DEFAULT_WEIGHTS = {
+        "pips": 0.012,
+        "blots": 0.06,
+        "points": 0.03,
+        "prime": 0.05,
+        "bar": 0.08,
+    }
+
+    def __init__(self, weights=None, bearoff=None):
+        """Initialize the evaluator.
+
+        Args:
+            weights (dict, optional): Overrides for DEFAULT_WEIGHTS entries
+            bearoff (optional): Bear-off database, or sequence of databases
+                tried in order, to look bear-offs up in, such as
+                bearoff.default_databases(). Defaults to None, without
+                lookups.
+
+        Raises:
+            ValueError: If weights names an unknown feature
+        """
+        unknown = set(weights or {}) - set(self.DEFAULT_WEIGHTS)
+        if unknown:
+            raise ValueError(f"Unknown heuristic features: {sorted(unknown)}")
+        self.__weights__ = {**self.DEFAULT_WEIGHTS, **(weights or {})}
+        if bearoff is None:
+            bearoff = ()
+        elif not isinstance(bearoff, (tuple, list)):
+            bearoff = (bearoff,)
+        self.__bearoff__ = tuple(bearoff)
+
+    def evaluate(self, board, player):
+        """Estimate the equity of a position for a player.
+
+        Args:
+            board: CompactBoard to evaluate
+            player (int): Player number (1 or 2); the opponent is on roll
+
+        Returns:
+            float: Equity in (-1, 1), or the exact result of a finished game
+        """
+        exact = terminal_equity(board, player)
+        if exact is not None:
+            return exact
+        for database in self.__bearoff__:
+            equity = database.race_equity(board, player)
+            if equity is not None:
+                return equity
+
+        # features[side] = [exposed blots, made points, longest prime, bar]
+        features = self._features(board.__cells__)
+        own = features[player - 1]
+        other = features[2 - player]
+        weights = self.__weights__
+        score = (
+            weights["pips"]
+            * (board.get_pip_count(3 - player) - board.get_pip_count(player))
+            + weights["blots"] * (other[0] - own[0])
+            + weights["points"] * (own[1] - other[1])
+            + weights["prime"] * (own[2] - other[2])
+            + weights["bar"] * (other[3] - own[3])
+        )
+        return math.tanh(score)
+
+    @staticmethod
+    def _features(cells):
+        """Compute the features of both players in two passes over the points.
+
+        A blot is exposed when the nearest opponent checker behind it, or the
+        opponent's bar, is at most DIRECT_SHOT_RANGE pips away.
+
+        Args:
+            cells: CompactBoard cell array
+
+        Returns:
+            tuple: For player 1 and player 2, a list of [exposed blots, made
+                points, longest prime, checkers on bar]
+        """
+        values = cells.tolist()
+        first = [0, 0, 0, values[BAR_CELLS[0]]]
+        second = [0, 0, 0, values[BAR_CELLS[1]]]
+
+        # Player 2 moves down the points and enters as if from point 24
+        nearest = POINT_COUNT if second[3] else UNREACHABLE
+        for point in range(POINT_COUNT - 1, -1, -1):
+            value = values[point]
+            if value < 0:
+                nearest = point
+            elif value == 1 and nearest - point <= DIRECT_SHOT_RANGE:
+                first[0] += 1
+
+        # Player 1 moves up the points and enters as if from point -1
+        nearest = -1 if first[3] else -UNREACHABLE
+        first_run = second_run = 0
+        for point in range(POINT_COUNT):
+            value = values[point]
+            if value >= 2:
+                first[1] += 1
+                first_run += 1
+                second_run = 0
+                first[2] = max(first[2], first_run)
+            elif value <= -2:
+                second[1] += 1
+                second_run += 1
+                first_run = 0
+                second[2] = max(second[2], second_run)
+            else:
+                first_run = second_run = 0
+                if value == -1 and point - nearest <= DIRECT_SHOT_RANGE:
+                    second[0] += 1
+            if value > 0:
+                nearest = point
+        return first, second
@@ -0,0 +1,141 @@
+"""Move cache module for the Backgammon game.
+
+This module contains the MoveCache class, a bounded LRU memoization layer in
+front of move generation. Entries are keyed by the Zobrist position key (side
+to move included) plus the sorted dice, so repeated (position, roll) pairs are
+served without regenerating moves.
+"""
+
+from collections import OrderedDict
+
+from .move_generator import generate_plays
+
+
+class MoveCache:
+    """Least-recently-used cache for generated moves and plays.
+
+    Cached results are shared between callers and must not be modified.
+    """
+
+    DEFAULT_MAX_SIZE = 4096
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """Initialize an empty cache.
+
+        Args:
+            max_size (int, optional): Maximum number of entries kept.
+                Defaults to DEFAULT_MAX_SIZE.
+
+        Raises:
+            ValueError: If max_size is lower than 1
+        """
+        if max_size < 1:
+            raise ValueError("Cache size must be at least 1")
+        self.__max_size__ = max_size
+        self.__entries__ = OrderedDict()
+        self.__hits__ = 0
+        self.__misses__ = 0
+        self.__evictions__ = 0
+
+    def lookup(self, key, compute):
+        """Return the cached value for key, computing and storing it on a miss.
+
+        Args:
+            key: Hashable cache key
+            compute (callable): Zero-argument function producing the value
+
+        Returns:
+            The cached or freshly computed value
+        """
+        entries = self.__entries__
+        if key in entries:
+            entries.move_to_end(key)
+            self.__hits__ += 1
+            return entries[key]
+
+        self.__misses__ += 1
+        value = compute()
+        entries[key] = value
+        if len(entries) > self.__max_size__:
+            entries.popitem(last=False)
+            self.__evictions__ += 1
+        return value
+
+    def get_possible_moves(self, board, player, dice_values):
+        """Get single-die moves for a position, as Board.get_possible_moves.
+
+        Args:
+            board: Board or CompactBoard to generate moves on
+            player (int): Player number (1 or 2)
+            dice_values (list): List of dice values to use
+
+        Returns:
+            list: List of possible moves
+        """
+        key = ("moves", board.get_zobrist_hash(player), tuple(sorted(dice_values)))
+        return self.lookup(key, lambda: board.get_possible_moves(player, dice_values))
+
+    def get_plays(self, board, player, roll):
+        """Get every distinct legal full play, as move_generator.generate_plays.
+
+        Args:
+            board: Board or CompactBoard to generate plays on
+            player (int): Player number (1 or 2)
+            roll (tuple): The two dice values (die1, die2)
+
+        Returns:
+            tuple: Legal plays, each a tuple of (from, to, die) moves
+        """
+        key = ("plays", board.get_zobrist_hash(player), tuple(sorted(roll)))
+        return self.lookup(key, lambda: tuple(generate_plays(board, player, roll)))
+
+    def resize(self, max_size):
+        """Change the maximum number of entries, evicting the oldest if needed.
+
+        Args:
+            max_size (int): New maximum number of entries
+
+        Raises:
+            ValueError: If max_size is lower than 1
+        """
+        if max_size < 1:
+            raise ValueError("Cache size must be at least 1")
+        self.__max_size__ = max_size
+        while len(self.__entries__) > max_size:
+            self.__entries__.popitem(last=False)
+            self.__evictions__ += 1
+
+    def clear(self):
+        """Remove every entry and reset the counters.
+
+        Returns:
+            None
+        """
+        self.__entries__.clear()
+        self.__hits__ = 0
+        self.__misses__ = 0
+        self.__evictions__ = 0
+
+    def get_stats(self):
+        """Get the cache counters.
+
+        Returns:
+            dict: hits, misses, evictions, size, max_size and hit_rate
+        """
+        lookups = self.__hits__ + self.__misses__
+        return {
+            "hits": self.__hits__,
+            "misses": self.__misses__,
+            "evictions": self.__evictions__,
+            "size": len(self.__entries__),
+            "max_size": self.__max_size__,
+            "hit_rate": self.__hits__ / lookups if lookups else 0.0,
+        }
+
+    def __len__(self):
+        """Return the number of cached entries.
+
+        Returns:
+            int: Number of entries
+        """
+        return len(self.__entries__)
@@ -0,0 +1,177 @@
+"""Move generator module for the Backgammon game.
+
+This module enumerates every legal full play for a position and a dice roll.
+A play is a tuple of (from, to, die) moves. The generator applies the usual
+rules: doubles give four moves, the maximum number of dice must be used, and
+when only one die can be played the larger one must be used if possible.
+Plays reaching the same position are reported once.
+"""
+
+
+def dice_for_roll(roll):
+    """Return the list of dice to play for a roll.
+
+    Args:
+        roll (tuple): The two dice values (die1, die2)
+
+    Returns:
+        list: Four dice for doubles, otherwise the two dice
+    """
+    if roll[0] == roll[1]:
+        return [roll[0]] * 4
+    return [roll[0], roll[1]]
+
+
+def generate_plays(board, player, roll):
+    """Enumerate every distinct legal full play for a position and roll.
+
+    The board is explored in place with apply/revert and left unchanged;
+    moves are enumerated lazily, so each position yields no move dicts.
+
+    Args:
+        board: Board or CompactBoard to play on
+        player (int): Player number (1 or 2)
+        roll (tuple): The two dice values (die1, die2)
+
+    Returns:
+        list: Legal plays, each a tuple of (from, to, die) moves, one per
+            resulting position. Empty when the player cannot move.
+    """
+    # leaves[length][(hash, dice used)] = play; visited holds (hash, remaining)
+    leaves = {}
+    visited = set()
+
+    def search(remaining, path):
+        state = (board.get_zobrist_hash(), remaining)
+        if state in visited:
+            return
+        visited.add(state)
+
+        moved = False
+        if remaining:
+            for move in board.iter_possible_moves(player, sorted(set(remaining))):
+                token = board.apply(move, player)
+                if token is None:
+                    continue
+                moved = True
+                index = remaining.index(move[2])
+                search(remaining[:index] + remaining[index + 1 :], path + (move,))
+                board.revert(token)
+
+        if not moved:
+            dice_used = tuple(sorted(step[2] for step in path))
+            leaves.setdefault(len(path), {}).setdefault((state[0], dice_used), path)
+
+    search(tuple(sorted(dice_for_roll(roll))), ())
+    return _select_plays(leaves, roll)
+
+
+def iter_plays(board, player, roll):
+    """Yield every distinct legal full play for a position and roll lazily.
+
+    A first pass, which stops as soon as a play uses every die, finds how
+    many dice must be played; plays of that length are then yielded as the
+    search reaches them. The board is explored in place: it holds the
+    position after the yielded play while the generator is suspended, and
+    is restored when the generator finishes or is closed. Plays come in the
+    order of generate_plays' search, one per resulting position.
+
+    Args:
+        board: Board or CompactBoard to play on
+        player (int): Player number (1 or 2)
+        roll (tuple): The two dice values (die1, die2)
+
+    Yields:
+        tuple: A legal play as a tuple of (from, to, die) moves
+    """
+    dice = tuple(sorted(dice_for_roll(roll)))
+    length = _max_dice(board, player, dice, {})
+    if length == 1 and roll[0] != roll[1]:
+        higher = (max(roll),)
+        if _max_dice(board, player, higher, {}) == 1:
+            dice = higher
+    seen = set()
+    visited = set()
+
+    def search(remaining, path):
+        position = board.get_zobrist_hash()
+        if len(path) == length:
+            if position not in seen:
+                seen.add(position)
+                yield path
+            return
+        if (position, remaining) in visited:
+            return
+        visited.add((position, remaining))
+        for move in board.iter_possible_moves(player, sorted(set(remaining))):
+            token = board.apply(move, player)
+            if token is None:
+                continue
+            index = remaining.index(move[2])
+            try:
+                yield from search(
+                    remaining[:index] + remaining[index + 1 :], path + (move,)
+                )
+            finally:
+                board.revert(token)
+
+    if length:
+        yield from search(dice, ())
+
+
+def _max_dice(board, player, remaining, memo):
+    """Find the most dice any play can use, stopping once all are used.
+
+    Args:
+        board: Board or CompactBoard to play on; it is left unchanged
+        player (int): Player number (1 or 2)
+        remaining (tuple): Sorted dice still to play
+        memo (dict): Results by (position hash, remaining dice)
+
+    Returns:
+        int: Largest number of the remaining dice a play can use
+    """
+    state = (board.get_zobrist_hash(), remaining)
+    if state in memo:
+        return memo[state]
+    best = 0
+    for move in board.iter_possible_moves(player, sorted(set(remaining))):
+        token = board.apply(move, player)
+        if token is None:
+            continue
+        index = remaining.index(move[2])
+        rest = remaining[:index] + remaining[index + 1 :]
+        best = max(best, 1 + _max_dice(board, player, rest, memo))
+        board.revert(token)
+        if best == len(remaining):
+            break
+    memo[state] = best
+    return best
+
+
+def _select_plays(leaves, roll):
+    """Keep the plays that satisfy the maximum-dice and larger-die rules.
+
+    Args:
+        leaves (dict): Plays found, keyed by length then (hash, dice used)
+        roll (tuple): The two dice values (die1, die2)
+
+    Returns:
+        list: Legal plays, one per resulting position
+    """
+    max_length = max(leaves)
+    if max_length == 0:
+        return []
+
+    candidates = leaves[max_length]
+    if max_length == 1 and roll[0] != roll[1]:
+        higher = max(roll)
+        if any(dice_used == (higher,) for _, dice_used in candidates):
+            candidates = {
+                key: play for key, play in candidates.items() if key[1] == (higher,)
+            }
+
+    plays = {}
+    for (position_hash, _), play in candidates.items():
+        plays.setdefault(position_hash, play)
+    return list(plays.values())
@@ -0,0 +1,115 @@
+"""Move tables module for the Backgammon game.
+
+This module precomputes, once at import, the player-direction arithmetic used
+by move generation. Tables are indexed by player number (1 or 2), then point
+index (0-23) and die value (1-6); index 0 of the player and die axes is unused
+so lookups need no offset. Player 1 moves from point 0 towards point 23 and
+player 2 the other way.
+"""
+
+PLAYERS = (1, 2)
+DIE_VALUES = (1, 2, 3, 4, 5, 6)
+
+
+def _destination(player, from_point, die):
+    """Compute the destination of a regular move.
+
+    Args:
+        player (int): Player number (1 or 2)
+        from_point (int): Source point index (0-23)
+        die (int): Die value
+
+    Returns:
+        int: Destination point index, or None if the move leaves the board
+    """
+    to_point = from_point + die if player == 1 else from_point - die
+    return to_point if 0 <= to_point < 24 else None
+
+
+def _entry_point(player, die):
+    """Compute the point a checker enters on from the bar.
+
+    Args:
+        player (int): Player number (1 or 2)
+        die (int): Die value
+
+    Returns:
+        int: Entry point index in the opponent's home board
+    """
+    return die - 1 if player == 1 else 24 - die
+
+
+def _home_points(player):
+    """Return the home board points of a player.
+
+    Args:
+        player (int): Player number (1 or 2)
+
+    Returns:
+        tuple: Home point indices in ascending order
+    """
+    return tuple(range(18, 24)) if player == 1 else tuple(range(0, 6))
+
+
+# DESTINATIONS[player][from_point][die] -> to_point or None
+DESTINATIONS = (None,) + tuple(
+    tuple(
+        (None,) + tuple(_destination(player, point, die) for die in DIE_VALUES)
+        for point in range(24)
+    )
+    for player in PLAYERS
+)
+
+# ENTRY_POINTS[player][die] -> entry point index
+ENTRY_POINTS = (None,) + tuple(
+    (None,) + tuple(_entry_point(player, die) for die in DIE_VALUES)
+    for player in PLAYERS
+)
+
+# BEAR_OFF_DISTANCE[player][point] -> pips needed to bear off (1-24)
+BEAR_OFF_DISTANCE = (None,) + tuple(
+    tuple(24 - point if player == 1 else point + 1 for point in range(24))
+    for player in PLAYERS
+)
+
+# PIPS[player][point] -> pips a checker on the point still has to travel
+PIPS = BEAR_OFF_DISTANCE
+BAR_PIPS = 25
+
+HOME_POINTS = (None,) + tuple(_home_points(player) for player in PLAYERS)
+OUTER_POINTS = (None,) + tuple(
+    tuple(point for point in range(24) if point not in _home_points(player))
+    for player in PLAYERS
+)
+
+
+def destination(player, from_point, die):
+    """Look up the destination of a regular move, validating the inputs.
+
+    Args:
+        player (int): Player number (1 or 2)
+        from_point (int): Source point index (0-23)
+        die (int): Die value
+
+    Returns:
+        int: Destination point index, or None if the move is off the board
+            or the inputs are out of range
+    """
+    if not 0 <= from_point < 24 or die not in DIE_VALUES:
+        return None
+    return DESTINATIONS[player][from_point][die]
+
+
+def entry_point(player, die):
+    """Look up the bar entry point for a die, validating the inputs.
+
+    Args:
+        player (int): Player number (1 or 2)
+        die (int): Die value
+
+    Returns:
+        int: Entry point index, or None if the die is out of range
+    """
+    if die not in DIE_VALUES:
+        return None
+    return ENTRY_POINTS[player][die]
@@ -0,0 +1,274 @@
+"""Neural evaluator module for the Backgammon game.
+
+This module contains the NeuralEvaluator class, a TD-Gammon style multilayer
+perceptron written in NumPy, its BatchEvaluator base, and encode_batch and
+encode_cells, which turn a BoardBatch or CompactBoard cell arrays into the
+network's 198 inputs. Positions are
+encoded from the point of view of the player being evaluated, so one network
+serves both players, and every candidate play of a roll goes through the
+network in a single matrix multiply. Everything runs on the CPU.
+"""
+
+from abc import abstractmethod
+
+import numpy as np
+
+from .board_batch import BAR_SLOT, OFF_SLOT, BoardBatch
+from .compact_board import POINT_COUNT
+from .evaluator import Evaluator, terminal_equity
+
+# Units per point and player: at least 1, 2 and 3 checkers, then the excess
+UNITS_PER_POINT = 4
+INPUT_UNITS = 2 * (POINT_COUNT * UNITS_PER_POINT + 2) + 2
+# Outputs: win, win gammon, win backgammon, lose gammon, lose backgammon
+OUTPUT_UNITS = 5
+# Equity of each output, added to -1 for the plain loss
+OUTPUT_EQUITY = np.array([2.0, 1.0, 1.0, -1.0, -1.0])
+WEIGHT_NAMES = ("hidden_weights", "hidden_bias", "output_weights", "output_bias")
+
+
+def encode_batch(batch):
+    """Encode the positions of a batch into the 198 network inputs.
+
+    Each position is encoded for its side in the batch. For that player and
+    then the opponent, each point taken in the player's direction of travel
+    gives four units: one each for at least 1, 2 and 3 checkers and half the
+    checkers beyond 3. Then come each side's bar checkers halved, then
+    checkers borne off over 15, then the side to move, which is always the
+    opponent.
+
+    Args:
+        batch (BoardBatch): Positions and the player each is encoded for
+
+    Returns:
+        numpy.ndarray: (N, INPUT_UNITS) float64 inputs
+    """
+    counts = batch.raw_counts().astype(np.float64)
+    points = counts[:, :, :POINT_COUNT]
+    inputs = np.empty((len(batch), INPUT_UNITS))
+    tail = 2 * POINT_COUNT * UNITS_PER_POINT
+    units = inputs[:, :tail].reshape(-1, 2, POINT_COUNT, UNITS_PER_POINT)
+    units[..., 0] = points >= 1
+    units[..., 1] = points >= 2
+    units[..., 2] = points >= 3
+    units[..., 3] = np.maximum(points - 3, 0) / 2
+    inputs[:, tail : tail + 2] = counts[:, :, BAR_SLOT] / 2
+    inputs[:, tail + 2 : tail + 4] = counts[:, :, OFF_SLOT] / 15
+    inputs[:, tail + 4] = 0.0
+    inputs[:, tail + 5] = 1.0
+    return inputs
+
+
+def encode_cells(cells, player):
+    """Encode positions into the 198 network inputs, as encode_batch does.
+
+    Args:
+        cells (numpy.ndarray): (N, CELL_COUNT) CompactBoard cell arrays
+        player (int): Player number (1 or 2) the positions are encoded for
+
+    Returns:
+        numpy.ndarray: (N, INPUT_UNITS) float64 inputs
+    """
+    return encode_batch(BoardBatch.from_cells(cells, player))
+
+
+def _sigmoid(values):
+    """Apply the logistic function.
+
+    Args:
+        values (numpy.ndarray): Pre-activations
+
+    Returns:
+        numpy.ndarray: Activations in (0, 1)
+    """
+    return 1.0 / (1.0 + np.exp(-values))
+
+
+class BatchEvaluator(Evaluator):
+    """Evaluator scoring many CompactBoard cell arrays in one call.
+
+    Subclasses implement evaluate_cells; single positions and the plays of
+    a roll go through it, and finished games get their exact results.
+    """
+
+    @abstractmethod
+    def evaluate_cells(self, cells, player):
+        """Estimate the equities of a batch of positions that are not over.
+
+        Args:
+            cells (numpy.ndarray): (N, CELL_COUNT) CompactBoard cell arrays
+            player (int): Player number (1 or 2); the opponent is on roll
+
+        Returns:
+            numpy.ndarray: (N,) equities for player
+        """
+
+    def evaluate(self, board, player):
+        """Estimate the equity of a position for a player.
+
+        Args:
+            board: CompactBoard to evaluate
+            player (int): Player number (1 or 2); the opponent is on roll
+
+        Returns:
+            float: Equity between MIN_EQUITY and MAX_EQUITY
+        """
+        exact = terminal_equity(board, player)
+        if exact is not None:
+            return exact
+        cells = np.frombuffer(bytes(board.__cells__), dtype=np.int8)
+        return float(self.evaluate_cells(cells, player)[0])
+
+    def evaluate_plays(self, board, player, plays):
+        """Evaluate the position reached by each play in one batch.
+
+        Args:
+            board: CompactBoard before the plays; it is left unchanged
+            player (int): Player number (1 or 2) making the plays
+            plays (list): Plays as sequences of (from, to, die) moves
+
+        Returns:
+            list: Equity for player after each play, in the order of plays
+        """
+        rows = []
+        exact = {}
+        for index, play in enumerate(plays):
+            tokens = [board.apply(move, player) for move in play]
+            rows.append(bytes(board.__cells__))
+            result = terminal_equity(board, player)
+            if result is not None:
+                exact[index] = result
+            for token in reversed(tokens):
+                board.revert(token)
+        if not rows:
+            return []
+        cells = np.frombuffer(b"".join(rows), dtype=np.int8)
+        scores = self.evaluate_cells(cells, player).tolist()
+        for index, result in exact.items():
+            scores[index] = result
+        return scores
+
+
+class NeuralEvaluator(BatchEvaluator):
+    """Multilayer perceptron with one sigmoid hidden layer and five outputs.
+
+    The outputs estimate the chances of winning and of winning or losing a
+    gammon or backgammon, each counting the ones above it; the equity is
+    their weighted sum. Weights are float64 NumPy arrays, kept in .npz files.
+    """
+
+    DEFAULT_HIDDEN_UNITS = 40
+
+    def __init__(self, weights=None, hidden_units=DEFAULT_HIDDEN_UNITS, seed=None):
+        """Initialize the evaluator.
+
+        Args:
+            weights (dict, optional): Arrays named by WEIGHT_NAMES. Defaults
+                to small random weights.
+            hidden_units (int, optional): Hidden layer size of random
+                weights. Defaults to DEFAULT_HIDDEN_UNITS.
+            seed (int, optional): Seed of random weights. Defaults to None.
+
+        Raises:
+            ValueError: If weights miss an array or have the wrong shapes
+        """
+        if weights is None:
+            rng = np.random.default_rng(seed)
+            weights = {
+                "hidden_weights": rng.normal(0, 0.1, (INPUT_UNITS, hidden_units)),
+                "hidden_bias": np.zeros(hidden_units),
+                "output_weights": rng.normal(0, 0.1, (hidden_units, OUTPUT_UNITS)),
+                "output_bias": np.zeros(OUTPUT_UNITS),
+            }
+        missing = set(WEIGHT_NAMES) - set(weights)
+        if missing:
+            raise ValueError(f"Missing network weights: {sorted(missing)}")
+        hidden = np.asarray(weights["hidden_bias"]).shape
+        expected = {
+            "hidden_weights": (INPUT_UNITS,) + hidden,
+            "hidden_bias": hidden,
+            "output_weights": hidden + (OUTPUT_UNITS,),
+            "output_bias": (OUTPUT_UNITS,),
+        }
+        for name in WEIGHT_NAMES:
+            if np.shape(weights[name]) != expected[name]:
+                raise ValueError(f"Network weights {name} have the wrong shape")
+        self.__weights__ = {
+            name: np.array(weights[name], dtype=np.float64) for name in WEIGHT_NAMES
+        }
+
+    @classmethod
+    def load(cls, path):
+        """Create an evaluator from a weights file.
+
+        Args:
+            path (str): .npz file written by save
+
+        Returns:
+            NeuralEvaluator: Evaluator with the stored weights
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file does not hold valid weights
+        """
+        with np.load(path) as archive:
+            return cls({name: archive[name] for name in archive.files})
+
+    def save(self, path):
+        """Write the weights to a compressed .npz file.
+
+        Args:
+            path (str): File to write
+
+        Returns:
+            None
+        """
+        np.savez_compressed(path, **self.__weights__)
+
+    def get_weights(self):
+        """Get the network weights.
+
+        Returns:
+            dict: The arrays named by WEIGHT_NAMES; changing them changes
+                the evaluator
+        """
+        return self.__weights__
+
+    def activations(self, inputs):
+        """Run the network on a batch of encoded positions, keeping the
+        hidden layer.
+
+        Args:
+            inputs (numpy.ndarray): (N, INPUT_UNITS) encoded positions
+
+        Returns:
+            tuple: (N, hidden units) hidden activations and (N, OUTPUT_UNITS)
+                output probabilities
+        """
+        weights = self.__weights__
+        hidden = _sigmoid(inputs @ weights["hidden_weights"] + weights["hidden_bias"])
+        outputs = _sigmoid(hidden @ weights["output_weights"] + weights["output_bias"])
+        return hidden, outputs
+
+    def forward(self, inputs):
+        """Run the network on a batch of encoded positions.
+
+        Args:
+            inputs (numpy.ndarray): (N, INPUT_UNITS) encoded positions
+
+        Returns:
+            numpy.ndarray: (N, OUTPUT_UNITS) output probabilities
+        """
+        return self.activations(inputs)[1]
+
+    def evaluate_cells(self, cells, player):
+        """Estimate the equities of a batch of positions that are not over.
+
+        Args:
+            cells (numpy.ndarray): (N, CELL_COUNT) CompactBoard cell arrays
+            player (int): Player number (1 or 2); the opponent is on roll
+
+        Returns:
+            numpy.ndarray: (N,) equities for player
+        """
+        return self.forward(encode_cells(cells, player)) @ OUTPUT_EQUITY - 1.0
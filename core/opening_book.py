@@ -0,0 +1,266 @@
+"""Opening book module for the Backgammon game.
+
+This module reads and writes opening books, which map a position, the side
+on roll and a roll to the best play and its equity as found offline by
+rollouts. Entries are keyed by the Zobrist hash of the position with the
+side to move and by the roll with its lower die first, so the book applies
+to any board reaching a stored position. Books are small, a few hundred
+entries for the first two plies of a game, and are read whole into a dict.
+
+core.book_builder builds the book at DEFAULT_PATH.
+"""
+
+import os
+import struct
+from functools import lru_cache
+
+from .bearoff import DATA_DIRECTORY
+from .compact_board import BAR_CELLS, OFF_CELLS, POINT_COUNT, CompactBoard
+
+MAGIC = b"BGOB"
+VERSION = 1
+# Magic, version, number of entries
+HEADER = struct.Struct("<4sHI")
+# Most moves in a play, with doubles
+MAX_MOVES = 4
+# Hash, low die, high die, moves, (from, to, die) codes of MAX_MOVES moves,
+# equity and its standard error
+RECORD = struct.Struct(f"<QBBB{3 * MAX_MOVES}Bff")
+# Codes of the bar and the off-tray in a move's from and to
+BAR_CODE = POINT_COUNT
+OFF_CODE = POINT_COUNT + 1
+DEFAULT_PATH = os.path.join(DATA_DIRECTORY, "opening_book.db")
+
+
+def book_key(board, player, roll):
+    """Get the key of a position and roll in a book.
+
+    Args:
+        board (CompactBoard): Position
+        player (int): Player number (1 or 2) on roll
+        roll (tuple): The two dice values (die1, die2)
+
+    Returns:
+        tuple: (Zobrist hash with player to move, roll with the lower die
+            first)
+    """
+    return board.get_zobrist_hash(player), tuple(sorted(roll))
+
+
+def mirror_board(board):
+    """Get a position with the two sides swapped.
+
+    Args:
+        board (CompactBoard): Position; it is left unchanged
+
+    Returns:
+        CompactBoard: The position as the other player sees it
+    """
+    cells = board.__cells__
+    mirrored = CompactBoard()
+    for point in range(POINT_COUNT):
+        mirrored.__cells__[point] = -cells[POINT_COUNT - 1 - point]
+    for pair in (BAR_CELLS, OFF_CELLS):
+        mirrored.__cells__[pair[0]] = cells[pair[1]]
+        mirrored.__cells__[pair[1]] = cells[pair[0]]
+    mirrored.refresh_incremental_state()
+    return mirrored
+
+
+def mirror_play(play):
+    """Get a play made by the other player on the mirrored position.
+
+    Args:
+        play (tuple): (from, to, die) moves
+
+    Returns:
+        tuple: The moves with every point reflected
+    """
+    return tuple(
+        tuple(
+            POINT_COUNT - 1 - end if isinstance(end, int) else end
+            for end in (from_point, to_point)
+        )
+        + (die,)
+        for from_point, to_point, die in play
+    )
+
+
+def _encode_play(play):
+    """Encode the moves of a play as RECORD codes.
+
+    Args:
+        play (tuple): Up to MAX_MOVES (from, to, die) moves
+
+    Returns:
+        list: 3 * MAX_MOVES codes, zero after the last move
+    """
+    names = {"bar": BAR_CODE, "off": OFF_CODE}
+    codes = []
+    for from_point, to_point, die in play:
+        codes.extend((names.get(from_point, from_point), names.get(to_point, to_point)))
+        codes.append(die)
+    return codes + [0] * (3 * MAX_MOVES - len(codes))
+
+
+def _decode_play(codes, moves):
+    """Decode the moves of a play from RECORD codes.
+
+    Args:
+        codes (tuple): 3 * MAX_MOVES codes
+        moves (int): Number of moves in the play
+
+    Returns:
+        tuple: (from, to, die) moves
+    """
+    names = {BAR_CODE: "bar", OFF_CODE: "off"}
+    ends = [names.get(code, code) for code in codes]
+    return tuple(
+        (ends[index], ends[index + 1], codes[index + 2])
+        for index in range(0, 3 * moves, 3)
+    )
+
+
+def write_book(entries, path=DEFAULT_PATH):
+    """Write an opening book file.
+
+    The layout is the header, then one RECORD per entry in key order.
+
+    Args:
+        entries (list): (key, play, equity, std_error) of each entry, with
+            key as made by book_key
+        path (str, optional): File to write. Defaults to DEFAULT_PATH.
+
+    Returns:
+        int: Number of entries written
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "wb") as handle:
+        handle.write(HEADER.pack(MAGIC, VERSION, len(entries)))
+        for (key, roll), play, equity, std_error in sorted(
+            entries, key=lambda entry: entry[0]
+        ):
+            handle.write(
+                RECORD.pack(
+                    key, *roll, len(play), *_encode_play(play), equity, std_error
+                )
+            )
+    return len(entries)
+
+
+class OpeningBook:
+    """Best plays of positions and rolls, read from an opening book file."""
+
+    def __init__(self, path=DEFAULT_PATH):
+        """Read a book file.
+
+        Args:
+            path (str, optional): File written by write_book. Defaults to
+                DEFAULT_PATH.
+
+        Raises:
+            OSError: If the file cannot be opened
+            ValueError: If the file is not a complete opening book
+        """
+        with open(path, "rb") as handle:
+            data = handle.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path} is not an opening book")
+        magic, version, count = HEADER.unpack_from(data)
+        if (
+            (magic, version) != (MAGIC, VERSION)
+            or len(data) != HEADER.size + count * RECORD.size
+        ):
+            raise ValueError(f"{path} is not an opening book")
+        self.__entries__ = {}
+        for fields in RECORD.iter_unpack(data[HEADER.size :]):
+            key, low, high, moves = fields[:4]
+            play = _decode_play(fields[4:-2], moves)
+            self.__entries__[(key, (low, high))] = (play, *fields[-2:])
+
+    def get_entry(self, board, player, roll):
+        """Look a position and roll up.
+
+        Args:
+            board (CompactBoard): Position
+            player (int): Player number (1 or 2) on roll
+            roll (tuple): The two dice values (die1, die2)
+
+        Returns:
+            tuple: (play, equity, std_error) with the equity of the play for
+                player, or None if the book has no entry
+        """
+        return self.__entries__.get(book_key(board, player, roll))
+
+    def choose_play(self, board, player, roll):
+        """Get the book play for a position and roll.
+
+        Args:
+            board (CompactBoard): Position
+            player (int): Player number (1 or 2) on roll
+            roll (tuple): The two dice values (die1, die2)
+
+        Returns:
+            tuple: The play as (from, to, die) moves, or None if the book
+                has no entry
+        """
+        entry = self.get_entry(board, player, roll)
+        return None if entry is None else entry[0]
+
+    def __len__(self):
+        """Return the number of entries.
+
+        Returns:
+            int: Number of (position, roll) entries
+        """
+        return len(self.__entries__)
+
+
+@lru_cache(maxsize=None)
+def default_books():
+    """Open the book written at DEFAULT_PATH.
+
+    The file is looked for once per process.
+
+    Returns:
+        tuple: The book if it exists, otherwise empty
+    """
+    if os.path.exists(DEFAULT_PATH):
+        return (OpeningBook(DEFAULT_PATH),)
+    return ()
+
+
+def as_books(book):
+    """Get the books a bot consults from its book argument.
+
+    Args:
+        book: Opening book, sequence of books, or None for no book
+
+    Returns:
+        tuple: The books, in the order to try them
+    """
+    if book is None:
+        return ()
+    if not isinstance(book, (tuple, list)):
+        return (book,)
+    return tuple(book)
+
+
+def consult(books, board, player, roll):
+    """Get the play of the first book with an entry for a position and roll.
+
+    Args:
+        books (tuple): Opening books, tried in order
+        board (CompactBoard): Position
+        player (int): Player number (1 or 2) on roll
+        roll (tuple): The two dice values (die1, die2)
+
+    Returns:
+        tuple: The book play, or None if no book has an entry
+    """
+    for book in books:
+        play = book.choose_play(board, player, roll)
+        if play is not None:
+            return play
+    return None
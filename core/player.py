@@ -13,6 +13,14 @@ class Player:
 
     TOTAL_CHECKERS = 15
 
+    __slots__ = (
+        "__name__",
+        "__color__",
+        "__checkers_count__",
+        "__captured_checkers__",
+        "__bear_off_count__",
+    )
+
     def __init__(self, name, color):
         """Initialize a new player.
 
@@ -0,0 +1,330 @@
+"""Quantized evaluator module for the Backgammon game.
+
+This module contains the QuantizedEvaluator class, which runs a
+NeuralEvaluator network with int8-quantized weights read from a
+memory-mapped file, and write_quantized, which builds that file. Each weight
+matrix has its own scale, the inputs are encoded as integers by table lookup
+and the hidden activations are rounded to 8 bits, so both layers multiply
+small integers. The products are accumulated in float32, which holds every
+sum exactly and runs on BLAS, where NumPy integer matrix products do not.
+
+The file stores the int8 weight steps as float32, so the mapped matrices
+go to BLAS as they are. It is mapped read-only: every process evaluating
+with it shares one physical copy of the weights and allocates none at
+open, and the evaluator pickles as its path.
+
+Build a file from trained weights with:
+
+    python -m core.quantized_evaluator weights.npz [path]
+"""
+
+import mmap
+import os
+import struct
+import sys
+
+import numpy as np
+
+from .bearoff import DATA_DIRECTORY
+from .compact_board import (
+    BAR_CELLS,
+    CELL_COUNT,
+    CHECKERS_PER_PLAYER,
+    OFF_CELLS,
+    POINT_COUNT,
+)
+from .neural_evaluator import (
+    INPUT_UNITS,
+    OUTPUT_EQUITY,
+    OUTPUT_UNITS,
+    UNITS_PER_POINT,
+    BatchEvaluator,
+    NeuralEvaluator,
+    _sigmoid,
+)
+
+MAGIC = b"BGQN"
+VERSION = 2
+# Magic, version, input units, hidden units, output units
+HEADER = struct.Struct("<4sHHHH")
+# Arrays of a weights file, in file order
+SECTIONS = ("scales", "hidden_bias", "output_bias", "hidden_weights", "output_weights")
+DEFAULT_PATH = os.path.join(DATA_DIRECTORY, "quantized_weights.bin")
+
+# Integer steps per input unit, which makes every input an exact integer:
+# the half-checker units, the bar halves and the borne-off fifteenths
+INPUT_SCALE = 30
+# Integer steps of a hidden activation, held in 8 bits
+HIDDEN_SCALE = 255
+# Integer steps of the largest weight of a layer, held in int8
+WEIGHT_SCALE = 127
+# Largest integer float32 holds exactly. Input sums stay below it: at most
+# INPUT_UNITS inputs of 15 bar checkers, 225 steps, times WEIGHT_SCALE
+EXACT_FLOAT32 = 2**24
+
+
+def _point_table(minimum):
+    """Tabulate the integer units of a point for every signed count.
+
+    Args:
+        minimum (int): Smallest count; rows go from minimum to -minimum
+
+    Returns:
+        numpy.ndarray: (2, 1 - 2 * minimum, UNITS_PER_POINT) float32 units
+            of the owner's checkers, then of the opponent's
+    """
+    table = np.zeros((2, 1 - 2 * minimum, UNITS_PER_POINT), dtype=np.float32)
+    for row, count in enumerate(range(minimum, 1 - minimum)):
+        for side, checkers in enumerate((max(count, 0), max(-count, 0))):
+            table[side, row, :3] = [checkers >= 1, checkers >= 2, checkers >= 3]
+            table[side, row, 3] = max(checkers - 3, 0) / 2
+    return table * INPUT_SCALE
+
+
+# Rows indexed by a point's signed count plus CHECKERS_PER_PLAYER
+OWN_UNITS, OTHER_UNITS = _point_table(-CHECKERS_PER_PLAYER)
+
+
+def encode_quantized(cells, player):
+    """Encode positions into integer network inputs.
+
+    The result is exactly encode_cells scaled by INPUT_SCALE.
+
+    Args:
+        cells (numpy.ndarray): (N, CELL_COUNT) CompactBoard cell arrays
+        player (int): Player number (1 or 2) the positions are encoded for
+
+    Returns:
+        numpy.ndarray: (N, INPUT_UNITS) integer-valued float32 inputs
+    """
+    cells = np.asarray(cells, dtype=np.int8).reshape(-1, CELL_COUNT)
+    rows = cells[:, :POINT_COUNT].astype(np.intp)
+    if player == 2:
+        rows = -rows[:, ::-1]
+    rows += CHECKERS_PER_PLAYER
+    inputs = np.empty((len(cells), INPUT_UNITS), dtype=np.float32)
+    tail = 2 * POINT_COUNT * UNITS_PER_POINT
+    points = inputs[:, :tail].reshape(len(cells), 2, POINT_COUNT, UNITS_PER_POINT)
+    points[:, 0] = OWN_UNITS[rows]
+    points[:, 1] = OTHER_UNITS[rows]
+    own, other = (0, 1) if player == 1 else (1, 0)
+    inputs[:, tail] = cells[:, BAR_CELLS[own]] * (INPUT_SCALE // 2)
+    inputs[:, tail + 1] = cells[:, BAR_CELLS[other]] * (INPUT_SCALE // 2)
+    inputs[:, tail + 2] = cells[:, OFF_CELLS[own]] * (INPUT_SCALE // 15)
+    inputs[:, tail + 3] = cells[:, OFF_CELLS[other]] * (INPUT_SCALE // 15)
+    inputs[:, tail + 4] = 0
+    inputs[:, tail + 5] = INPUT_SCALE
+    return inputs
+
+
+def quantize(weights):
+    """Quantize network weights to int8 with one scale per layer.
+
+    Args:
+        weights (dict): Arrays named by WEIGHT_NAMES
+
+    Returns:
+        dict: int8 hidden_weights and output_weights, float32 hidden_bias
+            and output_bias, and the float32 scales of the two layers, the
+            real value of one weight step
+
+    Raises:
+        ValueError: If the hidden layer is too large to sum exactly
+    """
+    hidden_units = len(weights["hidden_bias"])
+    if hidden_units * HIDDEN_SCALE * WEIGHT_SCALE >= EXACT_FLOAT32:
+        raise ValueError("Too many hidden units to quantize")
+    quantized = {}
+    scales = []
+    for name in ("hidden_weights", "output_weights"):
+        matrix = np.asarray(weights[name], dtype=np.float64)
+        scale = float(np.abs(matrix).max()) / WEIGHT_SCALE or 1.0
+        quantized[name] = np.rint(matrix / scale).astype(np.int8)
+        scales.append(scale)
+    quantized["scales"] = np.array(scales, dtype=np.float32)
+    for name in ("hidden_bias", "output_bias"):
+        quantized[name] = np.asarray(weights[name], dtype=np.float32)
+    return quantized
+
+
+def write_quantized(evaluator, path=DEFAULT_PATH):
+    """Write the quantized weights of an evaluator to a file.
+
+    The layout is the header, the two layer scales and the biases, then the
+    weight matrices row by row, all float32. The matrices hold the int8
+    steps of quantize, widened so that they can be multiplied in place.
+
+    Args:
+        evaluator (NeuralEvaluator): Evaluator to quantize
+        path (str, optional): File to write. Defaults to DEFAULT_PATH.
+
+    Returns:
+        int: Bytes written
+
+    Raises:
+        ValueError: If the hidden layer is too large to sum exactly
+    """
+    quantized = quantize(evaluator.get_weights())
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    header = HEADER.pack(
+        MAGIC, VERSION, INPUT_UNITS, len(quantized["hidden_bias"]), OUTPUT_UNITS
+    )
+    with open(path, "wb") as handle:
+        handle.write(header)
+        for name in SECTIONS:
+            handle.write(quantized[name].astype(np.float32).tobytes())
+    return os.path.getsize(path)
+
+
+def _map_arrays(buffer):
+    """Get views of the arrays of a weights file.
+
+    Args:
+        buffer (mmap.mmap): Mapped file
+
+    Returns:
+        dict: Read-only float32 arrays named by SECTIONS, or None if the
+            file is not a complete weights file
+    """
+    if len(buffer) < HEADER.size:
+        return None
+    magic, version, inputs, hidden_units, outputs = HEADER.unpack_from(buffer)
+    if (magic, version, inputs, outputs) != (MAGIC, VERSION, INPUT_UNITS, OUTPUT_UNITS):
+        return None
+    shapes = {
+        "scales": (2,),
+        "hidden_bias": (hidden_units,),
+        "output_bias": (OUTPUT_UNITS,),
+        "hidden_weights": (INPUT_UNITS, hidden_units),
+        "output_weights": (hidden_units, OUTPUT_UNITS),
+    }
+    values = sum(int(np.prod(shape)) for shape in shapes.values())
+    if len(buffer) != HEADER.size + np.dtype(np.float32).itemsize * values:
+        return None
+    arrays = {}
+    offset = HEADER.size
+    for name in SECTIONS:
+        shape = shapes[name]
+        arrays[name] = np.frombuffer(buffer, np.float32, int(np.prod(shape)), offset)
+        arrays[name] = arrays[name].reshape(shape)
+        offset += arrays[name].nbytes
+    return arrays
+
+
+class QuantizedEvaluator(BatchEvaluator):
+    """Network evaluator with int8-quantized weights in a memory-mapped file.
+
+    Equities follow the NeuralEvaluator the file was written from to within
+    a few hundredths of a point for trained weights.
+    """
+
+    def __init__(self, path=DEFAULT_PATH):
+        """Map a weights file.
+
+        Args:
+            path (str, optional): File written by write_quantized. Defaults
+                to DEFAULT_PATH.
+
+        Raises:
+            OSError: If the file cannot be opened
+            ValueError: If the file is not a complete weights file
+        """
+        self.__path__ = path
+        with open(path, "rb") as handle:
+            self.__map__ = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__arrays__ = _map_arrays(self.__map__)
+        if self.__arrays__ is None:
+            self.__map__.close()
+            raise ValueError(f"{path} is not a quantized weights file")
+
+    def get_quantized_weights(self):
+        """Get the arrays of the weights file.
+
+        Returns:
+            dict: Read-only views of the mapped arrays, as made by quantize
+                but with the weight steps as float32
+        """
+        return self.__arrays__
+
+    def forward(self, inputs):
+        """Run the network on a batch of integer inputs.
+
+        Args:
+            inputs (numpy.ndarray): (N, INPUT_UNITS) inputs from
+                encode_quantized
+
+        Returns:
+            numpy.ndarray: (N, OUTPUT_UNITS) float32 output probabilities
+        """
+        arrays = self.__arrays__
+        hidden_scale, output_scale = arrays["scales"].tolist()
+        products = inputs @ arrays["hidden_weights"]
+        hidden = _sigmoid(
+            products * np.float32(hidden_scale / INPUT_SCALE) + arrays["hidden_bias"]
+        )
+        steps = np.rint(hidden * np.float32(HIDDEN_SCALE))
+        products = steps @ arrays["output_weights"]
+        return _sigmoid(
+            products * np.float32(output_scale / HIDDEN_SCALE) + arrays["output_bias"]
+        )
+
+    def evaluate_cells(self, cells, player):
+        """Estimate the equities of a batch of positions that are not over.
+
+        Args:
+            cells (numpy.ndarray): (N, CELL_COUNT) CompactBoard cell arrays
+            player (int): Player number (1 or 2); the opponent is on roll
+
+        Returns:
+            numpy.ndarray: (N,) equities for player
+        """
+        outputs = self.forward(encode_quantized(cells, player))
+        return outputs @ OUTPUT_EQUITY - 1.0
+
+    def close(self):
+        """Unmap the file.
+
+        The arrays of get_quantized_weights must not be used afterwards.
+
+        Returns:
+            None
+        """
+        self.__arrays__ = {}
+        self.__map__.close()
+
+    def __getstate__(self):
+        """Pickle the evaluator as its path.
+
+        Returns:
+            dict: The path of the file
+        """
+        return {"path": self.__path__}
+
+    def __setstate__(self, state):
+        """Map the file again after unpickling.
+
+        Args:
+            state (dict): The path of the file
+
+        Returns:
+            None
+        """
+        self.__init__(state["path"])
+
+
+def main():
+    """Quantize a weights file from the command line.
+
+    Returns:
+        None
+    """
+    if len(sys.argv) < 2:
+        raise SystemExit("Usage: python -m core.quantized_evaluator weights.npz [path]")
+    path = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_PATH
+    size = write_quantized(NeuralEvaluator.load(sys.argv[1]), path)
+    print(f"Wrote {path} ({size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
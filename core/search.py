@@ -0,0 +1,539 @@
+"""Search module for the Backgammon game.
+
+This module contains ExpectiminimaxSearch, an n-ply search on CompactBoard
+positions. Chance nodes branch over the 21 distinct rolls, weighted 1/36 for
+doubles and 2/36 otherwise, and are pruned with the Star1 and Star2 bounds of
+Ballard's *-minimax using the evaluator's equity bounds. Plays are
+ordered by their 0-ply evaluation before being searched deeper.
+"""
+
+import time
+
+from .compact_board import CHECKERS_PER_PLAYER, OFF_CELLS, CompactBoard
+from .evaluator import HeuristicEvaluator, terminal_equity
+from .move_generator import generate_plays
+from .opening_book import as_books, consult
+from .transposition_table import (
+    EXACT,
+    LOWER_BOUND,
+    UPPER_BOUND,
+    TranspositionTable,
+)
+
+# The 21 distinct rolls and their probabilities
+ROLLS = tuple(
+    ((die1, die2), (1 if die1 == die2 else 2) / 36)
+    for die1 in range(1, 7)
+    for die2 in range(die1, 7)
+)
+
+INFINITY = float("inf")
+# Most checkers borne off by one play, with doubles
+MAX_CHECKERS_PER_PLY = 4
+
+
+class ExpectiminimaxSearch:
+    """Expectiminimax with alpha-beta at max nodes and Star1/Star2 at chance nodes.
+
+    A ply is one play for a known roll. At one ply the play with the best
+    evaluation is chosen; each further ply averages the opponent's best reply
+    over ROLLS. Values are equities for the player who made the last play.
+    """
+
+    COUNTERS = (
+        "max_nodes",
+        "chance_nodes",
+        "evaluations",
+        "max_cutoffs",
+        "star1_cutoffs",
+        "star2_cutoffs",
+        "rolls_searched",
+        "rolls_pruned",
+    )
+
+    def __init__(self, evaluator=None, plies=2, transposition_table=None, book=None):
+        """Initialize the search.
+
+        Args:
+            evaluator (Evaluator, optional): Leaf evaluator. Defaults to a new
+                HeuristicEvaluator.
+            plies (int, optional): Default search depth. Defaults to 2.
+            transposition_table (TranspositionTable, optional): Table of
+                searched chance nodes, which may only be shared between
+                searches using the same evaluator. Defaults to a new
+                TranspositionTable.
+            book (optional): Opening book, or sequence of books, consulted
+                by choose_play as by GreedyBot. Defaults to None, without
+                books.
+
+        Raises:
+            ValueError: If plies is lower than 1
+        """
+        if plies < 1:
+            raise ValueError("Search depth must be at least 1 ply")
+        self.__evaluator__ = HeuristicEvaluator() if evaluator is None else evaluator
+        self.__plies__ = plies
+        self.__table__ = (
+            TranspositionTable() if transposition_table is None else transposition_table
+        )
+        self.__book__ = as_books(book)
+        self.__counters__ = dict.fromkeys(self.COUNTERS, 0)
+        self.__elapsed__ = 0.0
+
+    def get_evaluator(self):
+        """Get the leaf evaluator.
+
+        Returns:
+            Evaluator: The search's evaluator
+        """
+        return self.__evaluator__
+
+    def get_transposition_table(self):
+        """Get the transposition table.
+
+        Returns:
+            TranspositionTable: The table, whose get_stats() reports hits
+        """
+        return self.__table__
+
+    def choose_play(self, board, player, roll, plays=None):
+        """Choose the best legal play for a roll, as GreedyBot.choose_play.
+
+        Positions and rolls held by the opening book are not searched.
+
+        Args:
+            board: Board or CompactBoard to play on; it is left unchanged
+            player (int): Player number (1 or 2)
+            roll (tuple): The two dice values (die1, die2)
+            plays (list, optional): Legal plays, if already generated
+
+        Returns:
+            tuple: The chosen play as (from, to, die) moves; empty if the
+                player cannot move
+        """
+        if not isinstance(board, CompactBoard):
+            board = CompactBoard.from_board(board)
+        play = consult(self.__book__, board, player, roll)
+        if play is None:
+            play = self.search(board, player, roll, plays=plays)[0]
+        return play
+
+    def search(self, board, player, roll, plies=None, plays=None):
+        """Find the best play for a roll and its searched equity.
+
+        Args:
+            board: Board or CompactBoard to play on; it is left unchanged
+            player (int): Player number (1 or 2)
+            roll (tuple): The two dice values (die1, die2)
+            plies (int, optional): Search depth. Defaults to the search's.
+            plays (list, optional): Legal plays, if already generated
+
+        Returns:
+            tuple: (play, equity) with the play as (from, to, die) moves, empty
+                if the player cannot move, and the equity for player
+        """
+        if not isinstance(board, CompactBoard):
+            board = CompactBoard.from_board(board)
+        plies = self.__plies__ if plies is None else plies
+        start = time.perf_counter()
+        try:
+            ordered = self._ordered_plays(board, player, roll, plays)
+            if not ordered:
+                return (), self._chance(board, player, plies - 1, -INFINITY, INFINITY)
+            if plies == 1 or len(ordered) == 1:
+                best_value, best_play = ordered[0]
+                if plies > 1:
+                    best_value = self._after_play(
+                        board, player, best_play, plies, (-INFINITY, INFINITY)
+                    )
+                return tuple(best_play), best_value
+
+            best_value, best_play = -INFINITY, ordered[0][1]
+            for _, play in ordered:
+                value = self._after_play(
+                    board, player, play, plies, (best_value, INFINITY)
+                )
+                if value > best_value:
+                    best_value, best_play = value, play
+            return tuple(best_play), best_value
+        finally:
+            self.__elapsed__ += time.perf_counter() - start
+
+    def evaluate_position(self, board, player, plies=None):
+        """Get the searched equity of a position with the opponent on roll.
+
+        Args:
+            board: Board or CompactBoard to evaluate; it is left unchanged
+            player (int): Player number (1 or 2) who made the last play
+            plies (int, optional): Number of plies searched from the
+                opponent's roll; 0 is the plain evaluation. Defaults to the
+                search's depth.
+
+        Returns:
+            float: Equity for player
+        """
+        if not isinstance(board, CompactBoard):
+            board = CompactBoard.from_board(board)
+        plies = self.__plies__ if plies is None else plies
+        start = time.perf_counter()
+        try:
+            return self._chance(board, player, plies, -INFINITY, INFINITY)
+        finally:
+            self.__elapsed__ += time.perf_counter() - start
+
+    def get_stats(self):
+        """Get the search counters.
+
+        Returns:
+            dict: The COUNTERS, plus nodes (max, chance and leaf), elapsed
+                seconds, nodes_per_second, and prune_rate, the share of
+                chance node rolls that were never searched
+        """
+        stats = dict(self.__counters__)
+        stats["nodes"] = (
+            stats["max_nodes"] + stats["chance_nodes"] + stats["evaluations"]
+        )
+        stats["elapsed"] = self.__elapsed__
+        stats["nodes_per_second"] = (
+            stats["nodes"] / self.__elapsed__ if self.__elapsed__ else 0.0
+        )
+        rolls = stats["rolls_searched"] + stats["rolls_pruned"]
+        stats["prune_rate"] = stats["rolls_pruned"] / rolls if rolls else 0.0
+        return stats
+
+    def reset_stats(self):
+        """Reset the counters and the elapsed time.
+
+        Returns:
+            None
+        """
+        self.__counters__ = dict.fromkeys(self.COUNTERS, 0)
+        self.__elapsed__ = 0.0
+
+    def _ordered_plays(self, board, player, roll, plays=None):
+        """Generate the plays for a roll, best 0-ply evaluation first.
+
+        Args:
+            board: CompactBoard to play on
+            player (int): Player number (1 or 2)
+            roll (tuple): The two dice values (die1, die2)
+            plays (list, optional): Legal plays, if already generated
+
+        Returns:
+            list: (0-ply equity, play) pairs in decreasing equity order
+        """
+        if plays is None:
+            plays = generate_plays(board, player, roll)
+        if not plays:
+            return []
+        scores = self.__evaluator__.evaluate_plays(board, player, plays)
+        self.__counters__["evaluations"] += len(plays)
+        ordered = list(zip(scores, plays))
+        ordered.sort(key=lambda pair: pair[0], reverse=True)
+        return ordered
+
+    def _after_play(self, board, player, play, plies, window):
+        """Search the chance node reached by a play.
+
+        Args:
+            board: CompactBoard before the play; it is left unchanged
+            player (int): Player number (1 or 2) making the play
+            play (tuple): The play as (from, to, die) moves
+            plies (int): Plies left including this play
+            window (tuple): (alpha, beta) bounds of the search window
+
+        Returns:
+            float: Equity for player after the play
+        """
+        tokens = [board.apply(move, player) for move in play]
+        value = self._chance(board, player, plies - 1, *window)
+        for token in reversed(tokens):
+            board.revert(token)
+        return value
+
+    def _candidates(self, board, player, roll, plies):
+        """Generate the plays for a roll in search order.
+
+        Args:
+            board: CompactBoard to play on
+            player (int): Player number (1 or 2)
+            roll (tuple): The two dice values (die1, die2)
+            plies (int): Plies left including this play
+
+        Returns:
+            list: At one ply, where every play is evaluated anyway, the plays
+                as generated; deeper, the _ordered_plays pairs
+        """
+        if plies == 1:
+            return generate_plays(board, player, roll)
+        return self._ordered_plays(board, player, roll)
+
+    def _max(self, board, player, plies, window, candidates):
+        """Search the best play of a player for a roll.
+
+        Fails soft: a value at or above the top of the window is a lower
+        bound, one at or below its bottom an upper bound.
+
+        Args:
+            board: CompactBoard to play on; it is left unchanged
+            player (int): Player number (1 or 2) on roll
+            plies (int): Plies left including this play
+            window (tuple): (alpha, beta) bounds of the search window
+            candidates (list): The plays for the roll, from _candidates
+
+        Returns:
+            float: Equity for player after the best play
+        """
+        counters = self.__counters__
+        counters["max_nodes"] += 1
+        alpha, beta = window
+        if not candidates:
+            # No legal play: the opponent rolls in the same position
+            return self._chance(board, player, plies - 1, alpha, beta)
+        if plies == 1:
+            return self._max_leaf(board, player, beta, candidates)
+
+        best = -INFINITY
+        for _, play in candidates:
+            value = self._after_play(
+                board, player, play, plies, (max(alpha, best), beta)
+            )
+            best = max(best, value)
+            if best >= beta:
+                counters["max_cutoffs"] += 1
+                return best
+        return best
+
+    def _max_leaf(self, board, player, beta, plays):
+        """Find the best 0-ply evaluation of a player's plays.
+
+        Evaluations are shared through the transposition table as zero-ply
+        entries. Any exact entry is reused, since a deeper one replaces the
+        zero-ply entry and is the better estimate. Evaluation stops at the
+        first play reaching beta.
+
+        Args:
+            board: CompactBoard to play on; it is left unchanged
+            player (int): Player number (1 or 2) on roll
+            beta (float): Upper bound of the search window
+            plays (list): Legal plays, at least one
+
+        Returns:
+            float: Equity for player after the best play
+        """
+        counters = self.__counters__
+        evaluate = self.__evaluator__.evaluate
+        table = self.__table__
+        best = -INFINITY
+        for play in plays:
+            tokens = [board.apply(move, player) for move in play]
+            key = board.get_zobrist_hash(3 - player)
+            entry = table.lookup(key, 3 - player)
+            if entry is not None and entry[2] == EXACT:
+                value = entry[0]
+            else:
+                value = evaluate(board, player)
+                table.store(key, 3 - player, 0, value)
+                counters["evaluations"] += 1
+            for token in reversed(tokens):
+                board.revert(token)
+            best = max(best, value)
+            if best >= beta:
+                counters["max_cutoffs"] += 1
+                break
+        return best
+
+    def _probe(self, board, player, roll, plies, threshold):
+        """Search one play of a player for a lower bound of the best play.
+
+        The first candidate is searched: the first generated play at one ply,
+        the best 0-ply play deeper. The search fails high at threshold.
+
+        Args:
+            board: CompactBoard to play on; it is left unchanged
+            player (int): Player number (1 or 2) on roll
+            roll (tuple): The two dice values (die1, die2)
+            plies (int): Plies left including this play
+            threshold (float): Value above which the bound need not be exact
+
+        Returns:
+            tuple: (candidates, bound), with the _candidates for reuse by _max
+        """
+        candidates = self._candidates(board, player, roll, plies)
+        if not candidates:
+            return candidates, self._chance(
+                board, player, plies - 1, -INFINITY, threshold
+            )
+        play = candidates[0] if plies == 1 else candidates[0][1]
+        return candidates, self._after_play(
+            board, player, play, plies, (-INFINITY, threshold)
+        )
+
+    def _star2_bounds(self, board, player, plies, alpha, high):
+        """Bound the value of each roll of a chance node by probing.
+
+        The opponent does at least as well as any one reply, so each probe
+        bounds the value of its roll for player from above. Probing is
+        skipped when the window is open below, as no bound can cut then.
+
+        Args:
+            board: CompactBoard of the chance node; it is left unchanged
+            player (int): Player number (1 or 2) who made the last play
+            plies (int): Plies left for the opponent and later players
+            alpha (float): Lower bound of the search window
+            high (float): Upper bound of the value of any roll
+
+        Returns:
+            tuple: (uppers, candidates), lists in ROLLS order with the upper
+                bound of each roll and its _candidates, or None if not probed
+        """
+        uppers = [high] * len(ROLLS)
+        candidates = [None] * len(ROLLS)
+        if alpha == -INFINITY:
+            return uppers, candidates
+
+        upper_total = high
+        for index, (roll, probability) in enumerate(ROLLS):
+            others = upper_total - probability * high
+            # Only a probe at or above this threshold settles a fail low
+            threshold = (others - alpha) / probability
+            candidates[index], probe = self._probe(
+                board, 3 - player, roll, plies, threshold
+            )
+            uppers[index] = min(high, -probe)
+            upper_total = others + probability * uppers[index]
+            if upper_total <= alpha:
+                break
+        return uppers, candidates
+
+    def _bounds(self, board, plies):
+        """Bound the value of a chance node.
+
+        No game can end within the plies left when both players have more
+        checkers to bear off than four per ply, so only the evaluator's
+        estimates, not the gammon and backgammon results, can be reached.
+
+        Args:
+            board: CompactBoard of the chance node
+            plies (int): Plies left below the chance node
+
+        Returns:
+            tuple: (lower bound, upper bound) of the equity
+        """
+        evaluator = self.__evaluator__
+        cells = board.__cells__
+        borne_off = max(cells[OFF_CELLS[0]], cells[OFF_CELLS[1]])
+        checkers_left = CHECKERS_PER_PLAYER - borne_off
+        if checkers_left > MAX_CHECKERS_PER_PLY * plies:
+            return evaluator.MIN_ESTIMATE, evaluator.MAX_ESTIMATE
+        return evaluator.MIN_EQUITY, evaluator.MAX_EQUITY
+
+    def _chance(self, board, player, plies, alpha, beta):
+        """Get the equity of a position with the opponent on roll.
+
+        Finished games score their result. Other positions are looked up in
+        the transposition table, where a result searched at least as deep is
+        reused if its bound settles the window; otherwise they are evaluated
+        at zero plies, an exact result whatever the window, or averaged over
+        the rolls by _expect, and the result is stored with its bound type.
+
+        Args:
+            board: CompactBoard to evaluate; it is left unchanged
+            player (int): Player number (1 or 2) who made the last play
+            plies (int): Plies left for the opponent and later players
+            alpha (float): Lower bound of the search window
+            beta (float): Upper bound of the search window
+
+        Returns:
+            float: Equity for player; at or below alpha an upper bound, at
+                or above beta a lower bound
+        """
+        exact = terminal_equity(board, player)
+        if exact is not None:
+            return exact
+
+        key = board.get_zobrist_hash(3 - player)
+        entry = self.__table__.lookup(key, 3 - player)
+        if entry is not None and entry[1] >= plies:
+            equity, _, bound = entry
+            if (
+                bound == EXACT
+                or (bound == LOWER_BOUND and equity >= beta)
+                or (bound == UPPER_BOUND and equity <= alpha)
+            ):
+                return equity
+
+        if plies == 0:
+            self.__counters__["evaluations"] += 1
+            value = self.__evaluator__.evaluate(board, player)
+            bound = EXACT
+        else:
+            value = self._expect(board, player, plies, alpha, beta)
+            if value <= alpha:
+                bound = UPPER_BOUND
+            elif value >= beta:
+                bound = LOWER_BOUND
+            else:
+                bound = EXACT
+        self.__table__.store(key, 3 - player, plies, value, bound)
+        return value
+
+    # pylint: disable=too-many-locals  # the Star1 loop keeps its bounds in locals
+    def _expect(self, board, player, plies, alpha, beta):
+        """Average the opponent's best replies over the 21 rolls.
+
+        Star2 first probes one reply to each roll for tighter upper bounds;
+        Star1 then stops as soon as the rolls searched, with the bounds of the
+        others, settle the value outside the window. Fails soft like _max.
+
+        Args:
+            board: CompactBoard of a game that is not over; it is left
+                unchanged
+            player (int): Player number (1 or 2) who made the last play
+            plies (int): Plies left for the opponent and later players, at
+                least 1
+            alpha (float): Lower bound of the search window
+            beta (float): Upper bound of the search window
+
+        Returns:
+            float: Equity for player
+        """
+        counters = self.__counters__
+        counters["chance_nodes"] += 1
+        low, high = self._bounds(board, plies)
+        uppers, candidates = self._star2_bounds(board, player, plies, alpha, high)
+        upper_total = sum(
+            probability * upper for (_, probability), upper in zip(ROLLS, uppers)
+        )
+        if upper_total <= alpha:
+            counters["star2_cutoffs"] += 1
+            counters["rolls_pruned"] += len(ROLLS)
+            return upper_total
+
+        total = 0.0
+        remaining = 1.0
+        for index, (roll, probability) in enumerate(ROLLS):
+            upper_total -= probability * uppers[index]
+            remaining -= probability
+            child_alpha = (alpha - total - upper_total) / probability
+            child_beta = (beta - total - remaining * low) / probability
+            if child_alpha >= uppers[index]:
+                # Star1: no reply to this roll can lift the value to alpha
+                counters["rolls_pruned"] += 1
+                value = uppers[index]
+            else:
+                if candidates[index] is None:
+                    candidates[index] = self._candidates(
+                        board, 3 - player, roll, plies
+                    )
+                window = (-child_beta, -child_alpha)
+                value = -self._max(board, 3 - player, plies, window, candidates[index])
+                counters["rolls_searched"] += 1
+            total += probability * value
+            if index + 1 < len(ROLLS) and not child_alpha < value < child_beta:
+                counters["star1_cutoffs"] += 1
+                counters["rolls_pruned"] += len(ROLLS) - index - 1
+                if value <= child_alpha:
+                    return total + upper_total
+                return total + remaining * low
+        return total
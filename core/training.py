@@ -0,0 +1,491 @@
+"""Training module for the Backgammon game.
+
+This module contains the TDTrainer class, which improves a NeuralEvaluator
+by TD(lambda) self-play as in TD-Gammon. Worker processes play rounds of
+games with the current weights and send back each game as its sequence of
+positions and its outcome, which gives the (position, next position,
+outcome) transitions. The learner replays the games in order with an
+offline TD(lambda) update computed for the whole game in a few matrix
+products, then broadcasts the new weights with the next round.
+
+Game seeds come from the trainer seed and the game number, so a run gives
+the same weights with any number of workers, and a run resumed from a
+checkpoint continues exactly where it stopped.
+
+Run from the repository root:
+
+    python -m core.training [games] [checkpoint] [workers]
+"""
+
+import logging
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .bearoff import DATA_DIRECTORY
+from .board_batch import BoardBatch
+from .bot import GreedyBot, play_game
+from .compact_board import CELL_COUNT, CompactBoard
+from .dice import Dice
+from .evaluator import HeuristicEvaluator, game_result
+from .neural_evaluator import WEIGHT_NAMES, NeuralEvaluator, encode_batch
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT = os.path.join(DATA_DIRECTORY, "td_checkpoint.npz")
+# Columns of the learning curve kept in the history and the checkpoints
+HISTORY_FIELDS = ("games", "elapsed", "games_per_hour", "td_error", "benchmark")
+MAX_TURNS = 10000
+# The outputs seen by the opponent: their win is our loss, and their
+# gammons and backgammons are ours lost
+SWAPPED_OUTPUTS = [0, 3, 4, 1, 2]
+SWAPPED_SIGNS = np.array([-1.0, 1.0, 1.0, 1.0, 1.0])
+
+
+def play_training_game(evaluator, seed, max_turns=MAX_TURNS):
+    """Play a self-play game with a greedy bot and record its positions.
+
+    Args:
+        evaluator (Evaluator): Evaluator choosing the plays of both sides
+        seed (int): Seed of the dice and of the side moving first
+        max_turns (int, optional): Turn limit. Defaults to MAX_TURNS.
+
+    Returns:
+        tuple: (cells, players, result): the (T, CELL_COUNT) int8 cells of
+            the position after each turn, the (T,) player who made each turn
+            and the game_result of the last position; None if the turn
+            limit was reached first
+    """
+    rng = random.Random(seed)
+    dice = Dice(rng)
+    bot = GreedyBot(evaluator)
+    board = CompactBoard()
+    board.setup_initial_position()
+    player = rng.choice((1, 2))
+    rows = []
+    players = []
+    for _ in range(max_turns):
+        for move in bot.choose_play(board, player, dice.roll()):
+            board.apply(move, player)
+        rows.append(bytes(board.__cells__))
+        players.append(player)
+        result = game_result(board)
+        if result is not None:
+            cells = np.frombuffer(b"".join(rows), dtype=np.int8)
+            return (
+                cells.reshape(-1, CELL_COUNT),
+                np.array(players, dtype=np.int8),
+                result,
+            )
+        player = 3 - player
+    return None
+
+
+def _play_games(weights, seeds):
+    """Play self-play games in a worker process.
+
+    Args:
+        weights (dict): Network weights named by WEIGHT_NAMES
+        seeds (list): Seed of each game
+
+    Returns:
+        list: play_training_game results, in the order of seeds
+    """
+    evaluator = NeuralEvaluator(weights)
+    return [play_training_game(evaluator, seed) for seed in seeds]
+
+
+def swap_sides(outputs):
+    """Turn network outputs into the outputs for the other player.
+
+    Args:
+        outputs (numpy.ndarray): (N, OUTPUT_UNITS) outcome probabilities
+
+    Returns:
+        numpy.ndarray: The probabilities seen by the opponent
+    """
+    swapped = outputs[:, SWAPPED_OUTPUTS]
+    swapped[:, 0] = 1.0 - swapped[:, 0]
+    return swapped
+
+
+def _encode_turns(cells, players):
+    """Encode each position for the player who made the turn.
+
+    Args:
+        cells (numpy.ndarray): (T, CELL_COUNT) cells
+        players (numpy.ndarray): (T,) player of each turn
+
+    Returns:
+        numpy.ndarray: (T, INPUT_UNITS) inputs
+    """
+    return encode_batch(BoardBatch.from_cells(cells, players))
+
+
+def _traces(errors, trace_decay):
+    """Sum each TD error with the later ones, decayed by their distance.
+
+    Consecutive positions are valued for alternate players, so an error
+    an odd number of turns later enters with its sides swapped: its win
+    unit negated and its gammon and backgammon units exchanged.
+
+    Args:
+        errors (numpy.ndarray): (T, OUTPUT_UNITS) TD errors in game order
+        trace_decay (float): Lambda, between 0 and 1
+
+    Returns:
+        numpy.ndarray: (T, OUTPUT_UNITS) sums, where row k is the sum over
+            t >= k of trace_decay ** (t - k) times errors[t] seen by the
+            player of position k
+    """
+    odd = np.arange(len(errors)) % 2 == 1
+    # Bring every error to the frame of the first position, sum, and back
+    swapped = errors[:, SWAPPED_OUTPUTS] * SWAPPED_SIGNS
+    aligned = np.where(odd[:, None], swapped, errors)
+    steps = np.arange(len(errors))
+    lags = np.maximum(steps[None, :] - steps[:, None], 0)
+    sums = np.triu(float(trace_decay) ** lags) @ aligned
+    return np.where(odd[:, None], sums[:, SWAPPED_OUTPUTS] * SWAPPED_SIGNS, sums)
+
+
+def td_update(evaluator, game, learning_rate, trace_decay):
+    """Apply the offline TD(lambda) update of one game to the weights.
+
+    Each position is valued for the player who moved into it, so the target
+    of a position is the next one's outputs seen from the other side, and
+    the target of the last position before the end is the actual outcome.
+    With traces decaying by trace_decay, the update is the sum over the
+    positions of the gradient of their outputs times the decayed sum of the
+    TD errors from there on, which backpropagates all of them at once.
+
+    Args:
+        evaluator (NeuralEvaluator): Evaluator whose weights are updated
+        game (tuple): (cells, players, result) from play_training_game
+        learning_rate (float): Step size
+        trace_decay (float): Lambda, between 0 and 1
+
+    Returns:
+        float: Mean absolute TD error of the game
+    """
+    cells, players, (_, points) = game
+    weights = evaluator.get_weights()
+    inputs = _encode_turns(cells[:-1], players[:-1])
+    hidden, outputs = evaluator.activations(inputs)
+    # The last turn is the winner's
+    final = np.array([[1.0, points >= 2, points >= 3, 0.0, 0.0]])
+    errors = swap_sides(np.vstack((outputs[1:], final))) - outputs
+    output_delta = _traces(errors, trace_decay) * outputs * (1.0 - outputs)
+    output_delta *= learning_rate
+    hidden_delta = output_delta @ weights["output_weights"].T * hidden * (1.0 - hidden)
+    weights["output_weights"] += hidden.T @ output_delta
+    weights["output_bias"] += output_delta.sum(axis=0)
+    weights["hidden_weights"] += inputs.T @ hidden_delta
+    weights["hidden_bias"] += hidden_delta.sum(axis=0)
+    return float(np.abs(errors).mean())
+
+
+def benchmark(evaluator, opponent=None, games=100, seed=0):
+    """Measure a greedy bot using an evaluator against another bot.
+
+    Args:
+        evaluator (Evaluator): Evaluator to measure
+        opponent (optional): Opposing bot. Defaults to a GreedyBot with a
+            HeuristicEvaluator, without bear-off databases or opening books.
+        games (int, optional): Games to play, alternating sides. Defaults
+            to 100.
+        seed (int, optional): Seed of the dice. Defaults to 0.
+
+    Returns:
+        float: Average points won per game by the evaluator's bot
+    """
+    if opponent is None:
+        opponent = GreedyBot(HeuristicEvaluator())
+    bot = GreedyBot(evaluator)
+    total = 0
+    for game in range(games):
+        side = 1 + game % 2
+        bots = (bot, opponent) if side == 1 else (opponent, bot)
+        result = play_game(bots, dice=Dice(random.Random(seed + game)))
+        if result is not None:
+            winner, points = result
+            total += points if winner == side else -points
+    return total / games if games else 0.0
+
+
+class TDTrainer:
+    """TD(lambda) self-play trainer of a NeuralEvaluator.
+
+    Training runs in rounds of GAMES_PER_ROUND games, all played with the
+    weights of the start of the round. Games reaching the turn limit are
+    dropped.
+    """
+
+    GAMES_PER_ROUND = 50
+
+    def __init__(
+        self, evaluator=None, workers=None, learning_rate=0.1, trace_decay=0.7, seed=0
+    ):
+        """Initialize the trainer.
+
+        Args:
+            evaluator (NeuralEvaluator, optional): Evaluator to train in
+                place. Defaults to a new NeuralEvaluator seeded with seed.
+            workers (int, optional): Worker processes; 1 plays in this
+                process. Defaults to os.cpu_count().
+            learning_rate (float, optional): Step size. Defaults to 0.1.
+            trace_decay (float, optional): Lambda, between 0 and 1.
+                Defaults to 0.7.
+            seed (int, optional): Seed of the games. Defaults to 0.
+
+        Raises:
+            ValueError: If workers is lower than 1 or trace_decay is not
+                between 0 and 1
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("Workers must be at least 1")
+        if not 0.0 <= trace_decay <= 1.0:
+            raise ValueError("Trace decay must be between 0 and 1")
+        if evaluator is None:
+            evaluator = NeuralEvaluator(seed=seed)
+        self.__evaluator__ = evaluator
+        self.__workers__ = workers
+        self.__learning_rate__ = learning_rate
+        self.__trace_decay__ = trace_decay
+        self.__seed__ = seed
+        # Games played and seconds spent over all sessions
+        self.__progress__ = {"games": 0, "elapsed": 0.0}
+        self.__history__ = []
+
+    @classmethod
+    def resume(cls, path, workers=None):
+        """Create a trainer from a checkpoint.
+
+        Args:
+            path (str): File written by save_checkpoint
+            workers (int, optional): Worker processes. Defaults to
+                os.cpu_count().
+
+        Returns:
+            TDTrainer: Trainer continuing the checkpointed run
+
+        Raises:
+            OSError: If the file cannot be read
+            KeyError: If the file is not a checkpoint
+        """
+        with np.load(path) as archive:
+            progress = np.asarray(archive["progress"]).tolist()
+            learning_rate, trace_decay, seed, games, elapsed = progress
+            trainer = cls(
+                NeuralEvaluator({name: archive[name] for name in WEIGHT_NAMES}),
+                workers,
+                learning_rate,
+                trace_decay,
+                int(seed),
+            )
+            trainer.__progress__ = {"games": int(games), "elapsed": float(elapsed)}
+            history = np.asarray(archive["history"]).tolist()
+            trainer.__history__ = [dict(zip(HISTORY_FIELDS, row)) for row in history]
+            for entry in trainer.__history__:
+                entry["games"] = int(entry["games"])
+        return trainer
+
+    def save_checkpoint(self, path):
+        """Write the weights and training progress to a file.
+
+        The file is replaced atomically, and NeuralEvaluator.load reads the
+        weights from it.
+
+        Args:
+            path (str): .npz file to write
+
+        Returns:
+            None
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        progress = np.array(
+            [
+                self.__learning_rate__,
+                self.__trace_decay__,
+                self.__seed__,
+                self.__progress__["games"],
+                self.__progress__["elapsed"],
+            ]
+        )
+        history = np.array(
+            [[entry[field] for field in HISTORY_FIELDS] for entry in self.__history__]
+        ).reshape(-1, len(HISTORY_FIELDS))
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as handle:
+            np.savez(
+                handle,
+                progress=progress,
+                history=history,
+                **self.__evaluator__.get_weights(),
+            )
+        os.replace(temporary, path)
+
+    def get_evaluator(self):
+        """Get the evaluator being trained.
+
+        Returns:
+            NeuralEvaluator: The evaluator
+        """
+        return self.__evaluator__
+
+    def get_games(self):
+        """Get the number of games played over all sessions.
+
+        Returns:
+            int: Games played, including the dropped ones
+        """
+        return self.__progress__["games"]
+
+    def get_history(self):
+        """Get the learning curve.
+
+        Returns:
+            list: One dict per round with the HISTORY_FIELDS: games played,
+                elapsed seconds, games_per_hour of the round, its mean
+                absolute td_error, and the benchmark points per game, or
+                NaN if none were played
+        """
+        return self.__history__
+
+    def train(self, games, checkpoint=None, benchmark_games=0):
+        """Train on a number of self-play games.
+
+        Args:
+            games (int): Games to play
+            checkpoint (str, optional): File saved after every round.
+                Defaults to None (no checkpoints).
+            benchmark_games (int, optional): Games against the heuristic bot
+                played after every round for the learning curve. Defaults
+                to 0.
+
+        Returns:
+            list: The history entries of the rounds played
+        """
+        start = len(self.__history__)
+        target = self.__progress__["games"] + games
+        executor = None
+        if self.__workers__ > 1:
+            executor = ProcessPoolExecutor(self.__workers__)
+        try:
+            while self.__progress__["games"] < target:
+                count = min(self.GAMES_PER_ROUND, target - self.__progress__["games"])
+                began = time.perf_counter()
+                errors = [
+                    td_update(
+                        self.__evaluator__,
+                        game,
+                        self.__learning_rate__,
+                        self.__trace_decay__,
+                    )
+                    for game in self._play_round(executor, count)
+                    if game is not None
+                ]
+                self._record_round(count, time.perf_counter() - began, errors)
+                if benchmark_games:
+                    self.__history__[-1]["benchmark"] = benchmark(
+                        self.__evaluator__, games=benchmark_games
+                    )
+                self._log_round(self.__history__[-1])
+                if checkpoint is not None:
+                    self.save_checkpoint(checkpoint)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+        return self.__history__[start:]
+
+    def _play_round(self, executor, count):
+        """Play the games of a round with the current weights.
+
+        Args:
+            executor (ProcessPoolExecutor): Worker pool, or None to play in
+                this process
+            count (int): Games to play
+
+        Returns:
+            list: play_training_game results, in game order
+        """
+        first = self.__progress__["games"]
+        seeds = [(self.__seed__ << 32) | game for game in range(first, first + count)]
+        if executor is None:
+            return [play_training_game(self.__evaluator__, seed) for seed in seeds]
+        weights = self.__evaluator__.get_weights()
+        chunk = -(-count // self.__workers__)
+        futures = [
+            executor.submit(_play_games, weights, seeds[index : index + chunk])
+            for index in range(0, count, chunk)
+        ]
+        return [game for future in futures for game in future.result()]
+
+    def _record_round(self, count, seconds, errors):
+        """Add a round to the progress and the history.
+
+        Args:
+            count (int): Games played in the round
+            seconds (float): Time the round took
+            errors (list): Mean absolute TD error of each finished game
+
+        Returns:
+            None
+        """
+        self.__progress__["games"] += count
+        self.__progress__["elapsed"] += seconds
+        self.__history__.append(
+            {
+                "games": self.__progress__["games"],
+                "elapsed": self.__progress__["elapsed"],
+                "games_per_hour": count * 3600 / seconds if seconds else 0.0,
+                "td_error": float(np.mean(errors)) if errors else float("nan"),
+                "benchmark": float("nan"),
+            }
+        )
+
+    @staticmethod
+    def _log_round(entry):
+        """Log the learning curve entry of a round.
+
+        Args:
+            entry (dict): History entry
+
+        Returns:
+            None
+        """
+        LOGGER.info(
+            "%d games, %.0f games/hour, TD error %.4f, benchmark %+.3f points/game",
+            entry["games"],
+            entry["games_per_hour"],
+            entry["td_error"],
+            entry["benchmark"],
+        )
+
+
+def main():
+    """Train from the command line, resuming from the checkpoint if present.
+
+    Returns:
+        None
+    """
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    path = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_CHECKPOINT
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    if os.path.exists(path):
+        trainer = TDTrainer.resume(path, workers)
+        LOGGER.info("Resuming from %s after %d games", path, trainer.get_games())
+    else:
+        trainer = TDTrainer(workers=workers)
+    trainer.train(games, path, benchmark_games=TDTrainer.GAMES_PER_ROUND)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Transposition table module for the Backgammon game.
+
+This module contains the TranspositionTable class, a fixed-size store of
+search results keyed by the 64-bit Zobrist position hash. Entries live in
+flat typed arrays sized from a memory cap, two per bucket: a depth-preferred
+slot that only a search at least as deep may replace, and an always-replace
+slot for everything else.
+"""
+
+from array import array
+
+# Bound types of a stored equity
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+# Bytes per entry: key (8), equity (8), depth, side to move and bound (1 each)
+ENTRY_BYTES = 19
+SLOTS_PER_BUCKET = 2
+EMPTY_DEPTH = -1
+
+
+class TranspositionTable:
+    """Two-slot bucket table of (equity, depth, bound) search results.
+
+    Depths are the plies searched below the stored position; the side to
+    move is stored with each entry and must match on lookup, so positions
+    met with either player on roll never share an entry.
+    """
+
+    DEFAULT_SIZE_MB = 16
+    MAX_DEPTH = 127
+
+    def __init__(self, size_mb=DEFAULT_SIZE_MB):
+        """Allocate an empty table.
+
+        Args:
+            size_mb (float, optional): Memory cap in megabytes. Defaults to
+                DEFAULT_SIZE_MB.
+
+        Raises:
+            ValueError: If size_mb leaves room for less than one bucket
+        """
+        buckets = int(size_mb * 1024 * 1024) // (ENTRY_BYTES * SLOTS_PER_BUCKET)
+        if buckets < 1:
+            raise ValueError("Transposition table size is too small")
+        slots = buckets * SLOTS_PER_BUCKET
+        self.__buckets__ = buckets
+        self.__keys__ = array("Q", bytes(8 * slots))
+        self.__equities__ = array("d", bytes(8 * slots))
+        self.__depths__ = array("b", [EMPTY_DEPTH]) * slots
+        self.__sides__ = array("b", bytes(slots))
+        self.__bounds__ = array("b", bytes(slots))
+        self.__stats__ = dict.fromkeys(("hits", "misses", "stores", "overwrites"), 0)
+
+    def _find(self, key, side_to_move):
+        """Get the slot holding a position.
+
+        Args:
+            key (int): 64-bit position hash
+            side_to_move (int): Player number (1 or 2) on roll
+
+        Returns:
+            int: Slot index, or -1 if the position is not stored
+        """
+        slot = (key % self.__buckets__) * SLOTS_PER_BUCKET
+        keys, sides, depths = self.__keys__, self.__sides__, self.__depths__
+        for index in (slot, slot + 1):
+            if (
+                keys[index] == key
+                and sides[index] == side_to_move
+                and depths[index] != EMPTY_DEPTH
+            ):
+                return index
+        return -1
+
+    def lookup(self, key, side_to_move):
+        """Get the stored result for a position.
+
+        Args:
+            key (int): 64-bit position hash
+            side_to_move (int): Player number (1 or 2) on roll
+
+        Returns:
+            tuple: (equity, depth, bound), or None if the position is not
+                stored
+        """
+        index = self._find(key, side_to_move)
+        if index < 0:
+            self.__stats__["misses"] += 1
+            return None
+        self.__stats__["hits"] += 1
+        return self.__equities__[index], self.__depths__[index], self.__bounds__[index]
+
+    def store(self, key, side_to_move, depth, equity, bound=EXACT):
+        """Store a search result.
+
+        A position already stored is updated in place unless the stored
+        search was deeper, or as deep with an exact result and the new one
+        only a bound. Otherwise the result takes the depth-preferred slot
+        of its bucket if it is at least as deep as the entry there, and the
+        always-replace slot if not.
+
+        Args:
+            key (int): 64-bit position hash
+            side_to_move (int): Player number (1 or 2) on roll
+            depth (int): Plies searched below the position, 0 to MAX_DEPTH
+            equity (float): Searched equity
+            bound (int, optional): EXACT, LOWER_BOUND or UPPER_BOUND.
+                Defaults to EXACT.
+
+        Returns:
+            None
+        """
+        depths = self.__depths__
+        index = self._find(key, side_to_move)
+        if index >= 0:
+            if depth < depths[index]:
+                return
+            if (
+                depth == depths[index]
+                and bound != EXACT
+                and self.__bounds__[index] == EXACT
+            ):
+                return
+        else:
+            index = (key % self.__buckets__) * SLOTS_PER_BUCKET
+            if depth < depths[index]:
+                index += 1
+            if depths[index] != EMPTY_DEPTH:
+                self.__stats__["overwrites"] += 1
+        self.__stats__["stores"] += 1
+        self.__keys__[index] = key
+        self.__sides__[index] = side_to_move
+        depths[index] = depth
+        self.__equities__[index] = equity
+        self.__bounds__[index] = bound
+
+    def clear(self):
+        """Remove every entry and reset the counters.
+
+        Returns:
+            None
+        """
+        self.__depths__ = array("b", [EMPTY_DEPTH]) * len(self.__depths__)
+        self.__stats__ = dict.fromkeys(self.__stats__, 0)
+
+    def get_stats(self):
+        """Get the table counters.
+
+        Returns:
+            dict: hits, misses, stores, overwrites (entries of other positions
+                replaced), entries, capacity, size_mb and hit_rate
+        """
+        stats = dict(self.__stats__)
+        lookups = stats["hits"] + stats["misses"]
+        capacity = len(self.__depths__)
+        stats["entries"] = len(self)
+        stats["capacity"] = capacity
+        stats["size_mb"] = capacity * ENTRY_BYTES / (1024 * 1024)
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def __len__(self):
+        """Return the number of stored entries.
+
+        Returns:
+            int: Number of occupied slots
+        """
+        return len(self.__depths__) - self.__depths__.count(EMPTY_DEPTH)
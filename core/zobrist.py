@@ -0,0 +1,110 @@
+"""Zobrist hashing module for the Backgammon game.
+
+This module contains the random key tables and helpers used to compute a
+64-bit position hash. Boards keep the hash up to date incrementally by
+XOR-ing the keys of the (location, owner, count) entries that change.
+"""
+
+import random
+
+ZOBRIST_SEED = 0x5EED_BAC6
+MAX_COUNT = 15
+
+_rng = random.Random(ZOBRIST_SEED)
+
+
+def _key_row():
+    """Build the keys for counts 0..MAX_COUNT of one location and owner.
+
+    Returns:
+        tuple: 64-bit keys, with count 0 mapped to 0 so empty cells hash to 0
+    """
+    return (0,) + tuple(_rng.getrandbits(64) for _ in range(MAX_COUNT))
+
+
+# POINT_KEYS[point][player - 1][count]
+POINT_KEYS = tuple(tuple(_key_row() for _ in range(2)) for _ in range(24))
+# BAR_KEYS[player - 1][count] and OFF_KEYS[player - 1][count]
+BAR_KEYS = tuple(_key_row() for _ in range(2))
+OFF_KEYS = tuple(_key_row() for _ in range(2))
+# XOR-ed in when player 2 is the side to move
+SIDE_TO_MOVE_KEY = _rng.getrandbits(64)
+
+
+def point_delta(point, player, old_count, new_count):
+    """Return the XOR delta for a point count change.
+
+    Args:
+        point (int): Point index (0-23)
+        player (int): Player number (1 or 2)
+        old_count (int): Player's checker count before the change
+        new_count (int): Player's checker count after the change
+
+    Returns:
+        int: Value to XOR into the position hash
+    """
+    row = POINT_KEYS[point][player - 1]
+    return row[old_count] ^ row[new_count]
+
+
+def bar_delta(player, old_count, new_count):
+    """Return the XOR delta for a bar count change.
+
+    Args:
+        player (int): Player number (1 or 2)
+        old_count (int): Checkers on the bar before the change
+        new_count (int): Checkers on the bar after the change
+
+    Returns:
+        int: Value to XOR into the position hash
+    """
+    row = BAR_KEYS[player - 1]
+    return row[old_count] ^ row[new_count]
+
+
+def off_delta(player, old_count, new_count):
+    """Return the XOR delta for an off-tray count change.
+
+    Args:
+        player (int): Player number (1 or 2)
+        old_count (int): Checkers borne off before the change
+        new_count (int): Checkers borne off after the change
+
+    Returns:
+        int: Value to XOR into the position hash
+    """
+    row = OFF_KEYS[player - 1]
+    return row[old_count] ^ row[new_count]
+
+
+def side_key(player_to_move):
+    """Return the side-to-move component of a position key.
+
+    Args:
+        player_to_move (int): Player number (1 or 2), or None to ignore
+
+    Returns:
+        int: SIDE_TO_MOVE_KEY for player 2, otherwise 0
+    """
+    return SIDE_TO_MOVE_KEY if player_to_move == 2 else 0
+
+
+def hash_board_state(state):
+    """Compute the hash of a board state in Board's list format from scratch.
+
+    Args:
+        state (dict): Dictionary with "points", "bar" and "off_board" lists
+
+    Returns:
+        int: 64-bit position hash without the side-to-move component
+    """
+    value = 0
+    for point, pieces in enumerate(state["points"]):
+        for player in (1, 2):
+            value ^= POINT_KEYS[point][player - 1][pieces.count(player)]
+    for player in (1, 2):
+        on_bar = sum(checker_bar.count(player) for checker_bar in state["bar"])
+        borne_off = sum(off.count(player) for off in state["off_board"])
+        value ^= BAR_KEYS[player - 1][on_bar]
+        value ^= OFF_KEYS[player - 1][borne_off]
+    return value
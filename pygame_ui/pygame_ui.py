@@ -7,12 +7,16 @@ It coordinates the game loop and event handling.
 
 import pygame  # pylint: disable=import-error
 from core.backgammon import BackgammonGame
+from core.bearoff import default_databases
+from core.bot import GreedyBot
+from core.evaluator import HeuristicEvaluator
+from core.opening_book import default_books
 from core.game_persistence import RedisGamePersistence, GamePersistenceService
 from core.file_persistence import FileGamePersistence
 from pygame_ui.backgammon_board import BackgammonBoard
 
 
-def _handle_event(event, game, board, persistence_service) -> bool:
+def _handle_event(event, game, board, persistence_service, bot) -> bool:
     """
     Handle a pygame event.
 
@@ -21,6 +25,7 @@ def _handle_event(event, game, board, persistence_service) -> bool:
         game: BackgammonGame instance
         board: BackgammonBoard instance
         persistence_service: GamePersistenceService instance
+        bot: GreedyBot playing the B key turns
 
     Returns:
         True to continue running, False to quit
@@ -37,7 +42,7 @@ def _handle_event(event, game, board, persistence_service) -> bool:
         return True
 
     if event.type == pygame.KEYDOWN:  # pylint: disable=no-member
-        return _handle_keydown(event, game, board)
+        return _handle_keydown(event, game, board, bot)
     if event.type == pygame.MOUSEBUTTONDOWN:  # pylint: disable=no-member
         _handle_mouse_click(event, board)
     if board.__roll_button__.handle_event(event):
@@ -49,13 +54,14 @@ def _handle_event(event, game, board, persistence_service) -> bool:
     return True
 
 
-def _handle_keydown(event, game, board) -> bool:
+def _handle_keydown(event, game, board, bot) -> bool:
     """Handle keydown events.
 
     Args:
         event: Pygame event
         game: BackgammonGame instance
         board: BackgammonBoard instance
+        bot: GreedyBot playing the B key turns
 
     Returns:
         True to continue running, False to quit
@@ -66,9 +72,26 @@ def _handle_keydown(event, game, board) -> bool:
         _handle_roll_dice(game, board)
     if event.key == pygame.K_r:  # pylint: disable=no-member
         _handle_reset_game(game, board)
+    if event.key == pygame.K_b:  # pylint: disable=no-member
+        _handle_bot_turn(game, board, bot)
     return True
 
 
+def _handle_bot_turn(game, board, bot) -> None:
+    """Let the computer play the current player's turn.
+
+    Args:
+        game: BackgammonGame instance
+        board: BackgammonBoard instance
+        bot: GreedyBot choosing the play
+
+    Returns:
+        None
+    """
+    if bot.play_turn(game) is not None:
+        board.update_from_game()
+
+
 def _handle_roll_dice(game, board) -> None:
     """Handle rolling dice.
 
@@ -248,6 +271,10 @@ def main() -> None:
     # Create game instance
     game = BackgammonGame()
     game.setup_initial_position()
+    # Built once and reused by every B key press
+    bot = GreedyBot(
+        HeuristicEvaluator(bearoff=default_databases()), book=default_books()
+    )
 
     # Initialize persistence service
     try:
@@ -273,7 +300,7 @@ def main() -> None:
 
     while running:
         for event in pygame.event.get():
-            if not _handle_event(event, game, board, persistence_service):
+            if not _handle_event(event, game, board, persistence_service, bot):
                 running = False
 
         # Update save message timer
@@ -2,4 +2,15 @@
 
 This package contains comprehensive test suites for all core modules
 of the Backgammon game implementation.
+
+Boards built by editing their point lists must refresh their incremental
+state before use, and games whose Checker objects were moved directly must
+refresh their checker index; the self-checks make a forgotten refresh fail
+the test.
 """
+
+from core.board import Board
+from core.checker_registry import CheckerRegistry
+
+Board.DEBUG_SELF_CHECK = True
+CheckerRegistry.DEBUG_SELF_CHECK = True
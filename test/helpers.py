@@ -0,0 +1,50 @@
+"""Shared helpers for the unit tests.
+
+This module builds and reads the positions used by several test modules.
+"""
+
+import numpy as np
+from core.compact_board import CompactBoard
+
+
+def make_board(cells):
+    """Build a CompactBoard from a {cell: count} mapping.
+
+    Args:
+        cells (dict): Cell index to signed count
+
+    Returns:
+        CompactBoard: Board with the given cells
+    """
+    board = CompactBoard()
+    for cell, count in cells.items():
+        board.__cells__[cell] = count
+    board.refresh_incremental_state()
+    return board
+
+
+def mirror(board):
+    """Swap the players of a position.
+
+    Args:
+        board (CompactBoard): Position to mirror
+
+    Returns:
+        CompactBoard: The position with player 1 and player 2 exchanged
+    """
+    cells = board.__cells__.tolist()
+    mirrored = {23 - point: -cells[point] for point in range(24) if cells[point]}
+    mirrored.update({24: cells[25], 25: cells[24], 26: cells[27], 27: cells[26]})
+    return make_board(mirrored)
+
+
+def cells_of(board):
+    """Get the cell array of a board as NumPy int8 values.
+
+    Args:
+        board (CompactBoard): Position to read
+
+    Returns:
+        numpy.ndarray: The CELL_COUNT cells
+    """
+    return np.array(board.__cells__.tolist(), dtype=np.int8)
@@ -318,6 +318,7 @@ class TestBackgammonAdvanced(unittest.TestCase):
         """
         for i in range(18, 24):
             self.__game__.__board__.__points__[i] = [1] if i == 23 else []
+        self.__game__.__board__.refresh_incremental_state()
         can_bear_off = self.__game__.can_bear_off(1)
         self.assertTrue(can_bear_off)
 
@@ -339,6 +340,7 @@ class TestBackgammonAdvanced(unittest.TestCase):
         """
         for i in range(18, 24):
             self.__game__.__board__.__points__[i] = [1] if i == 23 else []
+        self.__game__.__board__.refresh_incremental_state()
         self.__game__.__last_roll__ = (1, 2)
         result = self.__game__.bear_off_checker(23)
         self.assertTrue(result)
@@ -362,6 +364,7 @@ class TestBackgammonAdvanced(unittest.TestCase):
         """
         for i in range(18, 24):
             self.__game__.__board__.__points__[i] = [1] if i == 23 else []
+        self.__game__.__board__.refresh_incremental_state()
         self.__game__.__last_roll__ = (1, 2)
         initial_off_count = len(self.__game__.__board__.__off_board__[0])
         self.__game__.bear_off_checker(23)
@@ -396,6 +399,7 @@ class TestBackgammonAdvanced(unittest.TestCase):
         # Move all pieces to home board first
         for i in range(18, 24):
             self.__game__.__board__.__points__[i] = [1] if i == 23 else []
+        self.__game__.__board__.refresh_incremental_state()
         result = self.__game__.bear_off_checker(23)
         self.assertFalse(result)
 
@@ -409,6 +413,7 @@ class TestBackgammonAdvanced(unittest.TestCase):
         for i in range(24):
             self.__game__.__board__.__points__[i] = []
         self.__game__.__board__.__points__[23] = [1]  # One piece at point 24
+        self.__game__.__board__.refresh_incremental_state()
         self.__game__.__current_player__ = self.__game__.__player1__
         self.__game__.__available_moves__ = [6]
         self.__game__.__last_roll__ = (6, 6)
@@ -425,6 +430,7 @@ class TestBackgammonAdvanced(unittest.TestCase):
         for i in range(24):
             self.__game__.__board__.__points__[i] = []
         self.__game__.__board__.__points__[23] = [1]
+        self.__game__.__board__.refresh_incremental_state()
         self.__game__.__current_player__ = self.__game__.__player1__
         self.__game__.__last_roll__ = (2, 1)
         self.__game__.__available_moves__ = [2, 1]
@@ -442,6 +448,7 @@ class TestBackgammonAdvanced(unittest.TestCase):
         for i in range(24):
             self.__game__.__board__.__points__[i] = []
         self.__game__.__board__.__points__[23] = [1]  # One piece at point 24
+        self.__game__.__board__.refresh_incremental_state()
         self.__game__.__current_player__ = self.__game__.__player1__
         self.__game__.__available_moves__ = []  # Empty
         self.__game__.__last_roll__ = (6, 6)  # But last_roll exists
@@ -458,6 +465,7 @@ class TestBackgammonAdvanced(unittest.TestCase):
         for i in range(24):
             self.__game__.__board__.__points__[i] = []
         self.__game__.__board__.__points__[23] = [1]  # One piece at point 24
+        self.__game__.__board__.refresh_incremental_state()
         self.__game__.__current_player__ = self.__game__.__player1__
         self.__game__.__available_moves__ = [6, 5]  # Multiple dice values
         self.__game__.__last_roll__ = (6, 5)
@@ -544,6 +552,7 @@ class TestBackgammonAdvanced(unittest.TestCase):
         checker = self.__game__.__player1_checkers__[0]
         checker.place_on_point(1)
         checker.send_to_bar()
+        self.__game__.refresh_checker_index()
         checkers = self.__game__.get_checkers_on_bar(1)
         self.assertEqual(len(checkers), 1)
         self.assertTrue(checkers[0].__is_on_bar__)
@@ -571,6 +580,7 @@ class TestBackgammonAdvanced(unittest.TestCase):
         checker = self.__game__.__player1_checkers__[0]
         checker.place_on_point(24)
         checker.bear_off()
+        self.__game__.refresh_checker_index()
         checkers = self.__game__.get_borne_off_checkers(1)
         self.assertEqual(len(checkers), 1)
         self.assertTrue(checkers[0].__is_borne_off__)
@@ -601,6 +611,7 @@ class TestBackgammonAdvanced(unittest.TestCase):
         self.__game__.setup_initial_position()
         # Place a single opponent checker at destination
         self.__game__.__player2_checkers__[0].place_on_point(2)
+        self.__game__.refresh_checker_index()
         # Move player 1 checker to capture
         result = self.__game__.move_checker_object(
             0, 1, 1
@@ -634,6 +645,7 @@ class TestBackgammonAdvanced(unittest.TestCase):
         # Put a checker on the bar
         checker = self.__game__.__player1_checkers__[0]
         checker.send_to_bar()
+        self.__game__.refresh_checker_index()
         # Move from bar to point 2 (0-indexed as 1)
         result = self.__game__.move_checker_from_bar_object(1, 1)
         self.assertTrue(result)
@@ -662,6 +674,7 @@ class TestBackgammonAdvanced(unittest.TestCase):
         # Place a checker at point 24 (0-indexed as 23)
         checker = self.__game__.__player1_checkers__[0]
         checker.place_on_point(24)
+        self.__game__.refresh_checker_index()
         # Bear off the checker
         result = self.__game__.bear_off_checker_object(23, 1)
         self.assertTrue(result)
@@ -748,6 +761,20 @@ class TestBackgammonAdvanced(unittest.TestCase):
         self.assertIsInstance(pip_count, int)
         self.assertGreater(pip_count, 0)
 
+    def test_get_pip_count_tracks_moves(self):
+        """Test pip counts follow moves without rescanning the board.
+
+        Returns:
+            None
+        """
+        self.__game__.setup_initial_position()
+        self.__game__.__current_player__ = self.__game__.__player1__
+        self.__game__.__last_roll__ = (6, 5)
+        self.__game__.__available_moves__ = [6, 5]
+        self.assertTrue(self.__game__.make_move(0, 6))
+        self.assertEqual(self.__game__.get_pip_count(self.__game__.__player1__), 161)
+        self.assertEqual(self.__game__.get_pip_count(self.__game__.__player2__), 167)
+
     def test_is_blocked_position_true(self):
         """Test is_blocked_position when position is blocked.
 
@@ -292,8 +292,9 @@ class TestBackgammonCore(unittest.TestCase):
         self.__game__.__last_roll__ = (1, 2)
         self.__game__.__available_moves__ = [1, 2]
 
-        # Mock board to have blocked destination (2+ opponent pieces)
-        with patch.object(self.__game__.__board__, "can_move", return_value=False):
+        # Mock board to have blocked destination (2+ opponent pieces); Board
+        # uses __slots__, so the method is patched on the class
+        with patch.object(Board, "can_move", return_value=False):
             result = self.__game__.validate_move(0, 1)
             self.assertFalse(result)
 
@@ -86,6 +86,23 @@ class TestBackgammonIntegration(unittest.TestCase):
         result = self.__game__.validate_complete_turn(moves)
         self.assertTrue(result)
 
+    def test_validate_complete_turn_leaves_board_unchanged(self):
+        """Test validate_complete_turn reverts its trial moves.
+
+        Returns:
+            None
+        """
+        self.__game__.setup_initial_position()
+        self.__game__.__last_roll__ = (3, 5)
+        self.__game__.__available_moves__ = [3, 5]
+        before = self.__game__.__board__.get_board_state()
+        before_key = self.__game__.get_position_key()
+
+        self.assertTrue(self.__game__.validate_complete_turn([(16, 19), (16, 21)]))
+        self.assertFalse(self.__game__.validate_complete_turn([(0, 3), (0, 5)]))
+        self.assertEqual(self.__game__.__board__.get_board_state(), before)
+        self.assertEqual(self.__game__.get_position_key(), before_key)
+
     def test_validate_complete_turn_invalid_moves(self):
         """Test validate_complete_turn with invalid moves.
 
@@ -128,6 +145,81 @@ class TestBackgammonIntegration(unittest.TestCase):
         result = self.__game__.execute_turn(moves)
         self.assertFalse(result)
 
+    def test_execute_turn_rolls_back_atomically(self):
+        """Test a failing move leaves board, dice and history untouched.
+
+        Returns:
+            None
+        """
+        self.__game__.setup_initial_position()
+        self.__game__.__last_roll__ = (3, 5)
+        self.__game__.__available_moves__ = [3, 5]
+        before = self.__game__.__board__.get_board_state()
+        before_key = self.__game__.get_position_key()
+
+        self.assertFalse(self.__game__.execute_turn([(16, 19), (0, 5)]))
+        self.assertEqual(self.__game__.__board__.get_board_state(), before)
+        self.assertEqual(self.__game__.get_position_key(), before_key)
+        self.assertEqual(self.__game__.__available_moves__, [3, 5])
+        self.assertEqual(self.__game__.__move_history__, [])
+
+    def test_execute_turn_plays_legal_plays(self):
+        """Test every generated legal play can be executed and undone.
+
+        Returns:
+            None
+        """
+        self.__game__.setup_initial_position()
+        self.__game__.__board__.__points__[0] = [1]
+        self.__game__.__board__.__checker_bar__[1] = [1]
+        self.__game__.__board__.refresh_incremental_state()
+        self.__game__.__last_roll__ = (6, 1)
+        self.__game__.__available_moves__ = [6, 1]
+        before = self.__game__.__board__.get_board_state()
+
+        plays = self.__game__.get_legal_plays()
+        self.assertTrue(plays)
+        for play in plays:
+            self.assertTrue(self.__game__.execute_turn(list(play)))
+            self.assertEqual(self.__game__.__available_moves__, [])
+            self.assertEqual(self.__game__.__move_history__[0]["from"], "bar")
+            while self.__game__.undo_last_move():
+                pass
+            self.__game__.__available_moves__ = [6, 1]
+            self.assertEqual(self.__game__.__board__.get_board_state(), before)
+
+    def test_execute_turn_requires_bar_entry_first(self):
+        """Test checkers on the bar must enter before other moves.
+
+        Returns:
+            None
+        """
+        self.__game__.setup_initial_position()
+        self.__game__.__board__.__points__[0] = [1]
+        self.__game__.__board__.__checker_bar__[1] = [1]
+        self.__game__.__board__.refresh_incremental_state()
+        self.__game__.__last_roll__ = (1, 2)
+        self.__game__.__available_moves__ = [1, 2]
+        self.assertFalse(self.__game__.execute_turn([(0, 1), ("bar", 1)]))
+        self.assertTrue(self.__game__.execute_turn([("bar", 1), (0, 1)]))
+        self.assertFalse(self.__game__.__board__.has_pieces_on_bar(1))
+
+    def test_execute_turn_bears_off_with_larger_die(self):
+        """Test a bear-off move picks the die it needs.
+
+        Returns:
+            None
+        """
+        board = self.__game__.__board__
+        board.__points__[20] = [1]
+        board.__points__[22] = [1]
+        board.refresh_incremental_state()
+        self.__game__.__last_roll__ = (6, 2)
+        self.__game__.__available_moves__ = [6, 2]
+        self.assertTrue(self.__game__.execute_turn([(22, "off"), (20, "off")]))
+        self.assertEqual(board.get_board_state()["off_board"], [[1, 1], []])
+        self.assertEqual(self.__game__.__available_moves__, [])
+
     # ==================== MOVE SEQUENCE TESTS ====================
 
     def test_undo_last_move(self):
@@ -193,6 +285,20 @@ class TestBackgammonIntegration(unittest.TestCase):
         has_moves = self.__game__.has_valid_moves()
         self.assertFalse(has_moves)
 
+    def test_has_valid_moves_does_not_modify_game(self):
+        """Test has_valid_moves probes the last roll without storing moves.
+
+        Returns:
+            None
+        """
+        self.__game__.setup_initial_position()
+        self.__game__.__last_roll__ = (3, 1)
+        self.__game__.__available_moves__ = []
+        board_state = self.__game__.__board__.get_board_state()
+        self.assertTrue(self.__game__.has_valid_moves())
+        self.assertEqual(self.__game__.__available_moves__, [])
+        self.assertEqual(self.__game__.__board__.get_board_state(), board_state)
+
     # ==================== COMPLEX SCENARIO TESTS ====================
 
     def test_make_move_with_capture(self):
@@ -0,0 +1,301 @@
+"""Unit tests for the one-sided and two-sided bear-off databases.
+
+This module validates the perfect-hash index, the generated distributions
+and winning chances against exhaustive searches over generate_plays, the
+memory-mapped files and their use by the evaluator.
+"""
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from test.helpers import make_board
+from unittest.mock import patch
+from core.bearoff import (
+    MAX_ROLLS,
+    BearoffDatabase,
+    TwoSidedBearoffDatabase,
+    board_counts,
+    default_databases,
+    generate,
+    index_position,
+    position_count,
+    position_index,
+    solve_two_sided,
+    write_database,
+    write_two_sided_database,
+)
+from core.evaluator import HeuristicEvaluator
+from core.move_generator import generate_plays
+from core.search import ROLLS
+
+SMALL = 4
+TWO_SIDED = 3
+
+
+def bearoff_board(counts, off=None, other=None):
+    """Build a board where player 1 bears off against player 2.
+
+    Args:
+        counts (tuple): Player 1 checkers 1 to 6 pips away from bearing off
+        off (int, optional): Player 2 checkers borne off. Defaults to none.
+        other (tuple, optional): Player 2 bear-off position. Defaults to all
+            remaining player 2 checkers on its 6 point.
+
+    Returns:
+        CompactBoard: The position
+    """
+    cells = {23 - point: count for point, count in enumerate(counts) if count}
+    cells[26] = 15 - sum(counts)
+    cells[27] = off or 0
+    if other is None:
+        cells[5] = -(15 - cells[27])
+    else:
+        cells.update({point: -count for point, count in enumerate(other) if count})
+    return make_board(cells)
+
+
+def expected_rolls(counts, memo):
+    """Solve a one-sided bear-off by trying every play of every roll.
+
+    Args:
+        counts (tuple): Player 1 checkers 1 to 6 pips away from bearing off
+        memo (dict): Results of the positions solved so far
+
+    Returns:
+        float: Expected rolls to bear off with the best play
+    """
+    if not any(counts):
+        return 0.0
+    if counts not in memo:
+        board = bearoff_board(counts)
+        total = 1.0
+        for roll, probability in ROLLS:
+            results = []
+            for play in generate_plays(board, 1, roll):
+                tokens = [board.apply(move, 1) for move in play]
+                results.append(expected_rolls(board_counts(board, 1), memo))
+                for token in reversed(tokens):
+                    board.revert(token)
+            total += probability * min(results)
+        memo[counts] = total
+    return memo[counts]
+
+
+def winning_chance(on_roll, other, memo):
+    """Solve a two-sided bear-off by trying every play of every roll.
+
+    Args:
+        on_roll (tuple): Position of the side about to roll, as player 1
+        other (tuple): Position of the other side, as player 2
+        memo (dict): Results of the pairs solved so far
+
+    Returns:
+        float: Probability that the side on roll bears off first
+    """
+    if not any(other):
+        return 0.0
+    if (on_roll, other) not in memo:
+        board = bearoff_board(on_roll, 15 - sum(other), other)
+        total = 0.0
+        for roll, probability in ROLLS:
+            results = []
+            for play in generate_plays(board, 1, roll):
+                tokens = [board.apply(move, 1) for move in play]
+                after = board_counts(board, 1)
+                results.append(1.0 - winning_chance(other, after, memo))
+                for token in reversed(tokens):
+                    board.revert(token)
+            total += probability * max(results)
+        memo[on_roll, other] = total
+    return memo[on_roll, other]
+
+
+class TestBearoff(unittest.TestCase):
+    """Test suite covering the bear-off database."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Write a small database shared by the tests.
+
+        Returns:
+            None
+        """
+        cls.directory = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.directory, "bearoff.db")
+        write_database(cls.path, SMALL)
+        cls.database = BearoffDatabase(cls.path)
+        cls.two_sided_path = os.path.join(cls.directory, "two_sided.db")
+        write_two_sided_database(cls.two_sided_path, TWO_SIDED)
+        cls.two_sided = TwoSidedBearoffDatabase(cls.two_sided_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Unmap and remove the database.
+
+        Returns:
+            None
+        """
+        cls.database.close()
+        cls.two_sided.close()
+        shutil.rmtree(cls.directory)
+
+    def test_perfect_hash(self):
+        count = position_count(SMALL)
+        positions = [index_position(index) for index in range(count)]
+        self.assertEqual(len(set(positions)), count)
+        self.assertTrue(all(sum(position) <= SMALL for position in positions))
+        self.assertEqual([position_index(p) for p in positions], list(range(count)))
+        self.assertEqual(position_count(), 54264)
+        self.assertEqual(position_index((15, 0, 0, 0, 0, 0)), position_count(15) - 1)
+
+    def test_matches_exhaustive_search(self):
+        memo = {}
+        for index, (mean, distribution) in enumerate(generate(3)):
+            counts = index_position(index)
+            self.assertAlmostEqual(mean, expected_rolls(counts, memo), 9)
+            self.assertAlmostEqual(sum(distribution), 1.0)
+
+    def test_single_checker(self):
+        self.assertEqual(self.database.expected_rolls((1, 0, 0, 0, 0, 0)), 1.0)
+        # 1-1, 2-1, 3-1, 4-1 and 3-2 leave a checker on the 6 point behind
+        distribution = self.database.roll_distribution((0, 0, 0, 0, 0, 1))
+        self.assertEqual(len(distribution), MAX_ROLLS)
+        self.assertAlmostEqual(distribution[1], 27 / 36, 4)
+        self.assertAlmostEqual(distribution[2], 9 / 36, 4)
+
+    def test_file_lookups(self):
+        records = generate(SMALL)
+        for index in (1, 57, len(records) - 1):
+            counts = index_position(index)
+            self.assertAlmostEqual(
+                self.database.expected_rolls(counts), records[index][0], 5
+            )
+            self.assertAlmostEqual(sum(self.database.roll_distribution(counts)), 1, 3)
+        self.assertEqual(len(self.database), position_count(SMALL))
+        self.assertEqual(self.database.get_max_checkers(), SMALL)
+        self.assertTrue(self.database.covers((0, 0, 0, 0, 0, SMALL)))
+        self.assertFalse(self.database.covers((1, 0, 0, 0, 0, SMALL)))
+
+    def test_win_probability(self):
+        ace = (1, 0, 0, 0, 0, 0)
+        self.assertEqual(self.database.win_probability(ace, ace), 1.0)
+        # Only doubles from 3-3 up bear off two checkers from the 6 point
+        two = self.database.win_probability((0, 0, 0, 0, 0, 2), ace)
+        self.assertAlmostEqual(two, 4 / 36, 4)
+        chance = self.database.win_probability((0, 0, 0, 0, 0, 1), ace)
+        self.assertAlmostEqual(chance, 27 / 36, 4)
+
+    def test_race_equity(self):
+        board = bearoff_board((0, 0, 0, 0, 0, 1), off=14, other=(1, 0, 0, 0, 0, 0))
+        # Player 2 on roll bears off its last checker; player 1 on roll
+        # finishes first with 27 rolls out of 36
+        self.assertAlmostEqual(self.database.race_equity(board, 1), -1.0)
+        self.assertAlmostEqual(self.database.race_equity(board, 2), -0.5, 4)
+        no_gammon = bearoff_board((0, 0, 0, 0, 2, 0), off=13, other=(0, 0, 0, 0, 0, 2))
+        chance = self.database.win_probability((0, 0, 0, 0, 2, 0), (0, 0, 0, 0, 0, 2))
+        self.assertAlmostEqual(self.database.race_equity(no_gammon, 2), 1 - 2 * chance)
+
+    def test_race_equity_needs_a_covered_bearoff_without_gammons(self):
+        gammon_chances = bearoff_board((0, 0, 0, 0, 0, 1))
+        self.assertIsNone(self.database.race_equity(gammon_chances, 1))
+        too_many = bearoff_board((0, 0, 0, 0, 0, SMALL + 1), off=10)
+        self.assertIsNone(self.database.race_equity(too_many, 1))
+        contact = make_board({23: 1, 26: 14, 10: -1, 27: 14})
+        self.assertIsNone(self.database.race_equity(contact, 1))
+
+    def test_evaluator_looks_up_bearoffs(self):
+        board = bearoff_board((0, 0, 0, 0, 2, 0), off=13, other=(0, 0, 0, 0, 0, 2))
+        evaluator = HeuristicEvaluator(bearoff=self.database)
+        expected = self.database.race_equity(board, 1)
+        self.assertEqual(evaluator.evaluate(board, 1), expected)
+        heuristic = HeuristicEvaluator(bearoff=()).evaluate(board, 1)
+        self.assertNotEqual(heuristic, expected)
+        self.assertEqual(HeuristicEvaluator().evaluate(board, 1), heuristic)
+
+        # Databases are tried in order, and skipped when they miss
+        both = HeuristicEvaluator(bearoff=[self.two_sided, self.database])
+        self.assertEqual(both.evaluate(board, 1), self.two_sided.race_equity(board, 1))
+        larger = bearoff_board((0, 0, 0, 0, 0, SMALL), off=13, other=(1, 1, 0, 0, 0, 0))
+        self.assertIsNone(self.two_sided.race_equity(larger, 1))
+        self.assertEqual(both.evaluate(larger, 1), self.database.race_equity(larger, 1))
+
+    def test_default_databases(self):
+        with patch("core.bearoff.DEFAULT_PATH", self.path), patch(
+            "core.bearoff.DEFAULT_TWO_SIDED_PATH", self.two_sided_path
+        ):
+            default_databases.cache_clear()
+            try:
+                databases = default_databases()
+            finally:
+                default_databases.cache_clear()
+        self.assertEqual(
+            [type(database) for database in databases],
+            [TwoSidedBearoffDatabase, BearoffDatabase],
+        )
+        for database in databases:
+            database.close()
+
+    def test_two_sided_matches_exhaustive_search(self):
+        memo = {}
+        wins = solve_two_sided(2)
+        for first in range(1, position_count(2)):
+            for second in range(1, position_count(2)):
+                expected = winning_chance(
+                    index_position(first), index_position(second), memo
+                )
+                self.assertAlmostEqual(wins[first, second], expected, 9)
+
+    def test_two_sided_file(self):
+        wins = solve_two_sided(TWO_SIDED)
+        self.assertEqual(len(self.two_sided), position_count(TWO_SIDED))
+        self.assertEqual(self.two_sided.get_max_checkers(), TWO_SIDED)
+        for first, second in ((5, 9), (83, 1), (40, 40)):
+            chance = self.two_sided.win_probability(
+                index_position(first), index_position(second)
+            )
+            self.assertAlmostEqual(chance, wins[first, second], 4)
+        ace = (1, 0, 0, 0, 0, 0)
+        self.assertEqual(self.two_sided.win_probability(ace, ace), 1.0)
+        chance = self.two_sided.win_probability((0, 0, 0, 0, 0, 1), ace)
+        self.assertAlmostEqual(chance, 27 / 36, 4)
+
+    def test_two_sided_race_equity(self):
+        board = bearoff_board((0, 1, 0, 0, 0, 2), off=12, other=(1, 0, 2, 0, 0, 0))
+        for player in (1, 2):
+            exact = self.two_sided.race_equity(board, player)
+            # Independent one-sided play is a close approximation
+            self.assertAlmostEqual(exact, self.database.race_equity(board, player), 1)
+        chance = self.two_sided.win_probability((1, 0, 2, 0, 0, 0), (0, 1, 0, 0, 0, 2))
+        self.assertAlmostEqual(self.two_sided.race_equity(board, 1), 1 - 2 * chance)
+
+    def test_pickles_as_path(self):
+        copy = pickle.loads(pickle.dumps(self.database))
+        counts = (0, 1, 0, 2, 0, 1)
+        expected = self.database.expected_rolls(counts)
+        self.assertEqual(copy.expected_rolls(counts), expected)
+        copy.close()
+        copy = pickle.loads(pickle.dumps(self.two_sided))
+        pair = ((0, 0, 1, 0, 0, 1), (1, 1, 0, 0, 0, 0))
+        expected = self.two_sided.win_probability(*pair)
+        self.assertEqual(copy.win_probability(*pair), expected)
+        copy.close()
+
+    def test_invalid_files(self):
+        path = os.path.join(self.directory, "broken.db")
+        with open(path, "wb") as handle:
+            handle.write(b"not a database")
+        with self.assertRaises(ValueError):
+            BearoffDatabase(path)
+        with self.assertRaises(ValueError):
+            write_database(path, 0)
+        with self.assertRaises(ValueError):
+            TwoSidedBearoffDatabase(self.path)
+        with self.assertRaises(ValueError):
+            write_two_sided_database(path, 11)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,7 @@ bear-off conditions, determinism (no unintended randomness), and copy behavior.
 import unittest
 from unittest.mock import patch
 from core.board import Board
+from core.compact_board import CompactBoard
 
 
 class TestBoard(unittest.TestCase):
@@ -144,12 +145,14 @@ class TestBoard(unittest.TestCase):
 
         for i in range(18, 24):
             board.__points__[i] = [1]
+        board.refresh_incremental_state()
         self.assertTrue(board.can_bear_off(23, 1))
 
     def test_can_bear_off_pieces_outside_home(self):
         board = Board()
         board.__points__[23] = [1]
         board.__points__[10] = [1]
+        board.refresh_incremental_state()
 
         self.assertFalse(board.can_bear_off(23, 1))
 
@@ -158,6 +161,7 @@ class TestBoard(unittest.TestCase):
 
         for i in range(18, 24):
             board.__points__[i] = [1] if i == 20 else []
+        board.refresh_incremental_state()
 
         self.assertTrue(board.can_bear_off(20, 1, dice_value=4))
 
@@ -165,6 +169,7 @@ class TestBoard(unittest.TestCase):
         board = Board()
 
         board.__points__[18] = [1]
+        board.refresh_incremental_state()
 
         self.assertTrue(board.can_bear_off(18, 1, dice_value=6))
 
@@ -173,6 +178,7 @@ class TestBoard(unittest.TestCase):
 
         for i in range(18, 24):
             board.__points__[i] = [1] if i == 23 else []
+        board.refresh_incremental_state()
 
         result = board.bear_off_piece(23, 1)
         self.assertTrue(result)
@@ -182,6 +188,7 @@ class TestBoard(unittest.TestCase):
     def test_bear_off_piece_failure(self):
         board = Board()
         board.__points__[10] = [1]
+        board.refresh_incremental_state()
 
         result = board.bear_off_piece(23, 1)
         self.assertFalse(result)
@@ -191,6 +198,7 @@ class TestBoard(unittest.TestCase):
 
         board.__points__[18] = [1, 1]
         board.__points__[20] = [1]
+        board.refresh_incremental_state()
 
         self.assertTrue(board.is_all_pieces_in_home(1))
 
@@ -198,6 +206,7 @@ class TestBoard(unittest.TestCase):
         board = Board()
         board.__points__[18] = [1]
         board.__points__[10] = [1]
+        board.refresh_incremental_state()
 
         self.assertFalse(board.is_all_pieces_in_home(1))
 
@@ -206,6 +215,7 @@ class TestBoard(unittest.TestCase):
         board.__points__[18] = [1]
         # Ficha blanca (1) capturada está en el lado negro (index 1)
         board.__checker_bar__[1] = [1]
+        board.refresh_incremental_state()
 
         self.assertFalse(board.is_all_pieces_in_home(1))
 
@@ -247,6 +257,7 @@ class TestBoard(unittest.TestCase):
         board = Board()
         board.__points__[0] = [1]
         board.__points__[5] = [1]
+        board.refresh_incremental_state()
 
         moves = board.get_possible_moves(1, [1, 2])
         self.assertIsInstance(moves, list)
@@ -268,6 +279,7 @@ class TestBoard(unittest.TestCase):
 
         for i in range(18, 24):
             board.__points__[i] = [1] if i == 23 else []
+        board.refresh_incremental_state()
 
         moves = board.get_possible_moves(1, [1])
         bear_off_moves = [m for m in moves if m["to"] == "off"]
@@ -379,6 +391,7 @@ class TestBoard(unittest.TestCase):
         # Set up home position
         for i in range(18, 24):
             board.__points__[i] = [1] if i == 23 else []
+        board.refresh_incremental_state()
 
         # These should always return the same result
         result1 = board.can_bear_off(23, 1)
@@ -397,6 +410,7 @@ class TestBoard(unittest.TestCase):
 
         # Perform various board operations
         board.__points__[0] = [1]
+        board.refresh_incremental_state()
         board.move_piece(0, 5, 1)
         board.get_possible_moves(1, [1, 2])
 
@@ -429,6 +443,7 @@ class TestBoard(unittest.TestCase):
         # Set up home board scenario but no piece at test point
         for i in range(18, 24):
             board.__points__[i] = [1] if i != 20 else []
+        board.refresh_incremental_state()
 
         # Try to bear off from point without player's piece
         self.assertFalse(board.can_bear_off(20, 1))
@@ -439,6 +454,7 @@ class TestBoard(unittest.TestCase):
         # Set up home board scenario
         for i in range(18, 24):
             board.__points__[i] = [1] if i != 20 else [2]  # Point 21 has player 2 piece
+        board.refresh_incremental_state()
 
         # Try to bear off player 1 from point with player 2 piece
         self.assertFalse(board.can_bear_off(20, 1))
@@ -449,6 +465,7 @@ class TestBoard(unittest.TestCase):
         # Set up home board but no piece at the target point
         for i in range(18, 24):
             board.__points__[i] = [1] if i != 23 else []
+        board.refresh_incremental_state()
 
         result = board.bear_off_piece(23, 1)
         self.assertFalse(result)
@@ -459,6 +476,7 @@ class TestBoard(unittest.TestCase):
         # Set up home board but with wrong player at target point
         for i in range(18, 24):
             board.__points__[i] = [1] if i != 23 else [2]  # Player 2 piece instead
+        board.refresh_incremental_state()
 
         result = board.bear_off_piece(23, 1)
         self.assertFalse(result)
@@ -468,6 +486,7 @@ class TestBoard(unittest.TestCase):
         board = Board()
         board.__points__[23] = [1]  # Piece to bear off
         board.__points__[10] = [1]  # Piece outside home
+        board.refresh_incremental_state()
 
         result = board.bear_off_piece(23, 1)
         self.assertFalse(result)
@@ -477,6 +496,7 @@ class TestBoard(unittest.TestCase):
         board = Board()
         board.__points__[18] = [1]  # In home
         board.__points__[10] = [1]  # Outside home
+        board.refresh_incremental_state()
 
         result = board.is_all_pieces_in_home(1)
         self.assertFalse(result)
@@ -497,6 +517,7 @@ class TestBoard(unittest.TestCase):
         # Block all possible entry points for dice values 1 and 2
         board.__points__[23] = [2, 2]  # Block entry for dice 1 (24-1=23)
         board.__points__[22] = [2, 2]  # Block entry for dice 2 (24-2=22)
+        board.refresh_incremental_state()
 
         moves = board.get_possible_moves(1, [1, 2])
 
@@ -510,6 +531,7 @@ class TestBoard(unittest.TestCase):
         # Set up bear off scenario
         for i in range(18, 24):
             board.__points__[i] = [1] if i in [20, 22, 23] else []
+        board.refresh_incremental_state()
 
         moves = board.get_possible_moves(1, [1, 3, 6])
 
@@ -588,6 +610,152 @@ class TestBoard(unittest.TestCase):
         self.assertEqual(board_copy.__checker_bar__[0], [1])
         self.assertEqual(board_copy.__off_board__[0], [1])
 
+    def test_apply_and_revert_move_with_capture(self):
+        """Test apply/revert restores a capture exactly"""
+        board = Board()
+        board.setup_initial_position()
+        board.__points__[3] = [2]
+        board.refresh_incremental_state()
+        before = board.get_board_state()
+        before_hash = board.get_zobrist_hash()
+
+        token = board.apply((0, 3), 1)
+        self.assertIsNotNone(token)
+        self.assertEqual(board.__points__[3], [1])
+        self.assertEqual(board.__checker_bar__[0], [2])
+
+        board.revert(token)
+        self.assertEqual(board.get_board_state(), before)
+        self.assertEqual(board.get_zobrist_hash(), before_hash)
+
+    def test_apply_and_revert_bar_entry_and_bear_off(self):
+        """Test apply/revert for bar entry and bearing off sequences"""
+        board = Board()
+        board.__checker_bar__[1] = [1]
+        board.__points__[2] = [2]
+        board.__points__[20] = [1]
+        board.refresh_incremental_state()
+        before = board.get_board_state()
+
+        enter = board.apply({"from": "bar", "to": 2}, 1)
+        self.assertIsNotNone(enter)
+        self.assertEqual(board.__checker_bar__[0], [2])
+        board.revert(enter)
+        self.assertEqual(board.get_board_state(), before)
+
+        board.__checker_bar__[1] = []
+        board.__points__[2] = []
+        board.refresh_incremental_state()
+        bear_off = board.apply((20, "off"), 1)
+        self.assertEqual(board.__off_board__[0], [1])
+        board.revert(bear_off)
+        self.assertEqual(board.__points__[20], [1])
+        self.assertEqual(board.__off_board__[0], [])
+
+    def test_apply_illegal_move_returns_none(self):
+        """Test apply leaves the board untouched for illegal moves"""
+        board = Board()
+        board.setup_initial_position()
+        before = board.get_board_state()
+        self.assertIsNone(board.apply((0, 5), 1))
+        self.assertIsNone(board.apply(("bar", 2), 1))
+        self.assertEqual(board.get_board_state(), before)
+
+    def test_pip_counts_are_maintained_incrementally(self):
+        """Test running pip totals through moves, hits, entry and bear off"""
+        board = Board()
+        board.setup_initial_position()
+        self.assertEqual(board.get_pip_count(1), 167)
+        self.assertEqual(board.get_pip_count(2), 167)
+
+        board.__points__[3] = [2]
+        board.refresh_incremental_state()
+        self.assertEqual(board.get_pip_count(2), 167 + 4)
+        board.move_piece(0, 3, 1)
+        self.assertEqual(board.get_pip_count(1), 164)
+        self.assertEqual(board.get_pip_count(2), 167 + 25)
+        board.enter_from_bar(20, 2)
+        self.assertEqual(board.get_pip_count(2), 167 + 21)
+        board.verify_incremental_state()
+
+        token = board.apply((3, 9), 1)
+        self.assertEqual(board.get_pip_count(1), 158)
+        board.revert(token)
+        self.assertEqual(board.get_pip_count(1), 164)
+
+    def test_pip_debug_self_check_detects_stale_totals(self):
+        """Test the debug self-check recount after direct list edits"""
+        board = Board()
+        board.setup_initial_position()
+        board.__points__[0] = [1]
+        with patch.object(Board, "DEBUG_SELF_CHECK", True):
+            with self.assertRaises(RuntimeError):
+                board.get_pip_count(1)
+            board.refresh_incremental_state()
+            self.assertEqual(board.get_pip_count(1), 143)
+
+    def test_can_bear_off_larger_die_only_from_rearmost_point(self):
+        """Test a larger die bears off only when no checker is farther back"""
+        board = Board()
+        board.__points__[18] = [1]
+        board.__points__[22] = [1]
+        board.refresh_incremental_state()
+        self.assertFalse(board.can_bear_off(22, 1, dice_value=6))
+        self.assertTrue(board.can_bear_off(18, 1, dice_value=6))
+
+        board.__points__[5] = [2]
+        board.__points__[1] = [2]
+        board.refresh_incremental_state()
+        self.assertFalse(board.can_bear_off(1, 2, dice_value=5))
+        self.assertTrue(board.can_bear_off(5, 2, dice_value=6))
+        board.__points__[5] = []
+        board.refresh_incremental_state()
+        self.assertTrue(board.can_bear_off(1, 2, dice_value=5))
+
+    def test_has_any_move(self):
+        """Test the early-exit probe covers bar entry, regular and bear-off moves"""
+        board = Board()
+        board.setup_initial_position()
+        self.assertTrue(board.has_any_move(1, [6, 5]))
+
+        board = Board()
+        board.__checker_bar__[1] = [1]
+        board.__points__[0] = [2, 2]
+        board.__points__[1] = [2, 2]
+        board.refresh_incremental_state()
+        self.assertFalse(board.has_any_move(1, [1, 2]))
+        self.assertTrue(board.has_any_move(1, [3]))
+
+        board = Board()
+        board.__points__[20] = [1]
+        board.__points__[21] = [2, 2]
+        board.__points__[22] = [2, 2]
+        board.__points__[23] = [2, 2]
+        board.refresh_incremental_state()
+        self.assertFalse(board.has_any_move(1, [1, 2, 3]))
+        self.assertTrue(board.has_any_move(1, [4]))
+
+    def test_iter_and_count_possible_moves(self):
+        """Test the lazy move iterator matches get_possible_moves"""
+        board = Board()
+        board.setup_initial_position()
+        moves = board.get_possible_moves(1, [3, 1])
+        self.assertEqual(
+            list(board.iter_possible_moves(1, [3, 1])),
+            [(move["from"], move["to"], move["dice"]) for move in moves],
+        )
+        self.assertEqual(board.count_possible_moves(1, [3, 1]), len(moves))
+        self.assertEqual(next(board.iter_possible_moves(1, [3, 1])), (0, 3, 3))
+
+        board.__checker_bar__[1] = [1]
+        self.assertEqual(list(board.iter_possible_moves(1, [3, 6])), [("bar", 2, 3)])
+        self.assertEqual(board.count_possible_moves(1, [6]), 0)
+
+    def test_board_uses_slots(self):
+        """Test boards keep their state in slots rather than a __dict__"""
+        self.assertFalse(hasattr(Board(), "__dict__"))
+        self.assertFalse(hasattr(CompactBoard(), "__dict__"))
+
 
 if __name__ == "__main__":
     unittest.main()
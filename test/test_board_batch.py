@@ -0,0 +1,125 @@
+"""Unit tests for the BoardBatch class.
+
+This module validates building batches from boards, saved states and cell
+arrays, and checks every encoder against the per-position board methods.
+"""
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+import unittest
+from test.helpers import cells_of, make_board, mirror
+import numpy as np
+from benchmarks.search_stats import sample_searches
+from core.backgammon import BackgammonGame
+from core.board import Board
+from core.board_batch import BATCH_CELLS, BoardBatch
+from core.compact_board import CompactBoard
+from core.move_tables import BEAR_OFF_DISTANCE
+
+# Player 1 has a checker on the bar and blots on points 3 and 20
+HITS = {0: 1, 3: 1, 20: 1, 18: 2, 24: 1, 26: 9, 5: -2, 23: -1, 16: -3, 27: 9}
+
+
+class TestBoardBatch(unittest.TestCase):
+    """Test suite covering BoardBatch."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method.
+
+        Returns:
+            None
+        """
+        self.__samples__ = sample_searches(40)
+        self.__batch__ = BoardBatch.from_boards(
+            [board for board, _, _ in self.__samples__],
+            [player for _, player, _ in self.__samples__],
+        )
+
+    def test_builds_from_boards_states_and_cells(self):
+        board = Board()
+        board.setup_initial_position()
+        compact = make_board(HITS)
+        batch = BoardBatch.from_boards([board, compact], [1, 2])
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(batch.get_cells().shape, (2, BATCH_CELLS))
+        self.assertEqual(batch.get_players().tolist(), [1, 2])
+        initial = CompactBoard.from_board(board)
+        expected = np.stack([cells_of(initial), cells_of(compact)])
+        np.testing.assert_array_equal(batch.to_cells(), expected)
+
+        states = [board.get_board_state(), compact.get_board_state()]
+        from_states = BoardBatch.from_states(states, [1, 2])
+        np.testing.assert_array_equal(from_states.get_cells(), batch.get_cells())
+        from_cells = BoardBatch.from_cells(expected, 2)
+        np.testing.assert_array_equal(from_cells.get_cells(), batch.get_cells())
+        self.assertEqual(from_cells.get_players().tolist(), [2, 2])
+
+    def test_game_states_carry_the_side_to_move(self):
+        game = BackgammonGame()
+        game.setup_initial_position()
+        first = game.get_serializable_state()
+        game.switch_current_player()
+        batch = BoardBatch.from_states([first, game.get_serializable_state()])
+        self.assertEqual(batch.get_players().tolist(), [1, 2])
+        with self.assertRaises(ValueError):
+            BoardBatch.from_states([first["board"]])
+
+    def test_raw_counts(self):
+        counts = BoardBatch.from_boards([make_board(HITS)], 1).raw_counts()[0]
+        self.assertEqual(counts[0, [0, 18, 24, 25]].tolist(), [1, 2, 1, 9])
+        self.assertEqual(counts[1, [5, 16, 23, 25]].tolist(), [2, 3, 1, 9])
+        self.assertEqual(counts.sum(axis=1).tolist(), [15, 15])
+
+    def test_encoders_are_relative_to_the_side_to_move(self):
+        board = make_board(HITS)
+        first = BoardBatch.from_boards([board], 1)
+        second = BoardBatch.from_boards([mirror(board)], 2)
+        for encoder in ("raw_counts", "one_hot", "pip_counts", "blot_masks"):
+            np.testing.assert_array_equal(
+                getattr(first, encoder)(), getattr(second, encoder)()
+            )
+        other_side = BoardBatch.from_boards([board], 2).raw_counts()
+        self.assertFalse((first.raw_counts() == other_side).all())
+
+    def test_one_hot(self):
+        units = BoardBatch.from_boards([make_board(HITS)], 2).one_hot(limit=2)[0]
+        self.assertEqual(units.shape, (2, 25, 2))
+        # Player 2's three checkers on point 16 set the last unit
+        self.assertEqual(units[0, 23 - 16].tolist(), [0, 1])
+        self.assertEqual(units[0, 23 - 23].tolist(), [1, 0])
+        self.assertEqual(units[1, 23 - 4].tolist(), [0, 0])
+        self.assertEqual(units[1, 24].tolist(), [1, 0])
+        self.assertEqual(int(units.sum()), 8)
+        with self.assertRaises(ValueError):
+            self.__batch__.one_hot(limit=0)
+
+    def test_pip_counts_match_boards(self):
+        pips = self.__batch__.pip_counts()
+        for (board, player, _), row in zip(self.__samples__, pips):
+            self.assertEqual(
+                row.tolist(),
+                [board.get_pip_count(player), board.get_pip_count(3 - player)],
+            )
+
+    def test_blot_masks_match_boards(self):
+        masks = self.__batch__.blot_masks()
+        for (board, player, _), row in zip(self.__samples__, masks):
+            for side, owner in enumerate((player, 3 - player)):
+                blots = {
+                    BEAR_OFF_DISTANCE[player][point]
+                    for point in range(24)
+                    if abs(board.__cells__[point]) == 1
+                    and (board.__cells__[point] > 0) == (owner == 1)
+                }
+                self.assertEqual(set(24 - np.flatnonzero(row[side])), blots)
+
+    def test_invalid_batches(self):
+        with self.assertRaises(ValueError):
+            BoardBatch(np.zeros((3, 28)), 1)
+        with self.assertRaises(ValueError):
+            BoardBatch(np.zeros((3, BATCH_CELLS)), [1, 2, 3])
+        empty = BoardBatch.from_boards([], 1)
+        self.assertEqual(empty.pip_counts().shape, (0, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
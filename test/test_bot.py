@@ -0,0 +1,107 @@
+"""Unit tests for the GreedyBot computer player.
+
+This module validates play selection, whole turns in a BackgammonGame and
+headless bot-versus-bot games.
+"""
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+import random
+import unittest
+from core.backgammon import BackgammonGame
+from core.bot import GreedyBot, play_game
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.evaluator import Evaluator
+from core.move_generator import generate_plays
+
+
+class RaceEvaluator(Evaluator):
+    """Evaluator preferring the lowest own pip count."""
+
+    def evaluate(self, board, player):
+        """Score a position by pip count alone.
+
+        Args:
+            board: CompactBoard to evaluate
+            player (int): Player number (1 or 2)
+
+        Returns:
+            float: Negated pip count of player
+        """
+        return -float(board.get_pip_count(player))
+
+
+class TestGreedyBot(unittest.TestCase):
+    """Test suite covering GreedyBot and play_game."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method.
+
+        Returns:
+            None
+        """
+        self.__bot__ = GreedyBot()
+        self.__board__ = CompactBoard()
+        self.__board__.setup_initial_position()
+
+    def test_choose_play_is_legal(self):
+        play = self.__bot__.choose_play(self.__board__, 1, (3, 1))
+        self.assertIn(play, generate_plays(self.__board__, 1, (3, 1)))
+
+    def test_choose_play_makes_point_with_opening_three_one(self):
+        play = self.__bot__.choose_play(self.__board__, 1, (3, 1))
+        self.assertEqual(sorted(move[:2] for move in play), [(16, 19), (18, 19)])
+
+    def test_choose_play_without_moves(self):
+        board = CompactBoard()
+        board.__cells__[24] = 1
+        for point in range(6):
+            board.__cells__[point] = -2
+        board.refresh_incremental_state()
+        self.assertEqual(self.__bot__.choose_play(board, 1, (6, 5)), ())
+
+    def test_custom_evaluator_and_list_board(self):
+        bot = GreedyBot(RaceEvaluator())
+        game = BackgammonGame()
+        game.setup_initial_position()
+        play = bot.choose_play(game.__board__, 1, (6, 6))
+        self.assertIsInstance(bot.get_evaluator(), RaceEvaluator)
+        self.assertEqual(len(play), 4)
+
+    def test_play_turn_switches_player(self):
+        game = BackgammonGame()
+        game.setup_initial_position()
+        player = game.__current_player__
+        play = self.__bot__.play_turn(game)
+        self.assertTrue(play)
+        self.assertIsNot(game.__current_player__, player)
+        self.assertIsNone(game.__last_roll__)
+
+    def test_play_turn_rejects_partly_used_roll(self):
+        game = BackgammonGame()
+        game.setup_initial_position()
+        game.__last_roll__ = (6, 5)
+        game.__available_moves__ = [5]
+        self.assertIsNone(self.__bot__.play_turn(game))
+
+    def test_auto_play_turn_with_bot(self):
+        game = BackgammonGame()
+        game.setup_initial_position()
+        player = game.__current_player__
+        self.assertTrue(game.auto_play_turn(self.__bot__))
+        self.assertIsNot(game.__current_player__, player)
+
+    def test_play_game_finishes(self):
+        dice = Dice(random.Random(7))
+        winner, points = play_game((self.__bot__, self.__bot__), dice=dice)
+        self.assertIn(winner, (1, 2))
+        self.assertIn(points, (1, 2, 3))
+
+    def test_play_game_turn_limit(self):
+        self.assertIsNone(
+            play_game((self.__bot__, self.__bot__), dice=Dice(), max_turns=2)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -341,6 +341,11 @@ class TestChecker(unittest.TestCase):
         self.assertTrue(self.__black_checker__.__is_borne_off__)
         self.assertIsNone(self.__black_checker__.__position__)
 
+    def test_checker_uses_slots(self):
+        self.assertFalse(hasattr(self.__white_checker__, "__dict__"))
+        with self.assertRaises(AttributeError):
+            setattr(self.__white_checker__, "extra", 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,122 @@
+"""Unit tests for the CheckerRegistry class.
+
+This module validates that the location index follows reported and
+rebuilt checker relocations and answers the BackgammonGame checker queries.
+"""
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+import copy
+import unittest
+from unittest.mock import patch
+from core.backgammon import BackgammonGame
+from core.checker import Checker
+from core.checker_registry import CheckerRegistry
+
+
+class TestCheckerRegistry(unittest.TestCase):
+    """Test suite covering CheckerRegistry behaviors."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method.
+
+        Returns:
+            None
+        """
+        self.__checkers__ = [Checker("white") for _ in range(3)]
+        self.__registry__ = CheckerRegistry(self.__checkers__)
+
+    def test_unplaced_checkers_are_indexed(self):
+        self.assertEqual(self.__registry__.count(None), 3)
+        self.assertEqual(self.__registry__.get_checkers(5), [])
+        self.assertIsNone(self.__registry__.first_checker("bar"))
+
+    def test_relocations_update_index(self):
+        first, second, _ = self.__checkers__
+        first.place_on_point(5)
+        self.__registry__.relocate(first, None)
+        second.place_on_point(5)
+        self.__registry__.relocate(second, None)
+        self.assertEqual(self.__registry__.count(5), 2)
+        self.assertIs(self.__registry__.first_checker(5), first)
+
+        first.send_to_bar()
+        self.__registry__.relocate(first, 5)
+        self.assertIs(self.__registry__.first_checker(5), second)
+        self.assertIs(self.__registry__.first_checker("bar"), first)
+
+        first.return_from_bar(7)
+        self.__registry__.relocate(first, "bar")
+        second.bear_off()
+        self.__registry__.relocate(second, 5)
+        self.assertEqual(self.__registry__.get_checkers(7), [first])
+        self.assertEqual(self.__registry__.get_checkers("off"), [second])
+        self.assertEqual(self.__registry__.count(5), 0)
+
+    def test_removal_is_by_identity(self):
+        first, second, _ = self.__checkers__
+        first.place_on_point(3)
+        second.place_on_point(3)
+        self.__registry__.rebuild()
+        self.assertEqual(first, second)
+        second.move_to_point(4)
+        self.__registry__.relocate(second, 3)
+        self.assertIs(self.__registry__.first_checker(3), first)
+        self.assertIs(self.__registry__.first_checker(4), second)
+
+    def test_rebuild_follows_unreported_moves(self):
+        first, second, _ = self.__checkers__
+        first.place_on_point(9)
+        second.place_on_point(9)
+        second.send_to_bar()
+        self.__registry__.rebuild()
+        self.assertEqual(self.__registry__.get_checkers(9), [first])
+        self.assertEqual(self.__registry__.get_checkers("bar"), [second])
+        self.assertEqual(self.__registry__.count(None), 1)
+
+    def test_verify_rejects_unreported_moves(self):
+        first = self.__checkers__[0]
+        self.__registry__.verify()
+        first.place_on_point(9)
+        with self.assertRaises(RuntimeError):
+            self.__registry__.verify()
+        self.__registry__.relocate(first, None)
+        self.__registry__.verify()
+
+    def test_self_check_guards_lookups(self):
+        self.__checkers__[0].place_on_point(9)
+        with patch.object(CheckerRegistry, "DEBUG_SELF_CHECK", True):
+            with self.assertRaises(RuntimeError):
+                self.__registry__.count(9)
+            with self.assertRaises(RuntimeError):
+                self.__registry__.first_checker(9)
+            with self.assertRaises(RuntimeError):
+                self.__registry__.get_checkers(9)
+
+    def test_game_queries_follow_checker_object_moves(self):
+        game = BackgammonGame()
+        game.setup_initial_position()
+        game.__player2_checkers__[0].move_to_point(2)
+        game.refresh_checker_index()
+        self.assertTrue(game.move_checker_object(0, 1, 1))
+        self.assertEqual(len(game.get_checkers_at_point(1, 1)), 1)
+        self.assertEqual(len(game.get_checkers_on_bar(2)), 1)
+        self.assertEqual(len(game.get_checkers_at_point(23, 2)), 1)
+        self.assertTrue(game.move_checker_from_bar_object(23, 2))
+        self.assertEqual(len(game.get_checkers_at_point(23, 2)), 2)
+        self.assertEqual(len(game.get_checkers_on_bar(2)), 0)
+        self.assertTrue(game.bear_off_checker_object(18, 1))
+        self.assertEqual(len(game.get_checkers_at_point(18, 1)), 4)
+        self.assertEqual(len(game.get_borne_off_checkers(1)), 1)
+
+    def test_game_copy_keeps_separate_index(self):
+        game = BackgammonGame()
+        game.setup_initial_position()
+        clone = copy.deepcopy(game)
+        clone.bear_off_checker_object(18, 1)
+        self.assertEqual(len(clone.get_borne_off_checkers(1)), 1)
+        self.assertEqual(len(game.get_borne_off_checkers(1)), 0)
+        self.assertEqual(len(clone.get_checkers_at_point(18, 1)), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -239,11 +239,27 @@ class TestBackgammonCLI(unittest.TestCase):
         # Setup all-in-home for player1 with a checker at 24 (index 23)
         self.__cli__.__game__.__board__.__points__ = [[] for _ in range(24)]
         self.__cli__.__game__.__board__.__points__[23] = [1]
+        self.__cli__.__game__.__board__.refresh_incremental_state()
         self.__cli__.__game__.__last_roll__ = (1, 2)
         self.__cli__.__game__.__available_moves__ = [1, 2]
         output = self._run_commands(["bearoff", "24", "quit"])
         self.assertIn("Checker borne off", output)
 
+    def test_bot_plays_turn(self):
+        """Bot command should roll, play the whole turn and pass the turn."""
+        with patch("core.dice.Dice.roll", return_value=(3, 1)):
+            output = self._run_commands(["bot", "board", "quit"])
+        self.assertIn("Rolled: 3 and 1", output)
+        self.assertIn("Bot played: ", output)
+        self.assertIn("Player 2 (black)", output)
+
+    def test_bot_rejects_partly_used_roll(self):
+        """Bot command should refuse a turn whose dice are partly used."""
+        self.__cli__.__game__.__last_roll__ = (3, 1)
+        self.__cli__.__game__.__available_moves__ = [3]
+        output = self._run_commands(["bot", "quit"])
+        self.assertIn("dice are all unused", output)
+
     def test_turn_indicator_in_board_display(self):
         """Board should display current player turn prominently."""
         output = self._run_commands(["board", "quit"])
@@ -607,6 +623,7 @@ class TestBackgammonCLI(unittest.TestCase):
         for i in range(24):
             self.__cli__.__game_controller__.__game__.__board__.__points__[i] = []
         self.__cli__.__game_controller__.__game__.__board__.__points__[23] = [1]
+        self.__cli__.__game_controller__.__game__.__board__.refresh_incremental_state()
         self.__cli__.__game_controller__.__game__.__last_roll__ = (1, 2)
         self.__cli__.__game_controller__.__game__.__available_moves__ = [1, 2]
         output = self._run_commands(["bearoff", "24", "quit"])
@@ -0,0 +1,217 @@
+"""Unit tests for the CompactBoard class.
+
+This module validates that the count-based board engine behaves exactly like
+the list-based Board for movement, bar entry, bearing off and state export.
+"""
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+import random
+import unittest
+from core.board import Board
+from core.compact_board import CompactBoard
+
+
+class TestCompactBoard(unittest.TestCase):
+    """Test suite covering CompactBoard behaviors and parity with Board."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method.
+
+        Returns:
+            None
+        """
+        self.__board__ = CompactBoard()
+        self.__board__.setup_initial_position()
+
+    def test_initial_position_matches_board(self):
+        board = Board()
+        board.setup_initial_position()
+        self.assertEqual(self.__board__.get_board_state(), board.get_board_state())
+
+    def test_cells_are_compact_signed_counts(self):
+        self.assertEqual(len(self.__board__.__cells__), 28)
+        self.assertEqual(self.__board__.__cells__[0], 2)
+        self.assertEqual(self.__board__.__cells__[5], -5)
+
+    def test_get_point(self):
+        point = self.__board__.get_point(12)
+        self.assertEqual(point["pieces"], [2, 2, 2, 2, 2])
+        self.assertEqual(point["count"], 5)
+        self.assertEqual(point["player"], 2)
+        self.assertIsNone(self.__board__.get_point(1)["player"])
+
+    def test_get_point_invalid_index(self):
+        with self.assertRaises(IndexError):
+            self.__board__.get_point(24)
+
+    def test_can_move_blocked(self):
+        self.assertFalse(self.__board__.can_move(0, 5, 1))
+        self.assertTrue(self.__board__.can_move(0, 1, 1))
+        self.assertFalse(self.__board__.can_move(1, 2, 1))
+
+    def test_move_piece_with_capture(self):
+        board = CompactBoard()
+        board.__cells__[3] = 1
+        board.__cells__[6] = -1
+        self.assertTrue(board.move_piece(3, 6, 1))
+        self.assertEqual(board.__cells__[6], 1)
+        self.assertTrue(board.has_pieces_on_bar(2))
+        self.assertEqual(board.get_board_state()["bar"], [[2], []])
+
+    def test_enter_from_bar(self):
+        board = CompactBoard()
+        board.__cells__[24] = 1
+        board.__cells__[2] = -1
+        self.assertTrue(board.enter_from_bar(2, 1))
+        self.assertFalse(board.has_pieces_on_bar(1))
+        self.assertTrue(board.has_pieces_on_bar(2))
+        self.assertFalse(board.enter_from_bar(3, 1))
+
+    def test_enter_from_bar_blocked(self):
+        board = CompactBoard()
+        board.__cells__[24] = 1
+        board.__cells__[2] = -2
+        self.assertFalse(board.enter_from_bar(2, 1))
+
+    def test_bear_off(self):
+        board = CompactBoard()
+        board.__cells__[20] = 1
+        board.refresh_incremental_state()
+        self.assertTrue(board.can_bear_off(20, 1, 6))
+        self.assertFalse(board.can_bear_off(20, 1, 3))
+        self.assertTrue(board.bear_off_piece(20, 1))
+        self.assertEqual(board.get_board_state()["off_board"], [[1], []])
+
+    def test_cannot_bear_off_outside_home(self):
+        self.assertFalse(self.__board__.is_all_pieces_in_home(1))
+        self.assertFalse(self.__board__.bear_off_piece(18, 1))
+
+    def test_winner(self):
+        board = CompactBoard()
+        board.__cells__[27] = 15
+        self.assertTrue(board.is_game_over())
+        self.assertEqual(board.get_winner(), 2)
+
+    def test_count_pieces_for_player(self):
+        self.assertEqual(self.__board__.count_pieces_for_player(1), 15)
+        self.assertEqual(self.__board__.count_pieces_for_player(2), 15)
+
+    def test_copy_is_independent(self):
+        clone = self.__board__.copy()
+        clone.move_piece(0, 1, 1)
+        self.assertEqual(self.__board__.__cells__[0], 2)
+        self.assertEqual(clone.__cells__[0], 1)
+
+    def test_from_board_round_trip(self):
+        board = Board()
+        board.setup_initial_position()
+        board.move_piece(0, 3, 1)
+        compact = CompactBoard.from_board(board)
+        self.assertEqual(compact.get_board_state(), board.get_board_state())
+
+    def test_apply_and_revert_restore_position(self):
+        board = CompactBoard()
+        board.__cells__[3] = 1
+        board.__cells__[6] = -1
+        board.__cells__[25] = 1
+        board.__cells__[20] = 1
+        board.refresh_incremental_state()
+        before = board.get_board_state()
+        before_hash = board.get_zobrist_hash()
+
+        tokens = [board.apply((3, 6), 1), board.apply(("bar", 6), 2)]
+        self.assertNotIn(None, tokens)
+        self.assertTrue(board.has_pieces_on_bar(1))
+        for token in reversed(tokens):
+            board.revert(token)
+        self.assertEqual(board.get_board_state(), before)
+        self.assertEqual(board.get_zobrist_hash(), before_hash)
+
+    def test_apply_bear_off_and_illegal_move(self):
+        board = CompactBoard()
+        board.__cells__[20] = 1
+        board.refresh_incremental_state()
+        token = board.apply({"from": 20, "to": "off"}, 1)
+        self.assertEqual(board.__cells__[26], 1)
+        board.revert(token)
+        self.assertEqual(board.__cells__[20], 1)
+        self.assertEqual(board.__cells__[26], 0)
+        self.assertIsNone(board.apply((20, 19), 2))
+
+    def test_pip_counts_and_self_check(self):
+        self.assertEqual(self.__board__.get_pip_count(1), 167)
+        self.__board__.move_piece(11, 17, 1)
+        self.assertEqual(self.__board__.get_pip_count(1), 161)
+        self.__board__.verify_incremental_state()
+        self.__board__.__cells__[0] = 0
+        with self.assertRaises(RuntimeError):
+            self.__board__.verify_incremental_state()
+
+    def test_home_tracking_through_bear_off(self):
+        board = CompactBoard()
+        board.__cells__[17] = 1
+        board.__cells__[22] = 2
+        board.__cells__[3] = -1
+        board.refresh_incremental_state()
+        self.assertFalse(board.is_all_pieces_in_home(1))
+        board.move_piece(17, 19, 1)
+        self.assertTrue(board.is_all_pieces_in_home(1))
+        self.assertFalse(board.can_bear_off(22, 1, 6))
+        self.assertTrue(board.can_bear_off(19, 1, 6))
+        self.assertTrue(board.bear_off_piece(19, 1))
+        self.assertTrue(board.can_bear_off(22, 1, 6))
+        board.verify_incremental_state()
+
+    def test_hit_sends_rearmost_checker_to_bar(self):
+        board = CompactBoard()
+        board.__cells__[1] = 1
+        board.__cells__[3] = -1
+        board.__cells__[2] = -1
+        board.refresh_incremental_state()
+        self.assertTrue(board.is_all_pieces_in_home(2))
+        token = board.apply((1, 3), 1)
+        self.assertFalse(board.is_all_pieces_in_home(2))
+        board.verify_incremental_state()
+        board.revert(token)
+        self.assertTrue(board.is_all_pieces_in_home(2))
+        board.verify_incremental_state()
+
+    def test_random_play_parity_with_board(self):
+        rng = random.Random(7)
+        board = Board()
+        board.setup_initial_position()
+        compact = CompactBoard.from_board(board)
+        player = 1
+        for _ in range(300):
+            dice = [rng.randint(1, 6), rng.randint(1, 6)]
+            moves = board.get_possible_moves(player, dice)
+            self.assertEqual(moves, compact.get_possible_moves(player, dice))
+            self.assertEqual(board.has_any_move(player, dice), bool(moves))
+            self.assertEqual(compact.has_any_move(player, dice), bool(moves))
+            self.assertEqual(compact.count_possible_moves(player, dice), len(moves))
+            if moves:
+                move = rng.choice(moves)
+                if move["from"] == "bar":
+                    board.enter_from_bar(move["to"], player)
+                    compact.enter_from_bar(move["to"], player)
+                elif move["to"] == "off":
+                    board.bear_off_piece(move["from"], player)
+                    compact.bear_off_piece(move["from"], player)
+                else:
+                    board.move_piece(move["from"], move["to"], player)
+                    compact.move_piece(move["from"], move["to"], player)
+            self.assertEqual(compact.get_board_state(), board.get_board_state())
+            compact.verify_incremental_state()
+            for side in (1, 2):
+                self.assertEqual(compact.get_pip_count(side), board.get_pip_count(side))
+                self.assertEqual(
+                    compact.is_all_pieces_in_home(side),
+                    board.is_all_pieces_in_home(side),
+                )
+            if board.is_game_over():
+                break
+            player = 2 if player == 1 else 1
+
+
+if __name__ == "__main__":
+    unittest.main()
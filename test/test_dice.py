@@ -5,9 +5,10 @@ This module contains a suite of unit tests for the Dice class, which is used to
 and related operations in a backgammon game.
 """
 
+import random
 import unittest
 from unittest.mock import patch
-from core.dice import Dice
+from core.dice import Dice, RotatedDice
 
 # pylint: disable=C0116  # many simple test methods without individual docstrings
 
@@ -206,6 +207,35 @@ class TestDice(unittest.TestCase):
         self.assertTrue(mock_randint.called)
         self.assertEqual(mock_randint.call_count, 1)
 
+    def test_roll_from_own_stream(self):
+        first = Dice(random.Random(5))
+        second = Dice(random.Random(5))
+        rolls = [first.roll() for _ in range(20)]
+        self.assertEqual(rolls, [second.roll() for _ in range(20)])
+
+    def test_rotated_dice_stratify_opening_rolls(self):
+        openings = [RotatedDice(game, seed=3).roll() for game in range(36)]
+        self.assertEqual(sorted(openings), sorted(RotatedDice.COMBINATIONS))
+
+    def test_rotated_dice_cover_every_pair_of_first_rolls(self):
+        pairs = set()
+        for game in range(1296):
+            dice = RotatedDice(game, seed=3)
+            pairs.add((dice.roll(), dice.roll()))
+        self.assertEqual(len(pairs), 1296)
+
+    def test_rotated_dice_continue_at_random(self):
+        dice = RotatedDice(7, seed=1, rng=random.Random(2))
+        stream = Dice(random.Random(2))
+        dice.roll()
+        dice.roll()
+        self.assertEqual(
+            [dice.roll() for _ in range(5)], [stream.roll() for _ in range(5)]
+        )
+        self.assertNotEqual(
+            RotatedDice(0, seed=1).roll(), RotatedDice(1, seed=1).roll()
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,137 @@
+"""Unit tests for the position evaluators.
+
+This module validates game results, terminal equities and the behavior of
+the HeuristicEvaluator features.
+"""
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+import math
+import unittest
+from test.helpers import make_board
+from core.compact_board import CompactBoard
+from core.evaluator import HeuristicEvaluator, game_result, terminal_equity
+from core.move_generator import generate_plays
+
+
+def single_feature(feature):
+    """Build a HeuristicEvaluator weighing one feature only.
+
+    Args:
+        feature (str): Name of the feature to keep, with weight 1
+
+    Returns:
+        HeuristicEvaluator: Evaluator scoring tanh of the feature difference
+    """
+    weights = dict.fromkeys(HeuristicEvaluator.DEFAULT_WEIGHTS, 0.0)
+    weights[feature] = 1.0
+    return HeuristicEvaluator(weights)
+
+
+class TestGameResult(unittest.TestCase):
+    """Test suite covering game_result and terminal_equity."""
+
+    def test_game_in_progress(self):
+        board = CompactBoard()
+        board.setup_initial_position()
+        self.assertIsNone(game_result(board))
+        self.assertIsNone(terminal_equity(board, 1))
+
+    def test_single_game(self):
+        board = make_board({26: 15, 27: 3, 10: -12})
+        self.assertEqual(game_result(board), (1, 1))
+        self.assertEqual(terminal_equity(board, 1), 1.0)
+        self.assertEqual(terminal_equity(board, 2), -1.0)
+
+    def test_gammon(self):
+        board = make_board({27: 15, 12: 15})
+        self.assertEqual(game_result(board), (2, 2))
+        self.assertEqual(terminal_equity(board, 1), -2.0)
+
+    def test_backgammon_from_home_board_and_bar(self):
+        self.assertEqual(game_result(make_board({26: 15, 20: -15})), (1, 3))
+        self.assertEqual(game_result(make_board({26: 15, 25: -1, 5: -14})), (1, 3))
+
+
+class TestHeuristicEvaluator(unittest.TestCase):
+    """Test suite covering HeuristicEvaluator."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method.
+
+        Returns:
+            None
+        """
+        self.__evaluator__ = HeuristicEvaluator()
+
+    def test_initial_position_is_even(self):
+        board = CompactBoard()
+        board.setup_initial_position()
+        self.assertAlmostEqual(self.__evaluator__.evaluate(board, 1), 0.0)
+        self.assertAlmostEqual(self.__evaluator__.evaluate(board, 2), 0.0)
+
+    def test_equity_is_antisymmetric_and_bounded(self):
+        board = make_board({0: 2, 5: 1, 11: 5, 16: 3, 18: 4, 23: -2, 12: -5,
+                            7: -3, 4: -1, 25: -1, 2: -3})
+        own = self.__evaluator__.evaluate(board, 1)
+        self.assertAlmostEqual(own, -self.__evaluator__.evaluate(board, 2))
+        self.assertLess(abs(own), 1.0)
+
+    def test_race_lead_scores_positive(self):
+        board = make_board({22: 15, 10: -15})
+        self.assertGreater(self.__evaluator__.evaluate(board, 1), 0.0)
+        self.assertLess(self.__evaluator__.evaluate(board, 2), 0.0)
+
+    def test_exposed_blots_and_bar(self):
+        # Player 1 blots on 4 (hit from 9) and 20 (out of range of 5); the
+        # player 2 blot on 9 is exposed to the checker on the bar
+        board = make_board({4: 1, 20: 1, 9: -1, 5: -2, 24: 1})
+        self.assertAlmostEqual(single_feature("blots").evaluate(board, 1), 0.0)
+        board.__cells__[24] = 0
+        board.__cells__[0] = 2
+        board.refresh_incremental_state()
+        self.assertAlmostEqual(single_feature("blots").evaluate(board, 1), 0.0)
+        board.__cells__[0] = 0
+        board.__cells__[20] = 0
+        board.__cells__[2] = 1
+        board.refresh_incremental_state()
+        # Two player 1 blots in range of 5 and 9 against the single 9 blot
+        self.assertAlmostEqual(
+            single_feature("blots").evaluate(board, 1), math.tanh(-1)
+        )
+
+    def test_bar_checkers(self):
+        board = make_board({24: 2, 25: 1, 10: 13, 12: -14})
+        self.assertAlmostEqual(single_feature("bar").evaluate(board, 2), math.tanh(1))
+
+    def test_prime_length(self):
+        board = make_board({18: 2, 19: 2, 20: 3, 22: 2, 0: -2, 1: -2})
+        self.assertAlmostEqual(
+            single_feature("points").evaluate(board, 1), math.tanh(2)
+        )
+        self.assertAlmostEqual(single_feature("prime").evaluate(board, 1), math.tanh(1))
+
+    def test_finished_game_scores_exact_result(self):
+        board = make_board({26: 15, 12: 15})
+        self.assertEqual(self.__evaluator__.evaluate(board, 1), 2.0)
+
+    def test_unknown_weight_rejected(self):
+        with self.assertRaises(ValueError):
+            HeuristicEvaluator({"tempo": 1.0})
+
+    def test_weight_override(self):
+        board = make_board({22: 15, 10: -15})
+        evaluator = HeuristicEvaluator({"pips": 0.0})
+        self.assertAlmostEqual(evaluator.evaluate(board, 1), 0.0)
+
+    def test_evaluate_plays_leaves_board_unchanged(self):
+        board = CompactBoard()
+        board.setup_initial_position()
+        before = board.__cells__.tolist()
+        plays = generate_plays(board, 1, (6, 5))
+        scores = self.__evaluator__.evaluate_plays(board, 1, plays)
+        self.assertEqual(len(scores), len(plays))
+        self.assertEqual(board.__cells__.tolist(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
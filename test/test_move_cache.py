@@ -0,0 +1,92 @@
+"""Unit tests for the MoveCache class.
+
+This module validates LRU behavior, hit/miss/eviction counters, and the
+cache integration in BackgammonGame move queries.
+"""
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+import unittest
+from core.backgammon import BackgammonGame
+from core.board import Board
+from core.move_cache import MoveCache
+
+
+class TestMoveCache(unittest.TestCase):
+    """Test suite covering MoveCache."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method.
+
+        Returns:
+            None
+        """
+        self.__board__ = Board()
+        self.__board__.setup_initial_position()
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            MoveCache(0)
+        with self.assertRaises(ValueError):
+            MoveCache().resize(0)
+
+    def test_hit_and_miss_counters(self):
+        cache = MoveCache(8)
+        first = cache.get_possible_moves(self.__board__, 1, [3, 1])
+        second = cache.get_possible_moves(self.__board__, 1, [1, 3])
+        self.assertIs(first, second)
+        self.assertEqual(first, self.__board__.get_possible_moves(1, [3, 1]))
+        stats = cache.get_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_key_includes_side_to_move(self):
+        cache = MoveCache(8)
+        cache.get_possible_moves(self.__board__, 1, [6, 5])
+        cache.get_possible_moves(self.__board__, 2, [6, 5])
+        self.assertEqual(cache.get_stats()["misses"], 2)
+
+    def test_key_follows_position_changes(self):
+        cache = MoveCache(8)
+        cache.get_plays(self.__board__, 1, (3, 1))
+        self.__board__.move_piece(0, 3, 1)
+        plays = cache.get_plays(self.__board__, 1, (3, 1))
+        self.assertEqual(cache.get_stats()["misses"], 2)
+        self.assertIsInstance(plays, tuple)
+
+    def test_lru_eviction(self):
+        cache = MoveCache(2)
+        cache.lookup("a", lambda: 1)
+        cache.lookup("b", lambda: 2)
+        cache.lookup("a", lambda: 0)
+        cache.lookup("c", lambda: 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.lookup("a", lambda: 0), 1)
+        self.assertEqual(cache.lookup("b", lambda: 9), 9)
+        self.assertEqual(cache.get_stats()["evictions"], 2)
+
+    def test_resize_and_clear(self):
+        cache = MoveCache(4)
+        for key in range(4):
+            cache.lookup(key, lambda: None)
+        cache.resize(1)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get_stats()["evictions"], 3)
+        cache.clear()
+        self.assertEqual(cache.get_stats()["size"], 0)
+        self.assertEqual(cache.get_stats()["evictions"], 0)
+
+    def test_game_uses_shared_cache(self):
+        cache = MoveCache(16)
+        game = BackgammonGame(move_cache=cache)
+        game.setup_initial_position()
+        game.__last_roll__ = (3, 1)
+        game.get_legal_plays()
+        game.get_legal_plays()
+        self.assertIs(game.get_move_cache(), cache)
+        self.assertEqual(cache.get_stats()["hits"], 1)
+        self.assertEqual(cache.get_stats()["misses"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""Unit tests for the full-turn legal play generator.
+
+This module validates dice expansion, transposition deduplication, the
+maximum-dice and larger-die rules, and parity between board engines.
+"""
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+import unittest
+from test.helpers import make_board
+from core.backgammon import BackgammonGame
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.move_generator import dice_for_roll, generate_plays, iter_plays
+
+
+class TestMoveGenerator(unittest.TestCase):
+    """Test suite covering generate_plays."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method.
+
+        Returns:
+            None
+        """
+        self.__board__ = CompactBoard()
+        self.__board__.setup_initial_position()
+
+    def test_dice_for_roll(self):
+        self.assertEqual(dice_for_roll((3, 1)), [3, 1])
+        self.assertEqual(dice_for_roll((4, 4)), [4, 4, 4, 4])
+
+    def test_opening_plays_use_both_dice_and_are_distinct(self):
+        plays = generate_plays(self.__board__, 1, (3, 1))
+        self.assertTrue(plays)
+        self.assertTrue(all(len(play) == 2 for play in plays))
+        results = set()
+        for play in plays:
+            tokens = [self.__board__.apply(move, 1) for move in play]
+            results.add(self.__board__.get_zobrist_hash())
+            for token in reversed(tokens):
+                self.__board__.revert(token)
+        self.assertEqual(len(results), len(plays))
+
+    def test_transposed_point_making_play_appears_once(self):
+        plays = generate_plays(self.__board__, 1, (3, 1))
+        making_point = [
+            play
+            for play in plays
+            if sorted(move[:2] for move in play) == [(16, 19), (18, 19)]
+        ]
+        self.assertEqual(len(making_point), 1)
+
+    def test_board_is_left_unchanged(self):
+        before = self.__board__.get_board_state()
+        generate_plays(self.__board__, 2, (6, 6))
+        self.assertEqual(self.__board__.get_board_state(), before)
+
+    def test_doubles_use_four_moves(self):
+        plays = generate_plays(self.__board__, 1, (2, 2))
+        self.assertTrue(all(len(play) == 4 for play in plays))
+
+    def test_must_play_larger_die_when_only_one_fits(self):
+        board = make_board({10: 1, 17: -2, 26: 14, 0: -13})
+        self.assertEqual(generate_plays(board, 1, (2, 5)), [((10, 15, 5),)])
+
+    def test_must_use_both_dice_when_possible(self):
+        # The 5 cannot be played first, but 2 then 5 uses both dice
+        board = make_board({10: 1, 15: -2, 26: 14, 0: -13})
+        self.assertEqual(generate_plays(board, 1, (5, 2)), [((10, 12, 2), (12, 17, 5))])
+
+    def test_no_legal_play(self):
+        board = make_board({24: 1, 0: -2, 1: -2, 2: -2, 3: -2, 4: -2, 5: -2})
+        self.assertEqual(generate_plays(board, 1, (3, 4)), [])
+
+    def test_engines_agree(self):
+        board = Board()
+        board.setup_initial_position()
+        for roll in ((6, 5), (4, 4), (2, 1)):
+            expected = {frozenset(play) for play in generate_plays(board, 2, roll)}
+            actual = {
+                frozenset(play) for play in iter_plays(self.__board__, 2, roll)
+            }
+            self.assertEqual(len(expected), len(actual))
+
+    def test_iter_plays_is_lazy(self):
+        cases = [
+            (self.__board__, 1, (6, 5)),
+            (self.__board__, 2, (3, 3)),
+            (make_board({10: 1, 17: -2, 26: 14, 0: -13}), 1, (2, 5)),
+            (make_board({10: 1, 15: -2, 26: 14, 0: -13}), 1, (5, 2)),
+            (make_board({24: 1, 0: -2, 1: -2, 2: -2, 3: -2, 4: -2, 5: -2}), 1, (3, 4)),
+        ]
+        for board, player, roll in cases:
+            self.assertEqual(
+                list(iter_plays(board, player, roll)),
+                generate_plays(board, player, roll),
+            )
+        before = self.__board__.get_zobrist_hash()
+        plays = iter_plays(self.__board__, 1, (6, 5))
+        next(plays)
+        self.assertNotEqual(self.__board__.get_zobrist_hash(), before)
+        plays.close()
+        self.assertEqual(self.__board__.get_zobrist_hash(), before)
+
+    def test_game_get_legal_plays(self):
+        game = BackgammonGame()
+        game.setup_initial_position()
+        self.assertEqual(game.get_legal_plays(), [])
+        game.__last_roll__ = (6, 5)
+        plays = game.get_legal_plays()
+        self.assertIn(((0, 6, 6), (6, 11, 5)), plays)
+        self.assertTrue(all(len(play) == 2 for play in plays))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""Unit tests for the precomputed move tables.
+
+This module checks the tables against the direction arithmetic they replace.
+"""
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+import unittest
+from core import move_tables
+
+
+class TestMoveTables(unittest.TestCase):
+    """Test suite covering the move lookup tables."""
+
+    def test_destinations_match_direction_arithmetic(self):
+        for point in range(24):
+            for die in move_tables.DIE_VALUES:
+                forward = point + die
+                backward = point - die
+                self.assertEqual(
+                    move_tables.DESTINATIONS[1][point][die],
+                    forward if forward < 24 else None,
+                )
+                self.assertEqual(
+                    move_tables.DESTINATIONS[2][point][die],
+                    backward if backward >= 0 else None,
+                )
+
+    def test_entry_points(self):
+        self.assertEqual(move_tables.ENTRY_POINTS[1][1:], (0, 1, 2, 3, 4, 5))
+        self.assertEqual(move_tables.ENTRY_POINTS[2][1:], (23, 22, 21, 20, 19, 18))
+
+    def test_bear_off_tables(self):
+        self.assertEqual(move_tables.BEAR_OFF_DISTANCE[1][23], 1)
+        self.assertEqual(move_tables.BEAR_OFF_DISTANCE[1][18], 6)
+        self.assertEqual(move_tables.BEAR_OFF_DISTANCE[2][0], 1)
+        self.assertEqual(move_tables.BEAR_OFF_DISTANCE[2][5], 6)
+
+    def test_home_and_outer_points(self):
+        self.assertEqual(move_tables.HOME_POINTS[1], (18, 19, 20, 21, 22, 23))
+        self.assertEqual(move_tables.HOME_POINTS[2], (0, 1, 2, 3, 4, 5))
+        self.assertEqual(len(move_tables.OUTER_POINTS[1]), 18)
+        self.assertNotIn(3, move_tables.OUTER_POINTS[2])
+
+    def test_checked_lookups(self):
+        self.assertEqual(move_tables.destination(1, 0, 6), 6)
+        self.assertIsNone(move_tables.destination(2, 3, 6))
+        self.assertIsNone(move_tables.destination(1, 24, 1))
+        self.assertIsNone(move_tables.destination(1, 0, 7))
+        self.assertEqual(move_tables.entry_point(2, 2), 22)
+        self.assertIsNone(move_tables.entry_point(1, 25))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""Unit tests for the NeuralEvaluator class.
+
+This module validates the 198-unit encoding, batched play evaluation
+against one position at a time, the weights files and the exact results of
+finished games.
+"""
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+import os
+import shutil
+import tempfile
+import unittest
+from test.helpers import cells_of, make_board, mirror
+import numpy as np
+from core.board_batch import BoardBatch
+from core.compact_board import CompactBoard
+from core.evaluator import Evaluator
+from core.move_generator import generate_plays
+from core.neural_evaluator import (
+    INPUT_UNITS,
+    NeuralEvaluator,
+    encode_batch,
+    encode_cells,
+)
+
+
+class TestNeuralEvaluator(unittest.TestCase):
+    """Test suite covering the encoders and NeuralEvaluator."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method.
+
+        Returns:
+            None
+        """
+        self.__board__ = CompactBoard()
+        self.__board__.setup_initial_position()
+        self.__evaluator__ = NeuralEvaluator(seed=7)
+
+    def test_encoding_of_the_initial_position(self):
+        inputs = encode_cells(cells_of(self.__board__), 1)
+        self.assertEqual(inputs.shape, (1, INPUT_UNITS))
+        units = inputs[0]
+        # Two checkers on player 1's first point, five on player 2's 6 point
+        self.assertEqual(units[0:4].tolist(), [1, 1, 0, 0])
+        self.assertEqual(units[96 + 5 * 4 : 96 + 6 * 4].tolist(), [1, 1, 1, 1])
+        self.assertEqual(units[192:198].tolist(), [0, 0, 0, 0, 0, 1])
+        # Points of 2, 5, 3 and 5 checkers give 2 + 4 + 3 + 4 units a side
+        self.assertEqual(units.sum(), 2 * 13 + 1)
+
+    def test_encoding_is_relative_to_the_player(self):
+        board = make_board({0: 4, 3: -1, 24: 1, 25: 2, 26: 10, 27: 12})
+        first = encode_cells(cells_of(board), 1)
+        second = encode_cells(cells_of(mirror(board)), 2)
+        np.testing.assert_array_equal(first, second)
+        self.assertEqual(first[0, 3], 0.5)
+        self.assertEqual(first[0, 192:196].tolist(), [0.5, 1.0, 10 / 15, 12 / 15])
+
+    def test_batch_encoding_mixes_players(self):
+        other = make_board({0: 4, 3: -1, 24: 1, 25: 2, 26: 10, 27: 12})
+        cells = np.stack([cells_of(self.__board__), cells_of(other)])
+        inputs = encode_batch(BoardBatch.from_cells(cells, [2, 1]))
+        np.testing.assert_array_equal(inputs[0], encode_cells(cells[0], 2)[0])
+        np.testing.assert_array_equal(inputs[1], encode_cells(cells[1], 1)[0])
+
+    def test_batch_matches_single_positions(self):
+        plays = generate_plays(self.__board__, 1, (6, 5))
+        batch = self.__evaluator__.evaluate_plays(self.__board__, 1, plays)
+        single = Evaluator.evaluate_plays(self.__evaluator__, self.__board__, 1, plays)
+        np.testing.assert_allclose(batch, single)
+        self.assertEqual(self.__evaluator__.evaluate_plays(self.__board__, 1, []), [])
+
+    def test_equity_range_and_symmetry(self):
+        equity = self.__evaluator__.evaluate(self.__board__, 1)
+        self.assertGreater(equity, Evaluator.MIN_EQUITY)
+        self.assertLess(equity, Evaluator.MAX_EQUITY)
+        self.assertEqual(equity, self.__evaluator__.evaluate(mirror(self.__board__), 2))
+
+    def test_finished_games_score_exactly(self):
+        board = make_board({23: 1, 26: 14, 10: -15})
+        plays = generate_plays(board, 1, (3, 1))
+        self.assertEqual(self.__evaluator__.evaluate_plays(board, 1, plays), [2.0])
+        lost = make_board({26: 15, 27: 1})
+        self.assertEqual(self.__evaluator__.evaluate(lost, 2), -1.0)
+
+    def test_save_and_load(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "weights.npz")
+            self.__evaluator__.save(path)
+            loaded = NeuralEvaluator.load(path)
+        finally:
+            shutil.rmtree(directory)
+        expected = self.__evaluator__.evaluate(self.__board__, 2)
+        self.assertEqual(loaded.evaluate(self.__board__, 2), expected)
+
+    def test_invalid_weights(self):
+        weights = dict(self.__evaluator__.get_weights())
+        del weights["output_bias"]
+        with self.assertRaises(ValueError):
+            NeuralEvaluator(weights)
+        weights["output_bias"] = np.zeros(3)
+        with self.assertRaises(ValueError):
+            NeuralEvaluator(weights)
+        self.assertEqual(
+            NeuralEvaluator(hidden_units=8).get_weights()["hidden_weights"].shape,
+            (INPUT_UNITS, 8),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
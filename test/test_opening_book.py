@@ -0,0 +1,158 @@
+"""Unit tests for the opening book and its builder.
+
+This module validates mirrored positions and plays, the book file, the
+rollout-built entries of the first two plies and their use by the bots.
+"""
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+import os
+import shutil
+import tempfile
+import unittest
+from test.helpers import make_board
+from unittest.mock import patch
+from benchmarks.search_stats import sample_searches
+from core.book_builder import OPENING_ROLLS, BookBuilder
+from core.bot import GreedyBot
+from core.compact_board import CompactBoard
+from core.move_generator import generate_plays
+from core.opening_book import (
+    OpeningBook,
+    as_books,
+    book_key,
+    default_books,
+    mirror_board,
+    mirror_play,
+    write_book,
+)
+from core.rollout import RolloutEngine
+from core.search import ROLLS, ExpectiminimaxSearch
+
+
+class TestOpeningBook(unittest.TestCase):
+    """Test suite covering OpeningBook, BookBuilder and their helpers."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build a small book of the 3-1 opening shared by the tests.
+
+        Returns:
+            None
+        """
+        cls.directory = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.directory, "book.db")
+        engine = RolloutEngine(GreedyBot(), workers=1, variance_reduction=("rotated",))
+        cls.entries = BookBuilder(engine, trials=2, candidates=2).build(((1, 3),))
+        write_book(cls.entries, cls.path)
+        cls.book = OpeningBook(cls.path)
+        cls.initial = CompactBoard()
+        cls.initial.setup_initial_position()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the book file.
+
+        Returns:
+            None
+        """
+        shutil.rmtree(cls.directory)
+
+    def test_opening_rolls(self):
+        self.assertEqual(len(OPENING_ROLLS), 15)
+        self.assertEqual(len(set(OPENING_ROLLS)), 15)
+
+    def test_mirrored_plays_are_legal(self):
+        for board, player, roll in sample_searches(20):
+            twice = mirror_board(mirror_board(board))
+            self.assertEqual(twice.__cells__, board.__cells__)
+            for play in generate_plays(board, player, roll)[:5]:
+                after = board.copy()
+                for move in play:
+                    after.apply(move, player)
+                mirrored = mirror_board(board)
+                for move in mirror_play(play):
+                    mirrored.apply(move, 3 - player)
+                self.assertEqual(mirrored.__cells__, mirror_board(after).__cells__)
+
+    def test_file_round_trip(self):
+        board = make_board({24: 1, 22: 2, 26: 12, 0: -15})
+        play = (("bar", 2, 3), (22, "off", 2))
+        key = book_key(board, 1, (3, 2))
+        path = os.path.join(self.directory, "round_trip.db")
+        self.assertEqual(write_book([(key, play, 0.5, 0.25)], path), 1)
+        book = OpeningBook(path)
+        self.assertEqual(len(book), 1)
+        self.assertEqual(book.get_entry(board, 1, (2, 3)), (play, 0.5, 0.25))
+        self.assertEqual(book.choose_play(board, 1, (3, 2)), play)
+        self.assertIsNone(book.choose_play(board, 2, (3, 2)))
+        self.assertIsNone(book.choose_play(board, 1, (3, 3)))
+
+    def test_built_entries(self):
+        # The 3-1 opening and the 21 replies to it, for either player opening
+        self.assertEqual(len(self.book), 2 * (1 + len(ROLLS)))
+        opening = self.book.choose_play(self.initial, 1, (3, 1))
+        self.assertIn(opening, generate_plays(self.initial, 1, (3, 1)))
+        mirrored = self.book.choose_play(self.initial, 2, (1, 3))
+        self.assertEqual(mirrored, mirror_play(opening))
+        after = self.initial.copy()
+        for move in opening:
+            after.apply(move, 1)
+        for roll, _ in ROLLS:
+            play, equity, std_error = self.book.get_entry(after, 2, roll)
+            self.assertIn(play, generate_plays(after, 2, roll))
+            self.assertLessEqual(abs(equity), 3)
+            self.assertGreaterEqual(std_error, 0)
+        self.assertIsNone(self.book.choose_play(self.initial, 1, (5, 2)))
+
+    def test_bots_play_from_the_book(self):
+        # A legal play no evaluator would choose, to see the book win
+        play = ((0, 3, 3), (0, 1, 1))
+        path = os.path.join(self.directory, "forced.db")
+        write_book([(book_key(self.initial, 1, (3, 1)), play, 0.0, 0.0)], path)
+        book = OpeningBook(path)
+        booked = GreedyBot(book=book).choose_play(self.initial, 1, (1, 3))
+        self.assertEqual(booked, play)
+        unbooked = GreedyBot().choose_play(self.initial, 1, (3, 1))
+        self.assertNotEqual(unbooked, play)
+        search = ExpectiminimaxSearch(book=[book])
+        self.assertEqual(search.choose_play(self.initial, 1, (3, 1)), play)
+        self.assertEqual(search.get_stats()["max_nodes"], 0)
+        self.assertNotEqual(search.choose_play(self.initial, 1, (4, 2)), ())
+        self.assertGreater(search.get_stats()["max_nodes"], 0)
+
+    def test_default_books(self):
+        with patch("core.opening_book.DEFAULT_PATH", self.path):
+            default_books.cache_clear()
+            try:
+                books = default_books()
+            finally:
+                default_books.cache_clear()
+        self.assertEqual([len(book) for book in books], [len(self.book)])
+        # Bots only use the default book when given it
+        self.assertEqual(as_books(None), ())
+        missing = os.path.join(self.directory, "missing.db")
+        with patch("core.opening_book.DEFAULT_PATH", missing):
+            default_books.cache_clear()
+            try:
+                self.assertEqual(default_books(), ())
+            finally:
+                default_books.cache_clear()
+
+    def test_invalid_arguments(self):
+        path = os.path.join(self.directory, "broken.db")
+        with open(path, "wb") as handle:
+            handle.write(b"BGOB")
+        with self.assertRaises(ValueError):
+            OpeningBook(path)
+        with open(self.path, "rb") as source, open(path, "wb") as handle:
+            handle.write(source.read()[:-1])
+        with self.assertRaises(ValueError):
+            OpeningBook(path)
+        with self.assertRaises(ValueError):
+            BookBuilder(trials=0)
+        with self.assertRaises(ValueError):
+            BookBuilder(candidates=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
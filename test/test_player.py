@@ -204,6 +204,11 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(self.__player_white__.__captured_checkers__, 0)
         self.assertEqual(self.__player_white__.__bear_off_count__, 0)
 
+    def test_player_uses_slots(self):
+        self.assertFalse(hasattr(self.__player_white__, "__dict__"))
+        self.assertEqual(self.__player_white__.__name__, "Player1")
+        self.assertEqual(Player.__name__, "Player")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,120 @@
+"""Unit tests for the QuantizedEvaluator class.
+
+This module validates the integer encoding, the quantized weights file and
+the agreement of quantized equities and plays with the float network.
+"""
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from test.helpers import cells_of, make_board
+import numpy as np
+from benchmarks.search_stats import sample_searches
+from core.compact_board import CompactBoard
+from core.move_generator import generate_plays
+from core.neural_evaluator import NeuralEvaluator, encode_cells
+from core.quantized_evaluator import (
+    INPUT_SCALE,
+    QuantizedEvaluator,
+    encode_quantized,
+    quantize,
+    write_quantized,
+)
+
+
+class TestQuantizedEvaluator(unittest.TestCase):
+    """Test suite covering QuantizedEvaluator and its helpers."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Write the quantized weights of a network shared by the tests.
+
+        Returns:
+            None
+        """
+        cls.directory = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.directory, "weights.bin")
+        cls.network = NeuralEvaluator(seed=5)
+        cls.size = write_quantized(cls.network, cls.path)
+        cls.evaluator = QuantizedEvaluator(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Unmap and remove the weights file.
+
+        Returns:
+            None
+        """
+        cls.evaluator.close()
+        shutil.rmtree(cls.directory)
+
+    def test_integer_encoding(self):
+        board = make_board({0: 4, 3: -1, 20: 9, 24: 1, 25: 2, 26: 1, 27: 12})
+        for player in (1, 2):
+            cells = cells_of(board)
+            expected = encode_cells(cells, player) * INPUT_SCALE
+            np.testing.assert_array_equal(encode_quantized(cells, player), expected)
+        samples = np.stack([cells_of(board) for board, _, _ in sample_searches(20)])
+        expected = encode_cells(samples, 2) * INPUT_SCALE
+        np.testing.assert_array_equal(encode_quantized(samples, 2), expected)
+
+    def test_quantized_weights(self):
+        weights = self.network.get_weights()
+        quantized = quantize(weights)
+        for index, name in enumerate(("hidden_weights", "output_weights")):
+            self.assertEqual(quantized[name].dtype, np.int8)
+            self.assertEqual(np.abs(quantized[name]).max(), 127)
+            step = float(quantized["scales"][index])
+            error = np.abs(quantized[name] * step - weights[name]).max()
+            self.assertLessEqual(error, step / 2 + 1e-9)
+        mapped = self.evaluator.get_quantized_weights()
+        for name, array in quantized.items():
+            self.assertEqual(mapped[name].dtype, np.float32)
+            self.assertFalse(mapped[name].flags.writeable)
+            np.testing.assert_array_equal(mapped[name], array)
+        self.assertEqual(self.size, 12 + 4 * (2 + 40 + 5 + 198 * 40 + 40 * 5))
+
+    def test_equities_follow_the_float_network(self):
+        board = CompactBoard()
+        board.setup_initial_position()
+        self.assertAlmostEqual(
+            self.evaluator.evaluate(board, 1), self.network.evaluate(board, 1), 2
+        )
+        for board, player, roll in sample_searches(10):
+            plays = generate_plays(board, player, roll)
+            np.testing.assert_allclose(
+                self.evaluator.evaluate_plays(board, player, plays),
+                self.network.evaluate_plays(board, player, plays),
+                atol=0.02,
+            )
+
+    def test_finished_games_score_exactly(self):
+        lost = make_board({26: 15, 27: 1})
+        self.assertEqual(self.evaluator.evaluate(lost, 2), -1.0)
+
+    def test_pickles_as_path(self):
+        board = CompactBoard()
+        board.setup_initial_position()
+        copy = pickle.loads(pickle.dumps(self.evaluator))
+        self.assertEqual(copy.evaluate(board, 2), self.evaluator.evaluate(board, 2))
+        copy.close()
+
+    def test_invalid_files(self):
+        path = os.path.join(self.directory, "broken.bin")
+        with open(path, "wb") as handle:
+            handle.write(b"BGQN")
+        with self.assertRaises(ValueError):
+            QuantizedEvaluator(path)
+        with open(self.path, "rb") as source, open(path, "wb") as handle:
+            handle.write(source.read()[:-1])
+        with self.assertRaises(ValueError):
+            QuantizedEvaluator(path)
+        with self.assertRaises(ValueError):
+            quantize(NeuralEvaluator(hidden_units=2000).get_weights())
+
+
+if __name__ == "__main__":
+    unittest.main()
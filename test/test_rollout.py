@@ -0,0 +1,146 @@
+"""Unit tests for the Monte Carlo rollout engine.
+
+This module validates the rollout statistics, seeded reproducibility on one
+or several workers, early stopping, the accepted position types and the
+rotated dice and luck variance reductions.
+"""
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+import math
+import unittest
+from test.helpers import make_board
+from core.backgammon import BackgammonGame
+from core.bot import GreedyBot
+from core.compact_board import CompactBoard
+from core.evaluator import HeuristicEvaluator
+from core.rollout import RolloutEngine, play_batch, roll_luck, summarize
+from core.search import ROLLS
+
+# Player 1 bears off two checkers against a lone back checker of player 2
+RACE = {22: 1, 23: 1, 26: 13, 2: -1, 27: 14}
+
+# A few rolls each, with player 1 ahead
+LONG_RACE = {12: 2, 18: 1, 26: 12, 11: -2, 5: -1, 27: 12}
+
+
+class TestRollout(unittest.TestCase):
+    """Test suite covering RolloutEngine and its helpers."""
+
+    def test_summarize(self):
+        stats = summarize([(1, 0.0), (-1, 0.0), (2, 0.0), (1, 0.0)])
+        self.assertEqual(stats["trials"], 4)
+        self.assertAlmostEqual(stats["equity"], 0.75)
+        variance = (2 * 0.25**2 + 1.75**2 + 1.25**2) / 3
+        self.assertAlmostEqual(stats["std_error"], math.sqrt(variance / 4))
+        low, high = stats["confidence_interval"]
+        self.assertAlmostEqual(high - stats["equity"], 1.959964 * stats["std_error"], 5)
+        self.assertAlmostEqual(stats["equity"] - low, high - stats["equity"])
+        self.assertEqual((stats["win"], stats["win_gammon"]), (0.75, 0.25))
+        self.assertEqual((stats["lose_gammon"], stats["win_backgammon"]), (0.0, 0.0))
+
+    def test_single_trial_has_no_spread(self):
+        stats = summarize([(-3, 0.0)])
+        self.assertEqual(stats["std_error"], 0.0)
+        self.assertEqual(stats["lose_backgammon"], 1.0)
+
+    def test_play_batch_counts_every_game(self):
+        board = make_board(RACE)
+        results = play_batch(GreedyBot(), board, 1, (7, 10, 0, ()))
+        self.assertEqual(len(results), 10)
+        self.assertTrue(all(luck == 0.0 for _, luck in results))
+        self.assertEqual(board.__cells__.tolist(), make_board(RACE).__cells__.tolist())
+
+    def test_certain_win(self):
+        board = make_board({23: 1, 26: 14, 0: -15})
+        stats = RolloutEngine(workers=1).rollout(board, trials=20, seed=1)
+        self.assertEqual(stats["outcomes"], {2: 20})
+        self.assertEqual(stats["std_error"], 0.0)
+
+    def test_seeded_rollouts_repeat(self):
+        engine = RolloutEngine(workers=1, batch_size=8)
+        first = engine.rollout(make_board(RACE), trials=30, seed=4)
+        second = engine.rollout(make_board(RACE), trials=30, seed=4)
+        self.assertEqual(first["outcomes"], second["outcomes"])
+        self.assertEqual(first["trials"], 30)
+
+    def test_worker_count_does_not_change_results(self):
+        board = make_board(RACE)
+        single = RolloutEngine(workers=1, batch_size=4).rollout(board, 2, 16, seed=9)
+        pooled = RolloutEngine(workers=2, batch_size=4).rollout(board, 2, 16, seed=9)
+        self.assertEqual(single["outcomes"], pooled["outcomes"])
+
+    def test_early_stop_on_target_std_error(self):
+        engine = RolloutEngine(workers=1, batch_size=16)
+        stats = engine.rollout(
+            make_board(RACE), trials=1000, seed=2, target_std_error=10.0
+        )
+        self.assertTrue(stats["stopped_early"])
+        self.assertEqual(stats["trials"], RolloutEngine.MIN_TRIALS)
+
+    def test_game_player_on_roll(self):
+        game = BackgammonGame()
+        game.setup_initial_position()
+        game.switch_current_player()
+        engine = RolloutEngine(workers=1)
+        from_game = engine.rollout(game, trials=4, seed=3)
+        board = CompactBoard.from_board(game.__board__)
+        from_board = engine.rollout(board, player=2, trials=4, seed=3)
+        self.assertEqual(from_game["outcomes"], from_board["outcomes"])
+
+    def test_summarize_luck_adjusted(self):
+        stats = summarize([(1, 0.5), (-1, -0.5), (2, 1.0)])
+        self.assertAlmostEqual(stats["equity"], 1 / 3)
+        self.assertAlmostEqual(stats["std_error"], math.sqrt(21 / 36 / 3))
+        self.assertEqual(stats["outcomes"], {1: 1, -1: 1, 2: 1})
+        self.assertAlmostEqual(stats["win"], 2 / 3)
+
+    def test_roll_luck_averages_to_zero(self):
+        evaluator = HeuristicEvaluator()
+        board = make_board(LONG_RACE)
+        total = sum(
+            probability * roll_luck(evaluator, board, 1, roll)
+            for roll, probability in ROLLS
+        )
+        self.assertAlmostEqual(total, 0.0)
+        self.assertGreater(roll_luck(evaluator, board, 1, (6, 6)), 0.0)
+        self.assertLess(roll_luck(evaluator, board, 1, (2, 1)), 0.0)
+        self.assertEqual(
+            roll_luck(evaluator, board, 1, (2, 1)),
+            roll_luck(evaluator, board, 1, (1, 2)),
+        )
+        self.assertEqual(
+            board.__cells__.tolist(), make_board(LONG_RACE).__cells__.tolist()
+        )
+
+    def test_rotated_rollouts_repeat(self):
+        engine = RolloutEngine(workers=1, batch_size=8, variance_reduction=("rotated",))
+        first = engine.rollout(make_board(RACE), trials=36, seed=4)
+        second = engine.rollout(make_board(RACE), trials=36, seed=4)
+        self.assertEqual(first["outcomes"], second["outcomes"])
+        self.assertEqual(first["trials"], 36)
+
+    def test_luck_adjustment(self):
+        engine = RolloutEngine(workers=1, variance_reduction=("rotated", "luck"))
+        stats = engine.rollout(make_board(LONG_RACE), trials=72, seed=5)
+        plain = RolloutEngine(workers=1).rollout(make_board(LONG_RACE), 1, 72, 5)
+        self.assertLess(stats["std_error"], plain["std_error"])
+        self.assertAlmostEqual(stats["equity"], plain["equity"], delta=0.5)
+
+    def test_luck_adjustment_keeps_certain_results(self):
+        board = make_board({23: 1, 26: 14, 0: -15})
+        engine = RolloutEngine(workers=1, variance_reduction=("luck",))
+        stats = engine.rollout(board, trials=10, seed=1)
+        self.assertEqual(stats["outcomes"], {2: 10})
+        self.assertAlmostEqual(stats["equity"], 2.0)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            RolloutEngine(workers=0)
+        with self.assertRaises(ValueError):
+            RolloutEngine(variance_reduction=("antithetic",))
+        with self.assertRaises(ValueError):
+            RolloutEngine(workers=1).rollout(make_board(RACE), trials=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
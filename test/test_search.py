@@ -0,0 +1,190 @@
+"""Unit tests for the expectiminimax search.
+
+This module validates the roll distribution, agreement of the pruned search
+with plain expectiminimax, and the search statistics.
+"""
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+import unittest
+from test.helpers import make_board
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.evaluator import HeuristicEvaluator, terminal_equity
+from core.move_generator import generate_plays
+from core.search import ROLLS, ExpectiminimaxSearch
+from core.transposition_table import EXACT
+
+
+def expectiminimax(evaluator, board, player, plies):
+    """Compute the equity of a chance node without any pruning.
+
+    Args:
+        evaluator (Evaluator): Leaf evaluator
+        board: CompactBoard with the opponent of player on roll
+        player (int): Player number (1 or 2) who made the last play
+        plies (int): Plies left
+
+    Returns:
+        float: Equity for player
+    """
+    exact = terminal_equity(board, player)
+    if exact is not None:
+        return exact
+    if plies == 0:
+        return evaluator.evaluate(board, player)
+    opponent = 3 - player
+    total = 0.0
+    for roll, probability in ROLLS:
+        plays = generate_plays(board, opponent, roll)
+        if plays:
+            best = max(
+                play_value(evaluator, board, opponent, play, plies) for play in plays
+            )
+        else:
+            best = expectiminimax(evaluator, board, opponent, plies - 1)
+        total -= probability * best
+    return total
+
+
+def play_value(evaluator, board, player, play, plies):
+    """Compute the equity after a play without any pruning.
+
+    Args:
+        evaluator (Evaluator): Leaf evaluator
+        board: CompactBoard before the play
+        player (int): Player number (1 or 2) making the play
+        play (tuple): The play as (from, to, die) moves
+        plies (int): Plies left including this play
+
+    Returns:
+        float: Equity for player
+    """
+    tokens = [board.apply(move, player) for move in play]
+    value = expectiminimax(evaluator, board, player, plies - 1)
+    for token in reversed(tokens):
+        board.revert(token)
+    return value
+
+
+# Bear-offs with two checkers left a side, where unpruned trees stay small
+ENDGAMES = (
+    {18: 1, 23: 1, 26: 13, 2: -1, 4: -1, 27: 13},
+    {19: 2, 26: 13, 0: -1, 5: -2, 27: 12},
+    {20: 1, 26: 14, 1: -1, 3: -1, 27: 13},
+)
+
+
+class TestExpectiminimaxSearch(unittest.TestCase):
+    """Test suite covering ExpectiminimaxSearch."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method.
+
+        Returns:
+            None
+        """
+        self.__evaluator__ = HeuristicEvaluator()
+        self.__search__ = ExpectiminimaxSearch(self.__evaluator__)
+
+    def test_rolls_cover_all_dice(self):
+        self.assertEqual(len(ROLLS), 21)
+        self.assertAlmostEqual(sum(probability for _, probability in ROLLS), 1.0)
+        self.assertAlmostEqual(dict(ROLLS)[(3, 3)], 1 / 36)
+        self.assertAlmostEqual(dict(ROLLS)[(2, 5)], 2 / 36)
+
+    def test_invalid_depth(self):
+        with self.assertRaises(ValueError):
+            ExpectiminimaxSearch(plies=0)
+
+    def test_one_ply_matches_greedy_choice(self):
+        board = CompactBoard()
+        board.setup_initial_position()
+        plays = generate_plays(board, 1, (3, 1))
+        scores = self.__evaluator__.evaluate_plays(board, 1, plays)
+        play, equity = self.__search__.search(board, 1, (3, 1), plies=1)
+        self.assertAlmostEqual(equity, max(scores))
+        self.assertEqual(play, plays[scores.index(max(scores))])
+
+    def test_pruned_search_matches_expectiminimax(self):
+        for cells, plies in zip(ENDGAMES + ENDGAMES[-1:], (2, 2, 2, 3)):
+            with self.subTest(cells=cells, plies=plies):
+                board = make_board(cells)
+                expected = expectiminimax(self.__evaluator__, board, 2, plies)
+                self.assertAlmostEqual(
+                    self.__search__.evaluate_position(board, 2, plies), expected
+                )
+                plays = generate_plays(board, 1, (4, 2))
+                best = max(
+                    play_value(self.__evaluator__, board, 1, play, plies)
+                    for play in plays
+                )
+                play, equity = self.__search__.search(board, 1, (4, 2), plies)
+                self.assertAlmostEqual(equity, best)
+                self.assertAlmostEqual(
+                    play_value(self.__evaluator__, board, 1, play, plies), best
+                )
+
+    def test_search_leaves_board_unchanged(self):
+        board = make_board(ENDGAMES[0])
+        before = board.__cells__.tolist()
+        self.__search__.search(board, 1, (6, 6), plies=3)
+        self.assertEqual(board.__cells__.tolist(), before)
+        self.assertEqual(
+            board.get_zobrist_hash(), make_board(ENDGAMES[0]).get_zobrist_hash()
+        )
+
+    def test_no_legal_play(self):
+        board = make_board(
+            {24: 1, 23: 14, 0: -2, 1: -2, 2: -2, 3: -2, 4: -2, 5: -2, 6: -3}
+        )
+        play, _ = self.__search__.search(board, 1, (6, 5))
+        self.assertEqual(play, ())
+
+    def test_leaves_reuse_deeper_exact_entries(self):
+        board = make_board(ENDGAMES[1])
+        table = self.__search__.get_transposition_table()
+        for roll, _ in ROLLS:
+            for play in generate_plays(board, 1, roll):
+                after = board.copy()
+                for move in play:
+                    after.apply(move, 1)
+                equity = self.__evaluator__.evaluate(after, 1)
+                table.store(after.get_zobrist_hash(2), 2, 2, equity, EXACT)
+        self.assertAlmostEqual(
+            self.__search__.evaluate_position(board, 2, 1),
+            expectiminimax(self.__evaluator__, board, 2, 1),
+        )
+        self.assertEqual(self.__search__.get_stats()["evaluations"], 0)
+
+    def test_zero_ply_evaluations_are_stored_exact(self):
+        # Player 1 cannot enter, so every roll evaluates the position as is
+        board = make_board(
+            {24: 1, 23: 14, 0: -2, 1: -2, 2: -2, 3: -2, 4: -2, 5: -2, 6: -3}
+        )
+        self.__search__.evaluate_position(board, 2, 1)
+        table = self.__search__.get_transposition_table()
+        entry = table.lookup(board.get_zobrist_hash(2), 2)
+        self.assertEqual(entry[1:], (0, EXACT))
+        self.assertAlmostEqual(entry[0], self.__evaluator__.evaluate(board, 1))
+
+    def test_stats_report_pruning(self):
+        board = CompactBoard()
+        board.setup_initial_position()
+        self.__search__.search(board, 1, (6, 5))
+        stats = self.__search__.get_stats()
+        self.assertGreater(stats["nodes"], 0)
+        self.assertGreater(stats["nodes_per_second"], 0)
+        self.assertGreater(stats["rolls_pruned"], 0)
+        self.assertGreater(stats["prune_rate"], 0.0)
+        self.__search__.reset_stats()
+        self.assertEqual(self.__search__.get_stats()["nodes"], 0)
+
+    def test_choose_play_on_list_board(self):
+        board = Board()
+        board.setup_initial_position()
+        play = self.__search__.choose_play(board, 2, (2, 1))
+        self.assertIn(play, generate_plays(board, 2, (2, 1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+"""Unit tests for the TD(lambda) self-play trainer.
+
+This module validates the recorded games, the vectorized TD(lambda) update
+against finite differences, reproducibility on one or several workers and
+resuming from checkpoints.
+"""
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+import os
+import shutil
+import tempfile
+import unittest
+from test.helpers import make_board
+import numpy as np
+from core.evaluator import game_result
+from core.neural_evaluator import WEIGHT_NAMES, NeuralEvaluator, encode_cells
+from core.training import (
+    TDTrainer,
+    benchmark,
+    play_training_game,
+    swap_sides,
+    td_update,
+)
+
+
+def naive_traces(errors, trace_decay):
+    """Sum the decayed TD errors one position at a time, swapping sides
+    at every turn.
+
+    Args:
+        errors (numpy.ndarray): (T, OUTPUT_UNITS) TD errors
+        trace_decay (float): Lambda
+
+    Returns:
+        numpy.ndarray: Row k holds the errors from k on, decayed by
+            distance, seen by the player of position k
+    """
+    traces = np.zeros_like(errors)
+    running = np.zeros(errors.shape[1])
+    for step in reversed(range(len(errors))):
+        swapped = np.array([-running[0], *running[[3, 4, 1, 2]]])
+        running = errors[step] + trace_decay * swapped
+        traces[step] = running
+    return traces
+
+
+def naive_errors(evaluator, game):
+    """Compute the TD errors of a recorded game one position at a time.
+
+    Args:
+        evaluator (NeuralEvaluator): Evaluator the game is scored with
+        game (tuple): (cells, players, result) from play_training_game
+
+    Returns:
+        tuple: (inputs, errors): the encoded positions before the last and
+            the change of the outputs to the next position, seen by the
+            player of each position
+    """
+    cells, players, (_, points) = game
+    inputs = np.vstack(
+        [encode_cells(row, player) for row, player in zip(cells, players)]
+    )[:-1]
+    outputs = evaluator.forward(inputs)
+    final = np.array([[1.0, points >= 2, points >= 3, 0.0, 0.0]])
+    return inputs, swap_sides(np.vstack((outputs[1:], final))) - outputs
+
+
+class TestTraining(unittest.TestCase):
+    """Test suite covering TDTrainer and its helpers."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method.
+
+        Returns:
+            None
+        """
+        self.__evaluator__ = NeuralEvaluator(hidden_units=6, seed=3)
+        self.__game__ = play_training_game(self.__evaluator__, seed=11)
+
+    def test_recorded_game(self):
+        cells, players, result = self.__game__
+        self.assertEqual(len(cells), len(players))
+        self.assertTrue((players[1:] != players[:-1]).all())
+        final = make_board(dict(enumerate(cells[-1].tolist())))
+        self.assertEqual(game_result(final), result)
+        self.assertEqual(result[0], players[-1])
+        self.assertIsNone(game_result(make_board(dict(enumerate(cells[-2].tolist())))))
+        again = play_training_game(self.__evaluator__, seed=11)
+        np.testing.assert_array_equal(again[0], cells)
+        self.assertIsNone(play_training_game(self.__evaluator__, seed=11, max_turns=3))
+
+    def test_swap_sides(self):
+        outputs = np.array([[0.75, 0.25, 0.125, 0.1, 0.05]])
+        self.assertEqual(swap_sides(outputs).tolist(), [[0.25, 0.1, 0.05, 0.25, 0.125]])
+        np.testing.assert_array_equal(swap_sides(swap_sides(outputs)), outputs)
+
+    def test_update_matches_finite_differences(self):
+        evaluator = self.__evaluator__
+        inputs, errors = naive_errors(evaluator, self.__game__)
+        traces = naive_traces(errors, 0.6)
+
+        # The update ascends sum(traces * outputs) with the traces held fixed
+        before = {name: array.copy() for name, array in evaluator.get_weights().items()}
+        td_error = td_update(evaluator, self.__game__, 0.01, 0.6)
+        self.assertAlmostEqual(td_error, np.abs(errors).mean())
+        for name, index in (("hidden_weights", (30, 2)), ("output_bias", (1,))):
+            weights = {key: array.copy() for key, array in before.items()}
+            values = []
+            for step in (1e-6, -1e-6):
+                weights[name][index] = before[name][index] + step
+                values.append((NeuralEvaluator(weights).forward(inputs) * traces).sum())
+            gradient = (values[0] - values[1]) / 2e-6
+            change = evaluator.get_weights()[name][index] - before[name][index]
+            self.assertAlmostEqual(change, 0.01 * gradient, 7)
+
+    def test_training_changes_weights_and_records_history(self):
+        trainer = TDTrainer(self.__evaluator__, workers=1, seed=5)
+        before = self.__evaluator__.get_weights()["output_bias"].copy()
+        history = trainer.train(3, benchmark_games=2)
+        self.assertEqual(trainer.get_games(), 3)
+        self.assertEqual(len(history), 1)
+        self.assertEqual(history[0]["games"], 3)
+        self.assertGreater(history[0]["games_per_hour"], 0)
+        self.assertGreater(history[0]["td_error"], 0)
+        self.assertLessEqual(abs(history[0]["benchmark"]), 3)
+        changed = trainer.get_evaluator().get_weights()["output_bias"]
+        self.assertFalse(np.array_equal(changed, before))
+
+    def test_worker_count_does_not_change_weights(self):
+        single = TDTrainer(NeuralEvaluator(hidden_units=6, seed=1), workers=1)
+        pooled = TDTrainer(NeuralEvaluator(hidden_units=6, seed=1), workers=2)
+        single.train(3)
+        pooled.train(3)
+        for name in WEIGHT_NAMES:
+            np.testing.assert_array_equal(
+                single.get_evaluator().get_weights()[name],
+                pooled.get_evaluator().get_weights()[name],
+            )
+
+    def test_resume_from_checkpoint(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "checkpoint.npz")
+            straight = TDTrainer(NeuralEvaluator(hidden_units=6, seed=2), 1, seed=4)
+            straight.train(2)
+            straight.train(2)
+
+            first = TDTrainer(NeuralEvaluator(hidden_units=6, seed=2), 1, seed=4)
+            first.train(2, checkpoint=path)
+            resumed = TDTrainer.resume(path, workers=1)
+            self.assertEqual(resumed.get_games(), 2)
+            np.testing.assert_equal(resumed.get_history(), first.get_history())
+            resumed.train(2, checkpoint=path)
+            loaded = NeuralEvaluator.load(path)
+        finally:
+            shutil.rmtree(directory)
+        self.assertEqual(len(resumed.get_history()), 2)
+        for name in WEIGHT_NAMES:
+            expected = straight.get_evaluator().get_weights()[name]
+            trained = resumed.get_evaluator().get_weights()[name]
+            np.testing.assert_array_equal(trained, expected)
+            np.testing.assert_array_equal(loaded.get_weights()[name], expected)
+
+    def test_benchmark(self):
+        self.assertEqual(benchmark(self.__evaluator__, games=0), 0.0)
+        score = benchmark(self.__evaluator__, games=2, seed=1)
+        self.assertEqual(score, benchmark(self.__evaluator__, games=2, seed=1))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            TDTrainer(workers=0)
+        with self.assertRaises(ValueError):
+            TDTrainer(trace_decay=1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
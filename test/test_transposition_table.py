@@ -0,0 +1,122 @@
+"""Unit tests for the TranspositionTable class.
+
+This module validates lookups, the depth-preferred/always-replace buckets,
+the memory cap and the statistics, and the table's use by the search.
+"""
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+import unittest
+from core.compact_board import CompactBoard
+from core.search import ExpectiminimaxSearch
+from core.transposition_table import (
+    ENTRY_BYTES,
+    EXACT,
+    LOWER_BOUND,
+    UPPER_BOUND,
+    TranspositionTable,
+)
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """Test suite covering TranspositionTable."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method.
+
+        Returns:
+            None
+        """
+        self.__table__ = TranspositionTable(size_mb=0.01)
+        self.__buckets__ = self.__table__.get_stats()["capacity"] // 2
+
+    def test_lookup_and_store(self):
+        self.assertIsNone(self.__table__.lookup(0x1234, 1))
+        self.__table__.store(0x1234, 1, 2, 0.25, LOWER_BOUND)
+        self.assertEqual(self.__table__.lookup(0x1234, 1), (0.25, 2, LOWER_BOUND))
+        self.assertEqual(len(self.__table__), 1)
+
+    def test_side_to_move_must_match(self):
+        self.__table__.store(0x1234, 1, 1, 0.5)
+        self.assertIsNone(self.__table__.lookup(0x1234, 2))
+        self.assertEqual(self.__table__.lookup(0x1234, 1)[0], 0.5)
+
+    def test_full_64_bit_keys(self):
+        key = (1 << 64) - 1
+        self.__table__.store(key, 2, 0, 1.0, EXACT)
+        self.assertEqual(self.__table__.lookup(key, 2), (1.0, 0, EXACT))
+
+    def test_same_position_keeps_deeper_result(self):
+        self.__table__.store(7, 1, 3, 0.1)
+        self.__table__.store(7, 1, 1, 0.9)
+        self.assertEqual(self.__table__.lookup(7, 1), (0.1, 3, EXACT))
+        self.__table__.store(7, 1, 4, 0.2, UPPER_BOUND)
+        self.assertEqual(self.__table__.lookup(7, 1), (0.2, 4, UPPER_BOUND))
+        self.assertEqual(len(self.__table__), 1)
+
+    def test_bound_does_not_replace_exact_result_of_same_depth(self):
+        self.__table__.store(7, 1, 2, 0.1)
+        self.__table__.store(7, 1, 2, 0.5, LOWER_BOUND)
+        self.__table__.store(7, 1, 2, -0.5, UPPER_BOUND)
+        self.assertEqual(self.__table__.lookup(7, 1), (0.1, 2, EXACT))
+        self.__table__.store(7, 1, 2, 0.3)
+        self.assertEqual(self.__table__.lookup(7, 1), (0.3, 2, EXACT))
+
+    def test_bound_is_replaced_by_any_result_of_same_depth(self):
+        self.__table__.store(7, 1, 2, 0.5, LOWER_BOUND)
+        self.__table__.store(7, 1, 2, -0.5, UPPER_BOUND)
+        self.assertEqual(self.__table__.lookup(7, 1), (-0.5, 2, UPPER_BOUND))
+        self.__table__.store(7, 1, 2, 0.1)
+        self.assertEqual(self.__table__.lookup(7, 1), (0.1, 2, EXACT))
+
+    def test_depth_preferred_and_always_replace_slots(self):
+        deep, shallow, newer = 5, 5 + self.__buckets__, 5 + 2 * self.__buckets__
+        self.__table__.store(deep, 1, 3, 0.3)
+        self.__table__.store(shallow, 1, 1, 0.1)
+        self.assertEqual(self.__table__.lookup(deep, 1)[1], 3)
+        self.assertEqual(self.__table__.lookup(shallow, 1)[1], 1)
+
+        # A shallow result replaces the always-replace slot only
+        self.__table__.store(newer, 1, 0, 0.0)
+        self.assertIsNotNone(self.__table__.lookup(deep, 1))
+        self.assertIsNone(self.__table__.lookup(shallow, 1))
+
+        # A result as deep takes over the depth-preferred slot
+        self.__table__.store(shallow, 1, 3, 0.4)
+        self.assertIsNone(self.__table__.lookup(deep, 1))
+        self.assertEqual(self.__table__.get_stats()["overwrites"], 2)
+
+    def test_memory_cap(self):
+        stats = TranspositionTable(size_mb=1).get_stats()
+        self.assertLessEqual(stats["size_mb"], 1)
+        self.assertGreater(
+            stats["capacity"] * ENTRY_BYTES, 1024 * 1024 - 2 * ENTRY_BYTES
+        )
+        with self.assertRaises(ValueError):
+            TranspositionTable(size_mb=0)
+
+    def test_stats_and_clear(self):
+        self.__table__.store(1, 1, 0, 0.0)
+        self.__table__.lookup(1, 1)
+        self.__table__.lookup(2, 1)
+        stats = self.__table__.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["stores"]), (1, 1, 1))
+        self.assertAlmostEqual(stats["hit_rate"], 0.5)
+        self.__table__.clear()
+        self.assertEqual(len(self.__table__), 0)
+        self.assertIsNone(self.__table__.lookup(1, 1))
+        self.assertEqual(self.__table__.get_stats()["hits"], 0)
+
+    def test_search_reuses_results(self):
+        board = CompactBoard()
+        board.setup_initial_position()
+        search = ExpectiminimaxSearch(transposition_table=self.__table__)
+        self.assertIs(search.get_transposition_table(), self.__table__)
+        first = search.search(board, 1, (4, 2))
+        evaluations = search.get_stats()["evaluations"]
+        self.assertEqual(search.search(board, 1, (4, 2)), first)
+        self.assertGreater(self.__table__.get_stats()["hits"], 0)
+        self.assertLess(search.get_stats()["evaluations"], 2 * evaluations)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""Unit tests for Zobrist position hashing.
+
+This module validates that Board and CompactBoard keep their incremental
+position hash equal to a from-scratch recomputation, and that
+BackgammonGame exposes it together with the side to move.
+"""
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+# pylint: disable=duplicate-code  # random-play loop shared with engine parity tests
+import random
+import unittest
+from core import zobrist
+from core.backgammon import BackgammonGame
+from core.board import Board
+from core.compact_board import CompactBoard
+
+
+class TestZobrist(unittest.TestCase):
+    """Test suite covering Zobrist hashing on boards and games."""
+
+    def test_empty_board_hashes_to_zero(self):
+        self.assertEqual(Board().get_zobrist_hash(), 0)
+        self.assertEqual(CompactBoard().get_zobrist_hash(), 0)
+
+    def test_initial_position_hash_matches_across_engines(self):
+        board = Board()
+        board.setup_initial_position()
+        compact = CompactBoard()
+        compact.setup_initial_position()
+        self.assertNotEqual(board.get_zobrist_hash(), 0)
+        self.assertEqual(board.get_zobrist_hash(), compact.get_zobrist_hash())
+
+    def test_side_to_move_changes_key(self):
+        board = Board()
+        board.setup_initial_position()
+        self.assertEqual(board.get_zobrist_hash(1), board.get_zobrist_hash())
+        self.assertEqual(
+            board.get_zobrist_hash(2),
+            board.get_zobrist_hash() ^ zobrist.SIDE_TO_MOVE_KEY,
+        )
+
+    def test_transposed_moves_give_same_hash(self):
+        first = Board()
+        first.setup_initial_position()
+        second = first.copy()
+        first.move_piece(0, 3, 1)
+        first.move_piece(16, 20, 1)
+        second.move_piece(16, 20, 1)
+        second.move_piece(0, 3, 1)
+        self.assertEqual(first.get_zobrist_hash(), second.get_zobrist_hash())
+
+    def test_refresh_after_direct_edit(self):
+        board = Board()
+        board.__points__[20] = [1, 1]
+        board.refresh_incremental_state()
+        expected = zobrist.POINT_KEYS[20][0][2]
+        self.assertEqual(board.get_zobrist_hash(), expected)
+
+    def test_incremental_hash_matches_recompute_during_random_play(self):
+        rng = random.Random(11)
+        board = Board()
+        board.setup_initial_position()
+        compact = CompactBoard.from_board(board)
+        player = 1
+        for _ in range(300):
+            dice = [rng.randint(1, 6), rng.randint(1, 6)]
+            moves = board.get_possible_moves(player, dice)
+            if moves:
+                move = rng.choice(moves)
+                for engine in (board, compact):
+                    if move["from"] == "bar":
+                        engine.enter_from_bar(move["to"], player)
+                    elif move["to"] == "off":
+                        engine.bear_off_piece(move["from"], player)
+                    else:
+                        engine.move_piece(move["from"], move["to"], player)
+            expected = zobrist.hash_board_state(board.get_board_state())
+            self.assertEqual(board.get_zobrist_hash(), expected)
+            self.assertEqual(compact.get_zobrist_hash(), expected)
+            if board.is_game_over():
+                break
+            player = 2 if player == 1 else 1
+
+    def test_game_position_key_includes_side_to_move(self):
+        game = BackgammonGame()
+        game.setup_initial_position()
+        key_player1 = game.get_position_key()
+        game.switch_current_player()
+        self.assertEqual(
+            game.get_position_key(), key_player1 ^ zobrist.SIDE_TO_MOVE_KEY
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()